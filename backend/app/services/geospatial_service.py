@@ -17,18 +17,8 @@ class TurbineGeo:
 
 
 def _latest_scada_snapshot(plant: PlantData) -> pd.DataFrame:
-    scada = plant.scada.copy()
-    if "time" in scada.columns:
-        t = pd.to_datetime(scada["time"])
-        latest = t.max()
-        return scada.loc[t == latest]
-    if isinstance(scada.index, pd.MultiIndex) and "time" in scada.index.names:
-        t = pd.to_datetime(scada.index.get_level_values("time"))
-        latest = t.max()
-        return scada.loc[t == latest]
-    t = pd.to_datetime(scada.index)
-    latest = t.max()
-    return scada.loc[t == latest]
+    latest = plant.time_range()[1]
+    return plant.select(start=latest, end=latest)
 
 
 def get_turbine_geospatial_points(plant: PlantData) -> list[TurbineGeo]:
@@ -31,39 +31,16 @@ def _parse_range(range_str: TimeRange) -> timedelta:
     raise ValueError(f"Unsupported range: {range_str}")
 
 
-def _latest_timestamp(scada: pd.DataFrame) -> datetime:
-    # PlantData SCADA is usually indexed; tolerate either case.
-    if "time" in scada.columns:
-        ts = pd.to_datetime(scada["time"]).max()
-    else:
-        idx = scada.index
-        if isinstance(idx, pd.MultiIndex) and "time" in idx.names:
-            ts = pd.to_datetime(idx.get_level_values("time")).max()
-        else:
-            ts = pd.to_datetime(idx).max()
-    return ts.to_pydatetime()
-
-
-def _filter_scada_by_window(scada: pd.DataFrame, end: datetime, window: timedelta) -> pd.DataFrame:
-    start = end - window
-    if "time" in scada.columns:
-        t = pd.to_datetime(scada["time"])
-        return scada.loc[(t >= start) & (t <= end)]
-
-    idx = scada.index
-    if isinstance(idx, pd.MultiIndex) and "time" in idx.names:
-        t = pd.to_datetime(idx.get_level_values("time"))
-        return scada.loc[(t >= start) & (t <= end)]
-
-    t = pd.to_datetime(idx)
-    return scada.loc[(t >= start) & (t <= end)]
+def _filter_scada_by_window(plant: PlantData, end: datetime, window: timedelta) -> pd.DataFrame:
+    # Binary search of the (cached) time-sorted SCADA index instead of masking every timestamp
+    return plant.select(start=end - window, end=end)
 
 
 def compute_metrics_summary(plant: PlantData, range_str: TimeRange = "24h") -> MetricsSummary:
-    scada = plant.scada.copy()
-    end = _latest_timestamp(scada)
+    # Latest timestamp from the (cached) time-sorted SCADA index instead of parsing every timestamp
+    end = plant.time_range()[1].to_pydatetime()
     window = _parse_range(range_str)
-    scada_w = _filter_scada_by_window(scada, end=end, window=window)
+    scada_w = _filter_scada_by_window(plant, end=end, window=window)
 
     # Power output (instantaneous): mean of latest timestamp across turbines, MW
     power_kw_col = "WTUR_W"
@@ -71,20 +48,7 @@ def compute_metrics_summary(plant: PlantData, range_str: TimeRange = "24h") -> M
     temp_c_col = "WMET_EnvTmp"
 
     # Use most recent 10-min interval in window
-    if isinstance(scada_w.index, pd.MultiIndex) and "time" in scada_w.index.names:
-        times = pd.to_datetime(scada_w.index.get_level_values("time"))
-        latest_t = times.max()
-        latest = scada_w.loc[times == latest_t]
-    else:
-        # fallback: try time column or index equality
-        if "time" in scada_w.columns:
-            times = pd.to_datetime(scada_w["time"])
-            latest_t = times.max()
-            latest = scada_w.loc[times == latest_t]
-        else:
-            times = pd.to_datetime(scada_w.index)
-            latest_t = times.max()
-            latest = scada_w.loc[times == latest_t]
+    latest = plant.select(start=end, end=end)
 
     power_output_mw = float(np.nanmean(latest[power_kw_col].to_numpy()) / 1000.0) if power_kw_col in latest.columns else 0.0
 
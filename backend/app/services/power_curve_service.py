@@ -28,27 +28,16 @@ def _parse_range(range_str: TimeRange) -> timedelta:
     raise ValueError(f"Unsupported range: {range_str}")
 
 
-def _get_time_series(df: pd.DataFrame) -> pd.Series:
-    if "time" in df.columns:
-        return pd.to_datetime(df["time"])
-    if isinstance(df.index, pd.MultiIndex) and "time" in df.index.names:
-        return pd.to_datetime(df.index.get_level_values("time"))
-    return pd.to_datetime(df.index)
-
-
 def build_power_curve(
     plant: PlantData,
     range_str: TimeRange = "30d",
     max_scatter_points: int = 2500,
     curve_step_ms: float = 0.25,
 ) -> PowerCurveData:
-    scada = plant.scada.copy()
-    t = _get_time_series(scada)
-    end = t.max().to_pydatetime()
+    end = plant.time_range()[1].to_pydatetime()
     window = _parse_range(range_str)
     start = end - window
-    mask = (t >= start) & (t <= end)
-    df = scada.loc[mask]
+    df = plant.select(start=start, end=end)
 
     ws = pd.to_numeric(df.get("WMET_HorWdSpd"), errors="coerce")
     p = pd.to_numeric(df.get("WTUR_W"), errors="coerce")
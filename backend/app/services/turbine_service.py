@@ -25,19 +25,9 @@ def _get_asset_id_series(df: pd.DataFrame) -> pd.Series | None:
     return None
 
 
-def _get_time_series(df: pd.DataFrame) -> pd.Series:
-    if "time" in df.columns:
-        return pd.to_datetime(df["time"])
-    if isinstance(df.index, pd.MultiIndex) and "time" in df.index.names:
-        return pd.to_datetime(df.index.get_level_values("time"))
-    return pd.to_datetime(df.index)
-
-
 def compute_turbine_health(plant: PlantData, limit: int = 50, offset: int = 0) -> tuple[list[TurbineHealth], int]:
-    scada = plant.scada.copy()
-    t = _get_time_series(scada)
-    latest_t = t.max()
-    scada_latest = scada.loc[t == latest_t]
+    latest_t = plant.time_range()[1]
+    scada_latest = plant.select(start=latest_t, end=latest_t)
 
     asset_ids = _get_asset_id_series(scada_latest)
     if asset_ids is None:
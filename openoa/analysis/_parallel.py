@@ -0,0 +1,291 @@
+"""
+Provides the shared machinery for the random streams of the Monte Carlo analyses, and for running
+their independent iterations across a pool of worker processes.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Union, Sequence
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import attrs
+import numpy as np
+from tqdm import tqdm
+from attrs import field, define
+
+# The analysis object of each worker process, which is shipped once when the worker is started
+_worker_analysis = None
+
+RandomSeed = Union[int, np.random.SeedSequence, np.random.Generator, None]
+
+
+@define(auto_attribs=True)
+class RandomSampler:
+    """Draws the random samples of the Monte Carlo analyses. Samples are drawn from
+    :py:attr:`generator` when it is provided, and otherwise from NumPy's and Python's global random
+    states in the same way as the analyses have always drawn them, so the legacy results of a run
+    seeded with ``np.random.seed`` and ``random.seed`` are unchanged.
+
+    Args:
+        generator(:obj:`numpy.random.Generator` | :obj:`None`): The random number generator to draw
+            samples from, or ``None`` to use the global random states. Defaults to None.
+    """
+
+    generator: np.random.Generator | None = field(
+        default=None, validator=attrs.validators.instance_of((np.random.Generator, type(None)))
+    )
+
+    def normal(self, loc: float, scale: float, size: int) -> np.ndarray:
+        """Draws normally distributed samples, see :py:func:`numpy.random.normal`."""
+        if self.generator is None:
+            return np.random.normal(loc, scale, size)
+        return self.generator.normal(loc, scale, size)
+
+    def integers(self, low: int, high: int, size: int) -> np.ndarray:
+        """Draws integers from the half-open interval [low, high), see
+        :py:func:`numpy.random.randint`.
+        """
+        if self.generator is None:
+            return np.random.randint(low, high, size)
+        return self.generator.integers(low, high, size)
+
+    def bootstrap(self, n: int) -> np.ndarray:
+        """Draws the indices of a bootstrap sample with replacement of ``n`` data points, matching
+        the draws of :py:meth:`pandas.DataFrame.sample` with ``frac=1.0`` and ``replace=True``.
+        """
+        if self.generator is None:
+            return np.random.choice(n, size=n, replace=True)
+        return self.generator.choice(n, size=n, replace=True)
+
+    def multinomial(self, n: int, pvals: np.ndarray) -> np.ndarray:
+        """Draws the number of ``n`` trials in each category with the probabilities
+        :py:attr:`pvals`, see :py:func:`numpy.random.multinomial`.
+        """
+        if self.generator is None:
+            return np.random.multinomial(n, pvals)
+        return self.generator.multinomial(n, pvals)
+
+    def sample(self, population: Sequence, k: int) -> list:
+        """Draws ``k`` unique elements of :py:attr:`population`, see :py:func:`random.sample`."""
+        if self.generator is None:
+            return random.sample(population, k)
+        return [population[i] for i in self.generator.choice(len(population), k, replace=False)]
+
+    def choices(self, population: Sequence, k: int) -> list:
+        """Draws ``k`` elements of :py:attr:`population` with replacement, see
+        :py:func:`random.choices`.
+        """
+        if self.generator is None:
+            return random.choices(population, k=k)
+        return [population[i] for i in self.generator.integers(0, len(population), k)]
+
+
+def _child_seed(seed: np.random.SeedSequence, i: int) -> np.random.SeedSequence:
+    """Creates the :py:attr:`i`-th child of :py:attr:`seed` without changing the spawn counter of
+    :py:attr:`seed`, so the same children are created each time.
+    """
+    return np.random.SeedSequence(
+        seed.entropy, spawn_key=(*seed.spawn_key, i), pool_size=seed.pool_size
+    )
+
+
+def spawn_iteration_seeds(
+    num_sim: int, seed: np.random.SeedSequence | None = None
+) -> list[np.random.SeedSequence]:
+    """Creates an independent random seed for each Monte Carlo iteration.
+
+    Args:
+        num_sim(:obj:`int`): The number of Monte Carlo iterations.
+        seed(:obj:`numpy.random.SeedSequence`, optional): The seed to spawn the iteration seeds
+            from. If None, the root entropy is drawn from NumPy's global random state, so seeding it
+            with ``np.random.seed`` beforehand makes the iterations reproducible. Defaults to None.
+
+    Returns:
+        :obj:`list[numpy.random.SeedSequence]`: The seed of each iteration.
+    """
+    if seed is None:
+        entropy = np.random.randint(0, np.iinfo(np.int64).max, dtype=np.int64)
+        seed = np.random.SeedSequence(int(entropy))
+    return [_child_seed(seed, i) for i in range(num_sim)]
+
+
+def random_streams(seed: RandomSeed) -> tuple[RandomSampler, np.random.SeedSequence | None]:
+    """Creates the random streams of a Monte Carlo analysis from its :py:attr:`seed`: one for
+    drawing the Monte Carlo inputs, and an independent seed to spawn the seed of each iteration
+    from with :py:func:`iteration_seeds`.
+
+    Args:
+        seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+            The seed of the analysis. An integer or :py:class:`numpy.random.SeedSequence` gives the
+            same streams every time, and a :py:class:`numpy.random.Generator` is advanced by each
+            call. If None, the inputs are drawn from the global random states.
+
+    Returns:
+        tuple[:obj:`RandomSampler`, :obj:`numpy.random.SeedSequence` | :obj:`None`]: The sampler
+        for the Monte Carlo inputs, and the seed of the iterations, or ``None`` if
+        :py:attr:`seed` is None.
+    """
+    if seed is None:
+        return RandomSampler(), None
+
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(int(seed.integers(0, np.iinfo(np.int64).max)))
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(int(seed))
+    return RandomSampler(np.random.default_rng(_child_seed(seed, 0))), _child_seed(seed, 1)
+
+
+def iteration_seeds(
+    num_sim: int, seed: np.random.SeedSequence | None, n_workers: int | None = None
+) -> list[np.random.SeedSequence] | None:
+    """Creates the seed of each Monte Carlo iteration when the analysis is seeded or the
+    iterations are split across worker processes.
+
+    Args:
+        num_sim(:obj:`int`): The number of Monte Carlo iterations.
+        seed(:obj:`numpy.random.SeedSequence` | :obj:`None`): The seed of the iterations from
+            :py:func:`random_streams`.
+        n_workers(:obj:`int` | :obj:`None`, optional): The number of worker processes for the
+            iterations. Defaults to None.
+
+    Returns:
+        :obj:`list[numpy.random.SeedSequence]` | :obj:`None`: The seed of each iteration, or
+        ``None`` when neither :py:attr:`seed` nor :py:attr:`n_workers` is provided, and the
+        iterations should draw from the global random states.
+    """
+    if seed is None and n_workers is None:
+        return None
+    return spawn_iteration_seeds(num_sim, seed)
+
+
+def iteration_sampler(seed: np.random.SeedSequence) -> RandomSampler:
+    """Creates the :py:class:`RandomSampler` of a single iteration from its seed.
+
+    Args:
+        seed(:obj:`numpy.random.SeedSequence`): The seed of the iteration.
+
+    Returns:
+        :obj:`RandomSampler`: The sampler for the iteration's random draws.
+    """
+    return RandomSampler(np.random.default_rng(_child_seed(seed, 0)))
+
+
+@contextmanager
+def iteration_random_state(seed: np.random.SeedSequence):
+    """Context manager that seeds NumPy's and Python's global random states from the seed of a
+    single iteration, and restores the previous states on exit. This keeps any draws made outside
+    of the iteration's :py:class:`RandomSampler`, such as those of scikit-learn models without a
+    ``random_state``, reproducible.
+
+    Args:
+        seed(:obj:`numpy.random.SeedSequence`): The seed of the iteration.
+    """
+    seed = _child_seed(seed, 1)
+    numpy_state = np.random.get_state()
+    python_state = random.getstate()
+    np.random.seed(seed.generate_state(4))
+    random.seed(int(seed.generate_state(1, dtype=np.uint64)[0]))
+    try:
+        yield
+    finally:
+        np.random.set_state(numpy_state)
+        random.setstate(python_state)
+
+
+def _initialize_worker(analysis: Any) -> None:
+    """Stores the analysis object for the iterations run by the worker process."""
+    global _worker_analysis
+    _worker_analysis = analysis
+
+
+def _run_chunk(
+    iteration: str,
+    ix: np.ndarray,
+    seeds: list[np.random.SeedSequence],
+    result_attributes: tuple[str, ...],
+) -> tuple[np.ndarray, list[Any], dict[str, np.ndarray]]:
+    """Runs a chunk of iterations in a worker process, and returns the output of each iteration
+    and the rows of the result arrays that were populated.
+    """
+    method = getattr(_worker_analysis, iteration)
+    results = []
+    for n, seed in zip(ix, seeds):
+        with iteration_random_state(seed):
+            results.append(method(n, iteration_sampler(seed)))
+    rows = {name: getattr(_worker_analysis, name)[ix] for name in result_attributes}
+    return ix, results, rows
+
+
+def run_iterations(
+    analysis: Any,
+    iteration: str,
+    seeds: list[np.random.SeedSequence],
+    n_workers: int,
+    result_attributes: tuple[str, ...] = (),
+    progress_bar: bool = True,
+) -> list[Any]:
+    """Runs ``analysis.<iteration>(n, sampler)`` for each Monte Carlo iteration ``n``, where each
+    iteration draws from its own :py:class:`RandomSampler` and seeded global random states, so the
+    results do not depend on the number of workers.
+
+    When :py:attr:`n_workers` is greater than 1, the iterations are split into chunks that are run
+    in a :py:class:`concurrent.futures.ProcessPoolExecutor`. The analysis object is shipped to each
+    worker once when it starts, which is inherited without copying on platforms that fork. Any
+    rows of the :py:attr:`result_attributes` arrays that are populated in the workers are copied
+    back to :py:attr:`analysis`, and the final iteration is repeated in the calling process so
+    that the intermediate attributes reflect it, as they would after a serial run.
+
+    Args:
+        analysis(:obj:`Any`): The analysis object.
+        iteration(:obj:`str`): The name of the method that runs a single iteration ``n`` with the
+            iteration's :py:class:`RandomSampler`.
+        seeds(:obj:`list[numpy.random.SeedSequence]`): The seed for each iteration, see
+            :py:func:`spawn_iteration_seeds`.
+        n_workers(:obj:`int`): The number of worker processes.
+        result_attributes(:obj:`tuple[str, ...]`, optional): The names of the attribute arrays that
+            the iterations populate at the iteration's index along the first axis. Defaults to ().
+        progress_bar(:obj:`bool`, optional): Flag to use a progress bar for the iterations.
+            Defaults to ``True``.
+
+    Raises:
+        ValueError: Raised if :py:attr:`n_workers` is less than 1.
+
+    Returns:
+        :obj:`list[Any]`: The output of each iteration.
+    """
+    if n_workers < 1:
+        raise ValueError("`n_workers` must be at least 1.")
+
+    num_sim = len(seeds)
+    method = getattr(analysis, iteration)
+    results = [None] * num_sim
+
+    if n_workers == 1:
+        for n in tqdm(range(num_sim), disable=not progress_bar):
+            with iteration_random_state(seeds[n]):
+                results[n] = method(n, iteration_sampler(seeds[n]))
+        return results
+
+    # Use a few chunks per worker to balance the load between them
+    chunks = np.array_split(np.arange(num_sim), min(num_sim, 4 * n_workers))
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_initialize_worker, initargs=(analysis,)
+    ) as executor:
+        futures = [
+            executor.submit(_run_chunk, iteration, ix, [seeds[n] for n in ix], result_attributes)
+            for ix in chunks
+        ]
+        with tqdm(total=num_sim, disable=not progress_bar) as pbar:
+            for future in as_completed(futures):
+                ix, chunk_results, rows = future.result()
+                for n, result in zip(ix, chunk_results):
+                    results[n] = result
+                for name, values in rows.items():
+                    getattr(analysis, name)[ix] = values
+                pbar.update(ix.size)
+
+    with iteration_random_state(seeds[-1]):
+        results[-1] = method(num_sim - 1, iteration_sampler(seeds[-1]))
+    return results
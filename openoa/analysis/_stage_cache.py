@@ -0,0 +1,105 @@
+"""
+Provides a keyed, least recently used (LRU) cache for the intermediate results of the stages of an
+analysis, so that Monte Carlo iterations with repeated parameter combinations can skip recomputing
+them.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Hashable
+from collections import OrderedDict
+
+import attrs
+import numpy as np
+import pandas as pd
+from attrs import field, define
+
+
+def _nbytes(value: Any) -> int:
+    """Estimates the memory used by a cached value, in bytes."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(index=True, deep=True)))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+@define(auto_attribs=True)
+class StageCache:
+    """A least recently used (LRU) cache of the results of an analysis' stages, keyed by the
+    parameters each stage depends on, with a memory budget. The least recently used results are
+    evicted once the cached results exceed :py:attr:`max_memory`, and a result that is larger than
+    the budget by itself is not cached.
+
+    Args:
+        max_memory(:obj:`float` | :obj:`None`): The memory budget of the cache, in MB. ``None`` is an
+            unlimited budget, and 0 disables the cache. Defaults to 256.
+    """
+
+    max_memory: float | None = field(
+        default=256.0,
+        converter=attrs.converters.optional(float),
+        validator=attrs.validators.optional(attrs.validators.ge(0)),
+    )
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    evictions: int = field(default=0, init=False)
+    nbytes: int = field(default=0, init=False)
+    _entries: OrderedDict = field(factory=OrderedDict, init=False, repr=False)
+
+    @property
+    def max_bytes(self) -> float:
+        """The memory budget of the cache, in bytes."""
+        return np.inf if self.max_memory is None else self.max_memory * 1e6
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """The number of cache hits, misses, evictions, and entries, and the cached MB."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "memory": self.nbytes / 1e6,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Gets the cached result of :py:attr:`key`, marking it as the most recently used, or
+        :py:attr:`default` when it is not cached.
+        """
+        if key not in self._entries:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Caches the result, :py:attr:`value`, of :py:attr:`key`, and evicts the least recently
+        used results until the cache is within its memory budget.
+        """
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+        if (size := _nbytes(value)) > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            self.nbytes -= self._entries.popitem(last=False)[1][1]
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes all of the cached results, and resets the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.nbytes = 0
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import sys
-import random
 import datetime
 from copy import deepcopy
 
@@ -26,6 +25,14 @@ from openoa.utils import met_data_processing as mt
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
 from openoa.schema.metadata import convert_frequency
+from openoa.analysis._parallel import (
+    RandomSampler,
+    random_streams,
+    run_iterations,
+    iteration_seeds,
+    iteration_sampler,
+    iteration_random_state,
+)
 from openoa.utils.machine_learning_setup import MachineLearningSetup
 from openoa.analysis._analysis_validators import validate_reanalysis_selections
 
@@ -59,6 +66,69 @@ def get_annual_values(data):
     return data.resample("12MS").sum().values
 
 
+def fit_bootstrap_ols(
+    X: NDArrayFloat,
+    energy: NDArrayFloat,
+    losses: NDArrayFloat,
+    counts: npt.NDArray[np.int64],
+    metered_energy_fraction: NDArrayFloat,
+    loss_fraction: NDArrayFloat,
+) -> tuple[NDArrayFloat, NDArrayFloat, NDArrayFloat, NDArrayFloat]:
+    """
+    Solves a stack of bootstrapped ordinary least squares regressions at once using the normal
+    equations. Each regression ``k`` fits the target
+    ``metered_energy_fraction[k] * energy + loss_fraction[k] * losses`` against :py:attr:`X`, where
+    each row is repeated ``counts[k]`` times, which is equivalent to fitting
+    :py:class:`sklearn.linear_model.LinearRegression` to the resampled data.
+
+    Args:
+        X(:obj:`numpy.ndarray`): The (N x P) regression inputs, without an intercept column.
+        energy(:obj:`numpy.ndarray`): The N target contributions scaled by the metered energy fraction.
+        losses(:obj:`numpy.ndarray`): The N target contributions scaled by the loss fraction.
+        counts(:obj:`numpy.ndarray`): The (K x N) number of times each row is drawn in the bootstrap
+            sample of each of the K regressions.
+        metered_energy_fraction(:obj:`numpy.ndarray`): The K metered energy fractions.
+        loss_fraction(:obj:`numpy.ndarray`): The K loss fractions.
+
+    Returns:
+        tuple[:obj:`numpy.ndarray`]: The K intercepts, (K x P) slopes, K R2 scores, and K mean
+        squared errors of the regressions.
+    """
+    num_points, num_vars = X.shape
+    counts = np.asarray(counts, dtype=np.float64)
+
+    # Center the inputs to keep the normal equations well conditioned
+    X_mean = X.mean(axis=0)
+    Z = np.column_stack([np.ones(num_points), X - X_mean])
+    q = num_vars + 1
+
+    # Bootstrap weighted sums of squares and cross products for every regression
+    ZZ = (counts @ (Z[:, :, None] * Z[:, None, :]).reshape(num_points, q * q)).reshape(-1, q, q)
+    Zy = metered_energy_fraction[:, None] * (counts @ (Z * energy[:, None])) + loss_fraction[
+        :, None
+    ] * (counts @ (Z * losses[:, None]))
+    yy = (
+        metered_energy_fraction**2 * (counts @ energy**2)
+        + 2 * metered_energy_fraction * loss_fraction * (counts @ (energy * losses))
+        + loss_fraction**2 * (counts @ losses**2)
+    )
+
+    try:
+        beta = np.linalg.solve(ZZ, Zy[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        # Minimum norm solution for degenerate samples, matching the least squares solver
+        beta = (np.linalg.pinv(ZZ) @ Zy[..., None])[..., 0]
+
+    sse = np.maximum(yy - np.einsum("ki,ki->k", beta, Zy), 0.0)
+    sst = yy - Zy[:, 0] ** 2 / num_points
+
+    slope = beta[:, 1:]
+    intercept = beta[:, 0] - slope @ X_mean
+    r2 = 1 - sse / sst
+    mse = sse / num_points
+    return intercept, slope, r2, mse
+
+
 # TODO: Split this into a more generic naming convention to have other AEP methods, such as QMC
 # TODO: Create an analysis result class that could be used for better results aggregation
 @define(auto_attribs=True)
@@ -123,6 +193,12 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             the IAV adjustment is useful for comparing against short-term estimates of energy
             production, whereas the exclusion of the IAV is useful for comparing against long-term
             energy production estimates. Defaults to ``True``.
+        seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+            The seed for all random sampling of the analysis. The Monte Carlo inputs and each
+            iteration draw from independent streams spawned from the seed, so an integer or
+            :py:class:`numpy.random.SeedSequence` reproduces the same results on every run, and a
+            :py:class:`numpy.random.Generator` is advanced by each run. If ``None``, the global
+            NumPy and Python random states are used. Defaults to ``None``.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -181,6 +257,12 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         default=None, validator=attrs.validators.instance_of((int, type(None)))
     )
     apply_iav: bool = field(default=True, validator=attrs.validators.instance_of(bool))
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None,
+        validator=attrs.validators.instance_of(
+            (int, np.integer, np.random.SeedSequence, np.random.Generator, type(None))
+        ),
+    )
 
     # Internally created attributes need to be given a type before usage
     resample_freq: str = field(init=False)
@@ -208,6 +290,8 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
     _mc_intercept: NDArrayFloat = field(init=False)
     _mc_slope: NDArrayFloat = field(init=False)
     _run: pd.DataFrame = field(init=False)
+    _sampler: RandomSampler = field(factory=RandomSampler, init=False)
+    _iteration_seed: np.random.SeedSequence | None = field(default=None, init=False)
     results: pd.DataFrame = field(init=False)
     run_parameters: list[str] = field(
         init=False,
@@ -298,6 +382,7 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         end_date_lt: str | pd.Timestamp | None = None,
         ml_setup_kwargs: dict = None,
         progress_bar: bool = True,
+        n_workers: int | None = None,
     ) -> None:
         """
         Process all appropriate data and run the MonteCarlo AEP analysis.
@@ -339,6 +424,11 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
                 :py:class:`openoa.utils.machine_learning_setup.MachineLearningSetup` class. Defaults to {}.
             progress_bar(:obj:`bool`): Flag to use a progress bar for the iterations in the AEP
                 calculation. Defaults to ``True``.
+            n_workers(:obj:`int` | :obj:`None`): The number of worker processes to split the Monte
+                Carlo iterations across. When provided, each iteration draws from its own random
+                stream, so the results are reproducible for any number of workers. ``None`` runs
+                the iterations serially, drawing from the global random state unless :py:attr:`seed`
+                is provided. Defaults to ``None``.
 
         Returns:
             None
@@ -395,9 +485,10 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         logger.info(f"Running with parameters: {logged_params}")
 
         # Start the computation
+        self._sampler, self._iteration_seed = random_streams(self.seed)
         self.calculate_long_term_losses()
         self.setup_monte_carlo_inputs()
-        self.results = self.run_AEP_monte_carlo(progress_bar=progress_bar)
+        self.results = self.run_AEP_monte_carlo(progress_bar=progress_bar, n_workers=n_workers)
 
         # Log the completion of the run
         logger.info("Run completed")
@@ -707,20 +798,22 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         reanal_list = list(np.repeat(self.reanalysis_products, self.num_sim))
 
         inputs = {
-            "reanalysis_product": np.asarray(random.sample(reanal_list, self.num_sim)),
-            "metered_energy_fraction": np.random.normal(1, self.uncertainty_meter, self.num_sim),
-            "loss_fraction": np.random.normal(1, self.uncertainty_losses, self.num_sim),
-            "num_years_windiness": np.random.randint(
+            "reanalysis_product": np.asarray(self._sampler.sample(reanal_list, self.num_sim)),
+            "metered_energy_fraction": self._sampler.normal(
+                1, self.uncertainty_meter, self.num_sim
+            ),
+            "loss_fraction": self._sampler.normal(1, self.uncertainty_losses, self.num_sim),
+            "num_years_windiness": self._sampler.integers(
                 self.uncertainty_windiness[0], self.uncertainty_windiness[1] + 1, self.num_sim
             ),
-            "loss_threshold": np.random.randint(
+            "loss_threshold": self._sampler.integers(
                 self.uncertainty_loss_max[0], self.uncertainty_loss_max[1] + 1, self.num_sim
             )
             / 100.0,
         }
         if self.outlier_detection:
             inputs["outlier_threshold"] = (
-                np.random.randint(
+                self._sampler.integers(
                     self.uncertainty_outlier[0] * 10,
                     (self.uncertainty_outlier[1] + 0.1) * 10,
                     self.num_sim,
@@ -914,13 +1007,15 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         return reg_inputs  # Return randomly sampled wind speed, wind direction, temperature and normalized gross energy
 
     @logged_method_call
-    def run_regression(self, n):
+    def run_regression(self, n, sampler: RandomSampler | None = None):
         """
         Run robust linear regression between Monte-Carlo generated monthly/daily gross energy,
         wind speed, temperature and wind direction (if used)
 
         Args:
             n(:obj:`int`): The Monte Carlo iteration number.
+            sampler(:obj:`RandomSampler`, optional): The sampler for the bootstrap sample of the
+                iteration. If None, the global random state is used. Defaults to None.
 
         Returns:
             A trained regression model.
@@ -928,7 +1023,9 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         reg_data = self.set_regression_data(n)  # Get regression data
 
         # Bootstrap input data to incorporate some regression uncertainty
-        reg_data = np.array(reg_data.sample(frac=1.0, replace=True))
+        if sampler is None:
+            sampler = RandomSampler()
+        reg_data = reg_data.to_numpy()[sampler.bootstrap(reg_data.shape[0])]
 
         # Update Monte Carlo tracker fields
         self._mc_num_points[n] = np.shape(reg_data)[0]
@@ -981,13 +1078,17 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             return self.opt_model[(self._run.reanalysis_product)]
 
     @logged_method_call
-    def run_AEP_monte_carlo(self, progress_bar: bool = True):
+    def run_AEP_monte_carlo(self, progress_bar: bool = True, n_workers: int | None = None):
         """
         Loop through OA process a number of times and return array of AEP results each time
 
         Args:
             progress_bar(:obj:`bool`): Flag to use a progress bar for the iterations in the AEP
                 calculation. Defaults to ``True``.
+            n_workers(:obj:`int` | :obj:`None`): The number of worker processes to split the Monte
+                Carlo iterations across, see :py:func:`openoa.analysis._parallel.run_iterations`.
+                Linear regressions are already solved for all iterations at once, so only the
+                per-iteration random streams are used. Defaults to ``None``.
 
         Returns:
             :obj:`numpy.ndarray` Array of AEP, long-term avail, long-term curtailment calculations
@@ -1010,100 +1111,41 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             self._mc_intercept = np.empty(num_sim, dtype=np.float64)
             self._mc_slope = np.empty([num_sim, num_vars], dtype=np.float64)
 
-        aep_GWh = np.empty(num_sim)
-        avail_pct = np.empty(num_sim)
-        curt_pct = np.empty(num_sim)
-        lt_por_ratio = np.empty(num_sim)
-        iav = np.empty(num_sim)
+        # Each iteration gets its own random stream when seeded or split across workers
+        seeds = iteration_seeds(num_sim, self._iteration_seed, n_workers)
 
-        # Loop through number of simulations, run regression each time, store AEP results
-        _range = trange(num_sim) if progress_bar else np.arange(num_sim)
-        for n in _range:
-            self._run = self.mc_inputs.loc[n]
-
-            # Run regression
-            fitted_model = self.run_regression(n)
-
-            # Get long-term regression inputs
-            reg_inputs_lt = self.sample_long_term_reanalysis()
-
-            # Get long-term normalized gross energy by applying regression result to long-term monthly wind speeds
-            inputs = np.array(reg_inputs_lt)
-            if num_vars == 1:
-                inputs = inputs.reshape(-1, 1)
-            gross_lt = fitted_model.predict(inputs)
-
-            # Get POR gross energy by applying regression result to POR regression inputs
-            reg_inputs_por = [self.reanalysis_por[self._run.reanalysis_product]]
-            if self.reg_temperature:
-                reg_inputs_por += [
-                    self.reanalysis_por[self._run.reanalysis_product + "_WMETR_EnvTmp"]
-                ]
-            if self.reg_wind_direction:
-                reg_inputs_por += [
-                    np.sin(
-                        np.deg2rad(
-                            self.reanalysis_por[self._run.reanalysis_product + "_WMETR_HorWdDir"]
-                        )
-                    )
-                ]
-                reg_inputs_por += [
-                    np.cos(
-                        np.deg2rad(
-                            self.reanalysis_por[self._run.reanalysis_product + "_WMETR_HorWdDir"]
-                        )
-                    )
-                ]
-            gross_por = fitted_model.predict(np.array(pd.concat(reg_inputs_por, axis=1)))
-
-            # Create padans dataframe for gross_por and group by calendar date to have a single full year
-            gross_por = self.groupby_time_res(
-                pd.DataFrame(
-                    data=gross_por, index=self.reanalysis_por[self._run.reanalysis_product].index
-                )
+        # Linear regressions are solved for all simulations at once
+        if self.reg_model == "lin":
+            aep_GWh, avail_pct, curt_pct, lt_por_ratio, iav = self._run_linear_monte_carlo(
+                progress_bar=progress_bar, seeds=seeds
             )
-
-            if self.time_resolution in ("MS", "ME"):  # Undo normalization to 30-day months
-                # Shift the list of number of days per month to align with the reanalysis data
-                last_month = self._reanalysis_aggregate.index[-1].month
-                gross_lt = (
-                    gross_lt
-                    * np.tile(
-                        np.roll(self.num_days_lt, 12 - last_month), self._run.num_years_windiness
-                    )
-                    / 30
+        else:
+            if seeds is None:
+                # Loop through number of simulations, run regression each time, store AEP results
+                _range = trange(num_sim) if progress_bar else np.arange(num_sim)
+                results = [self._run_iteration(n, self._sampler) for n in _range]
+            else:
+                # Optimize the hyperparameters up front, so the workers share the same models
+                for n in self.mc_inputs.drop_duplicates("reanalysis_product").index:
+                    with iteration_random_state(seeds[n]):
+                        self._run = self.mc_inputs.loc[n]
+                        self.run_regression(n, iteration_sampler(seeds[n]))
+                results = run_iterations(
+                    self,
+                    "_run_iteration",
+                    seeds,
+                    1 if n_workers is None else n_workers,
+                    result_attributes=("_mc_num_points", "_r2_score", "_mse_score"),
+                    progress_bar=progress_bar,
                 )
-                gross_por = np.array(gross_por).flatten() * self.num_days_lt / 30
-
-            # Annual values of lt gross energy, needed for IAV
-            reg_inputs_lt["gross_lt"] = gross_lt
-
-            # Annual resample starting on the first day in reg_inputs_lt
-            gross_lt_annual = get_annual_values(reg_inputs_lt["gross_lt"])
-
-            # Get long-term availability and curtailment losses, using gross_lt to weight individual monthly losses
-            [avail_lt_losses, curt_lt_losses] = self.sample_long_term_losses(
-                reg_inputs_lt["gross_lt"]
-            )
-
-            # Assign AEP, IAV, long-term availability, and long-term curtailment to output data frame
-            aep_GWh[n] = gross_lt.sum() / self._run.num_years_windiness * (1 - avail_lt_losses)
-            iav[n] = gross_lt_annual.std() / gross_lt_annual.mean()
-            avail_pct[n] = avail_lt_losses
-            curt_pct[n] = curt_lt_losses
-            gps = (
-                gross_por.sum()
-                if not isinstance(gross_por, (pd.Series, pd.DataFrame))
-                else gross_por.values.sum()
-            )
-            lt_por_ratio[n] = (gross_lt.sum() / self._run.num_years_windiness) / gps
+            aep_GWh, avail_pct, curt_pct, lt_por_ratio, iav = np.array(results).T
 
         # Calculate mean IAV for gross energy
         iav_avg = iav.mean()
 
         # Apply IAV to AEP from single MC iterations
         if self.apply_iav:
-            iav_nsim = np.random.normal(1, iav_avg, self.num_sim)
+            iav_nsim = self._sampler.normal(1, iav_avg, self.num_sim)
             aep_GWh = aep_GWh * iav_nsim
             lt_por_ratio = lt_por_ratio * iav_nsim
 
@@ -1123,6 +1165,282 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         )
         return sim_results
 
+    @logged_method_call
+    def _run_iteration(
+        self, n: int, sampler: RandomSampler
+    ) -> tuple[float, float, float, float, float]:
+        """
+        Runs a single iteration of the Monte Carlo simulation for the machine learning regression
+        models.
+
+        Args:
+            n(:obj:`int`): The Monte Carlo iteration number.
+            sampler(:obj:`RandomSampler`): The sampler for the iteration's random draws.
+
+        Returns:
+            tuple[:obj:`float`]: The AEP, long-term availability, long-term curtailment, long-term
+            to period of record ratio, and IAV.
+        """
+        self._run = self.mc_inputs.loc[n]
+
+        # Run regression
+        fitted_model = self.run_regression(n, sampler)
+
+        # Get long-term regression inputs
+        reg_inputs_lt = self.sample_long_term_reanalysis()
+
+        # Get long-term normalized gross energy by applying regression result to long-term monthly wind speeds
+        inputs = np.array(reg_inputs_lt).reshape(reg_inputs_lt.shape[0], -1)
+        gross_lt = fitted_model.predict(inputs)
+
+        # Get POR gross energy by applying regression result to POR regression inputs
+        reg_inputs_por = [self.reanalysis_por[self._run.reanalysis_product]]
+        if self.reg_temperature:
+            reg_inputs_por += [self.reanalysis_por[self._run.reanalysis_product + "_WMETR_EnvTmp"]]
+        if self.reg_wind_direction:
+            reg_inputs_por += [
+                np.sin(
+                    np.deg2rad(
+                        self.reanalysis_por[self._run.reanalysis_product + "_WMETR_HorWdDir"]
+                    )
+                )
+            ]
+            reg_inputs_por += [
+                np.cos(
+                    np.deg2rad(
+                        self.reanalysis_por[self._run.reanalysis_product + "_WMETR_HorWdDir"]
+                    )
+                )
+            ]
+        gross_por = fitted_model.predict(np.array(pd.concat(reg_inputs_por, axis=1)))
+
+        # Create padans dataframe for gross_por and group by calendar date to have a single full year
+        gross_por = self.groupby_time_res(
+            pd.DataFrame(
+                data=gross_por,
+                index=self.reanalysis_por[self._run.reanalysis_product].index,
+            )
+        )
+
+        if self.time_resolution in ("MS", "ME"):  # Undo normalization to 30-day months
+            # Shift the list of number of days per month to align with the reanalysis data
+            last_month = self._reanalysis_aggregate.index[-1].month
+            gross_lt = (
+                gross_lt
+                * np.tile(
+                    np.roll(self.num_days_lt, 12 - last_month),
+                    self._run.num_years_windiness,
+                )
+                / 30
+            )
+            gross_por = np.array(gross_por).flatten() * self.num_days_lt / 30
+
+        # Annual values of lt gross energy, needed for IAV
+        reg_inputs_lt["gross_lt"] = gross_lt
+
+        # Annual resample starting on the first day in reg_inputs_lt
+        gross_lt_annual = get_annual_values(reg_inputs_lt["gross_lt"])
+
+        # Get long-term availability and curtailment losses, using gross_lt to weight individual monthly losses
+        [avail_lt_losses, curt_lt_losses] = self.sample_long_term_losses(reg_inputs_lt["gross_lt"])
+
+        # Calculate AEP, IAV, long-term availability, and long-term curtailment
+        aep_GWh = gross_lt.sum() / self._run.num_years_windiness * (1 - avail_lt_losses)
+        iav = gross_lt_annual.std() / gross_lt_annual.mean()
+        gps = (
+            gross_por.sum()
+            if not isinstance(gross_por, (pd.Series, pd.DataFrame))
+            else gross_por.values.sum()
+        )
+        lt_por_ratio = (gross_lt.sum() / self._run.num_years_windiness) / gps
+        return aep_GWh, avail_lt_losses, curt_lt_losses, lt_por_ratio, iav
+
+    @logged_method_call
+    def _run_linear_monte_carlo(
+        self, progress_bar: bool = True, seeds: list[np.random.SeedSequence] | None = None
+    ) -> tuple[NDArrayFloat, NDArrayFloat, NDArrayFloat, NDArrayFloat, NDArrayFloat]:
+        """
+        Batched version of the Monte Carlo loop in :py:meth:`run_AEP_monte_carlo` for linear
+        regression models. The bootstrap samples are drawn in the same order as the iterative
+        approach, all regressions are solved at once with :py:func:`fit_bootstrap_ols`, and because
+        the long-term and period of record gross energy are linear in the regression coefficients,
+        every aggregation is precomputed once per reanalysis product and number of years and
+        applied to all simulations as a matrix product.
+
+        Args:
+            progress_bar(:obj:`bool`): Flag to use a progress bar for drawing the bootstrap samples.
+                Defaults to ``True``.
+            seeds(:obj:`list[numpy.random.SeedSequence]`, optional): The random seed of each
+                iteration's bootstrap sample. If None, the samples are drawn sequentially from
+                :py:attr:`_sampler`. Defaults to None.
+
+        Returns:
+            tuple[:obj:`numpy.ndarray`]: Arrays of the AEP, long-term availability, long-term
+            curtailment, long-term to period of record ratio, and IAV for each simulation.
+        """
+        num_sim = self.num_sim
+        mc_inputs = self.mc_inputs
+        metered_energy_fraction = mc_inputs.metered_energy_fraction.to_numpy()
+        loss_fraction = mc_inputs.loss_fraction.to_numpy()
+        num_years = mc_inputs.num_years_windiness.to_numpy()
+
+        # Get the filtered regression data for each reanalysis product and loss threshold in the
+        # order they are first used, so the memoized outlier filtering matches the iterative loop
+        reg_group = mc_inputs.groupby(["reanalysis_product", "loss_threshold"], sort=False).ngroup()
+        reg_data = []
+        for n in reg_group.drop_duplicates().index:
+            self._run = mc_inputs.loc[n]
+            reg_data.append(self._linear_regression_data(self.filter_outliers(n)))
+        reg_group = reg_group.to_numpy()
+
+        # Bootstrap the regression data as counts of each data point, and solve the regressions in
+        # chunks to limit the memory footprint of the count matrices
+        def solve(k: int, samples: list[tuple[int, npt.NDArray[np.int64]]]) -> None:
+            X, energy, losses = reg_data[k]
+            ix, counts = zip(*samples)
+            ix = np.array(ix)
+            intercept, slope, r2, mse = fit_bootstrap_ols(
+                X, energy, losses, np.vstack(counts), metered_energy_fraction[ix], loss_fraction[ix]
+            )
+            self._mc_intercept[ix] = intercept
+            self._mc_slope[ix] = slope
+            self._r2_score[ix] = r2
+            self._mse_score[ix] = mse
+            self._mc_num_points[ix] = X.shape[0]
+
+        pending = {k: [] for k in range(len(reg_data))}
+        _range = trange(num_sim) if progress_bar else np.arange(num_sim)
+        for n in _range:
+            k = reg_group[n]
+            num_points = reg_data[k][0].shape[0]
+            sampler = self._sampler if seeds is None else iteration_sampler(seeds[n])
+            sample = sampler.bootstrap(num_points)
+            pending[k].append((n, np.bincount(sample, minlength=num_points)))
+            if len(pending[k]) * num_points >= 2**22:
+                solve(k, pending[k])
+                pending[k] = []
+        for k, samples in pending.items():
+            if samples:
+                solve(k, samples)
+
+        beta = np.column_stack([self._mc_intercept, self._mc_slope])
+
+        aep_GWh = np.empty(num_sim)
+        avail_pct = np.empty(num_sim)
+        curt_pct = np.empty(num_sim)
+        lt_por_ratio = np.empty(num_sim)
+        iav = np.empty(num_sim)
+
+        # Apply the regressions to the long-term and period of record inputs
+        lt_group = mc_inputs.groupby(["reanalysis_product", "num_years_windiness"], sort=False)
+        por_inputs = {}
+        for (product, _), ix in lt_group.indices.items():
+            self._run = mc_inputs.loc[ix[0]]
+            lt_total, lt_annual, lt_calendar = self._linear_long_term_aggregates()
+            if product not in por_inputs:
+                por_inputs[product] = self._linear_por_aggregates()
+
+            beta_ix = beta[ix]
+            gross_lt = beta_ix @ lt_total / num_years[ix]
+            gross_lt_annual = beta_ix @ lt_annual.T
+            gross_lt_calendar = beta_ix @ lt_calendar.to_numpy().T
+
+            # Weight the long-term losses by the long-term gross energy, ignoring missing periods
+            avail, curt = (
+                loss.reindex(lt_calendar.index).fillna(0).to_numpy()
+                for loss in self.long_term_losses
+            )
+            calendar_total = gross_lt_calendar.sum(axis=1)
+            avail_pct[ix] = loss_fraction[ix] * (gross_lt_calendar @ avail) / calendar_total
+            curt_pct[ix] = loss_fraction[ix] * (gross_lt_calendar @ curt) / calendar_total
+
+            aep_GWh[ix] = gross_lt * (1 - avail_pct[ix])
+            iav[ix] = gross_lt_annual.std(axis=1) / gross_lt_annual.mean(axis=1)
+            lt_por_ratio[ix] = gross_lt / (beta_ix @ por_inputs[product])
+
+        return aep_GWh, avail_pct, curt_pct, lt_por_ratio, iav
+
+    def _linear_inputs(self, data: pd.DataFrame, product: str) -> NDArrayFloat:
+        """Creates the regression inputs array of wind speed, and, if used, temperature and the sine
+        and cosine of the wind direction for :py:attr:`product`.
+
+        Args:
+            data(:obj:`pandas.DataFrame`): The monthly/daily data containing the reanalysis columns.
+            product(:obj:`str`): The reanalysis product.
+
+        Returns:
+            :obj:`numpy.ndarray`: The regression inputs.
+        """
+        inputs = [data[product]]
+        if self.reg_temperature:
+            inputs.append(data[f"{product}_WMETR_EnvTmp"])
+        if self.reg_wind_direction:
+            wind_direction = np.deg2rad(data[f"{product}_WMETR_HorWdDir"])
+            inputs.extend([np.sin(wind_direction), np.cos(wind_direction)])
+        return np.column_stack(inputs)
+
+    def _linear_regression_data(
+        self, reg_data: pd.DataFrame
+    ) -> tuple[NDArrayFloat, NDArrayFloat, NDArrayFloat]:
+        """Splits the filtered regression data into the regression inputs, and the normalized
+        metered energy and combined availability and curtailment losses that are scaled by the
+        Monte Carlo sampled metered energy and loss fractions to form the gross energy target.
+
+        Args:
+            reg_data(:obj:`pandas.DataFrame`): The output of :py:meth:`filter_outliers`.
+
+        Returns:
+            tuple[:obj:`numpy.ndarray`]: The regression inputs, metered energy, and losses.
+        """
+        norm = 1.0
+        if self.time_resolution in ("MS", "ME"):
+            norm = 30 / reg_data["num_days_expected"]
+        energy = (reg_data["energy_gwh"] * norm).to_numpy()
+        losses = ((reg_data["availability_gwh"] + reg_data["curtailment_gwh"]) * norm).to_numpy()
+        return self._linear_inputs(reg_data, self._run.reanalysis_product), energy, losses
+
+    def _linear_long_term_aggregates(self) -> tuple[NDArrayFloat, NDArrayFloat, pd.DataFrame]:
+        """Computes the long-term totals, annual sums, and calendar period averages of the
+        regression inputs with a leading intercept column, such that their product with the
+        regression coefficients produces the corresponding long-term gross energy values.
+
+        Returns:
+            tuple: The total, annual (:obj:`numpy.ndarray`), and calendar period
+            (:obj:`pandas.DataFrame`) long-term regression inputs.
+        """
+        reg_inputs_lt = self.sample_long_term_reanalysis()
+        inputs = np.column_stack([np.ones(reg_inputs_lt.shape[0]), reg_inputs_lt.to_numpy()])
+        if self.time_resolution in ("MS", "ME"):  # Undo normalization to 30-day months
+            last_month = self._reanalysis_aggregate.index[-1].month
+            inputs *= (
+                np.tile(np.roll(self.num_days_lt, 12 - last_month), self._run.num_years_windiness)
+                / 30
+            )[:, None]
+        inputs = pd.DataFrame(inputs, index=reg_inputs_lt.index)
+
+        # The index is shifted to the start of the first month for both aggregations
+        annual = get_annual_values(inputs)
+        calendar = self.groupby_time_res(inputs.rename_axis("time"))
+        return inputs.sum().to_numpy(), annual, calendar
+
+    def _linear_por_aggregates(self) -> NDArrayFloat:
+        """Computes the period of record regression inputs, with a leading intercept column,
+        averaged by calendar period and summed, such that their product with the regression
+        coefficients produces the period of record gross energy.
+
+        Returns:
+            :obj:`numpy.ndarray`: The summed period of record regression inputs.
+        """
+        product = self._run.reanalysis_product
+        inputs = self._linear_inputs(self.reanalysis_por, product)
+        inputs = pd.DataFrame(
+            np.column_stack([np.ones(inputs.shape[0]), inputs]), index=self.reanalysis_por.index
+        )
+        inputs = self.groupby_time_res(inputs).to_numpy()
+        if self.time_resolution in ("MS", "ME"):  # Undo normalization to 30-day months
+            inputs = inputs * np.array(self.num_days_lt)[:, None] / 30
+        return inputs.sum(axis=0)
+
     @logged_method_call
     def sample_long_term_reanalysis(self):
         """
@@ -13,7 +13,6 @@ import numpy as np
 import pandas as pd
 import numpy.typing as npt
 import matplotlib.pyplot as plt
-from tqdm import tqdm
 from attrs import field, define
 
 import openoa.utils.timeseries as ts
@@ -21,6 +20,7 @@ from openoa.plant import PlantData
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
 from openoa.utils.plot import set_styling
+from openoa.analysis._parallel import RandomSampler, random_streams
 from openoa.analysis._analysis_validators import validate_UQ_input, validate_half_closed_0_1_right
 
 logger = logging.getLogger(__name__)
@@ -69,6 +69,15 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
             the range of (0, 1), under which months should be eliminated. If :py:attr:`UQ` = True,
             then a 2-element tuple containing an upper and lower bound for a randomly selected value
             should be given, otherwise, a scalar value should be provided.
+        seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+            The seed for the random sampling of the Monte Carlo inputs. An integer or
+            :py:class:`numpy.random.SeedSequence` reproduces the same results on every run, and a
+            :py:class:`numpy.random.Generator` is advanced by each run. If ``None``, the global
+            NumPy random state is used. Defaults to ``None``.
+        scada_chunk_freq(:obj:`str` | :obj:`None`): The pandas frequency string, such as "MS" for
+            monthly, of the chunks of time to reduce the SCADA data in, which limits the temporary
+            memory of :py:meth:`process_scada` to a single chunk of the SCADA data. If ``None``,
+            the SCADA data are reduced in a single pass. Defaults to ``None``.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -79,6 +88,15 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
     uncertainty_correction_threshold: NDArrayFloat | tuple[float, float] | float = field(
         default=(0.9, 0.995), validator=(validate_UQ_input, validate_half_closed_0_1_right)
     )
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None,
+        validator=attrs.validators.instance_of(
+            (int, np.integer, np.random.SeedSequence, np.random.Generator, type(None))
+        ),
+    )
+    scada_chunk_freq: str | None = field(
+        default=None, validator=attrs.validators.optional(attrs.validators.instance_of(str))
+    )
 
     # Internally created attributes need to be given a type before usage
     monthly_meter: bool = field(default=False, init=False)
@@ -91,6 +109,7 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
     combined_energy: pd.DataFrame = field(init=False)
     total_turbine_energy: pd.DataFrame = field(init=False)
     total_meter_energy: pd.DataFrame = field(init=False)
+    _sampler: RandomSampler = field(factory=RandomSampler, init=False)
     run_parameters: list[str] = field(
         init=False,
         default=[
@@ -127,6 +146,8 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         if self.plant.metadata.meter.frequency not in ("MS", "ME", "1MS"):
             self.process_meter()
             self.monthly_meter = False
+        else:
+            self.monthly_meter = True
 
     @logged_method_call
     def run(
@@ -175,6 +196,7 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
             self.uncertainty_correction_threshold = uncertainty_correction_threshold
 
         # Setup Monte Carlo approach, and calculate the electrical losses
+        self._sampler, _ = random_streams(self.seed)
         self.setup_inputs()
         self.calculate_electrical_losses()
 
@@ -193,9 +215,13 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
             )
             integer_multiplier = 10**n_decimal
             inputs = {
-                "meter_data_fraction": np.random.normal(1, self.uncertainty_meter, self.num_sim),
-                "scada_data_fraction": np.random.normal(1, self.uncertainty_scada, self.num_sim),
-                "correction_threshold": np.random.randint(
+                "meter_data_fraction": self._sampler.normal(
+                    1, self.uncertainty_meter, self.num_sim
+                ),
+                "scada_data_fraction": self._sampler.normal(
+                    1, self.uncertainty_scada, self.num_sim
+                ),
+                "correction_threshold": self._sampler.integers(
                     self.uncertainty_correction_threshold[0] * integer_multiplier,
                     self.uncertainty_correction_threshold[1] * integer_multiplier,
                     self.num_sim,
@@ -221,16 +247,23 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         """
         logger.info("Processing SCADA data")
 
-        scada_df = self.plant.scada.copy()
-
-        # Sum up SCADA data power and energy and count number of entries
-        ix_time = self.plant.scada.index.get_level_values("time")
-        self.scada_sum = scada_df.groupby(ix_time)[["WTUR_SupWh"]].sum()
-        self.scada_sum["count"] = scada_df.groupby(ix_time)[["WTUR_SupWh"]].count()
+        # Sum up SCADA data energy and count number of entries for each timestamp
+        times, energy, count = self._reduce_scada()
+        self.scada_sum = pd.DataFrame({"WTUR_SupWh": energy, "count": count}, index=times)
 
         # Calculate daily sum of all turbine energy production and count number of entries
-        self.scada_daily = self.scada_sum.resample("D")["WTUR_SupWh"].sum().to_frame()
-        self.scada_daily["count"] = self.scada_sum.resample("D")["count"].sum()
+        days = times.normalize()
+        daily_index = pd.date_range(days[0], days[-1], freq="D", name="time")
+        day = daily_index.get_indexer(days)
+        self.scada_daily = pd.DataFrame(
+            {
+                "WTUR_SupWh": np.bincount(day, weights=energy, minlength=daily_index.size),
+                "count": np.bincount(day, weights=count, minlength=daily_index.size).astype(
+                    np.int64
+                ),
+            },
+            index=daily_index,
+        )
 
         # Specify expected count provided all turbines reporting
         expected_count = (
@@ -249,6 +282,55 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         # Store daily SCADA data where all turbines reporting for every time step during the day
         self.scada_full_count = self.scada_daily.loc[self.scada_daily["count"] == expected_count]
 
+    def _reduce_scada(self) -> tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+        """Sums and counts the turbine energy data of each timestamp in a single pass over the
+        SCADA data, without copying it. When :py:attr:`scada_chunk_freq` is provided, the
+        timestamps are reduced one chunk of time at a time.
+
+        Returns:
+            tuple[:obj:`pandas.DatetimeIndex`, :obj:`numpy.ndarray`, :obj:`numpy.ndarray`]: The
+            timestamps with SCADA data, and the sum and count of their turbine energy data.
+        """
+        index = self.plant.scada.index
+        level = index.names.index("time")
+        times = index.levels[level]
+        codes = index.codes[level]
+        energy = self.plant.scada["WTUR_SupWh"].to_numpy(dtype=float)
+        if not times.is_monotonic_increasing:
+            order = times.argsort()
+            codes = np.where(codes < 0, -1, np.argsort(order)[codes])
+            times = times[order]
+
+        # Find the boundaries of the chunks of timestamps, which are contiguous rows when the
+        # SCADA data are sorted by time
+        bounds = np.array([0, times.size])
+        if self.scada_chunk_freq is not None:
+            starts = pd.date_range(times[0], times[-1], freq=self.scada_chunk_freq)
+            bounds = np.unique(np.r_[bounds, times.searchsorted(starts)])
+        contiguous = level == 0 and index.is_monotonic_increasing
+
+        n_rows = np.zeros(times.size, dtype=np.int64)
+        total = np.zeros(times.size)
+        count = np.zeros(times.size, dtype=np.int64)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if contiguous:
+                rows = slice(*codes.searchsorted([start, end]))
+            else:
+                rows = np.flatnonzero((codes >= start) & (codes < end))
+            chunk_codes = codes[rows].astype(np.intp) - start
+            chunk_energy = energy[rows]
+            valid = ~np.isnan(chunk_energy)
+            size = end - start
+            n_rows[start:end] = np.bincount(chunk_codes, minlength=size)
+            total[start:end] = np.bincount(
+                chunk_codes[valid], weights=chunk_energy[valid], minlength=size
+            )
+            count[start:end] = np.bincount(chunk_codes[valid], minlength=size)
+
+        # Only keep the timestamps that have SCADA data
+        observed = n_rows > 0
+        return times[observed].rename("time"), total[observed], count[observed]
+
     @logged_method_call
     def process_meter(self):
         """
@@ -277,56 +359,84 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         """
         Apply Monte Carlo approach to calculate electrical losses and their uncertainty based on the
         difference in the sum of turbine and metered energy over the compiled days.
+
+        Only the sampled data fractions and correction threshold vary between the simulations, so
+        the turbine and meter energy are joined once, and the losses of every simulation are
+        computed at once from the sums of the concurrent energy. For monthly meter data, the months
+        are sorted by their turbine data availability, so that the sums over the months meeting
+        each simulation's correction threshold are read from their cumulative sums.
         """
         logger.info("Calculating electrical losses")
 
-        # Loop through number of simulations, calculate losses each time, store results
-        for n in tqdm(np.arange(self.num_sim)):
-            _run = self.inputs.loc[n]
-            meter_df = self.plant.meter.copy()
-
-            # If monthly meter data, sum the corrected daily turbine energy to monthly and merge
-            if self.monthly_meter:
-                scada_monthly = self.scada_daily.resample("MS")["corrected_energy"].sum().to_frame()
-                scada_monthly.columns = ["WTUR_SupWh"]
-
-                # Determine availability for each month represented
-                scada_monthly["count"] = self.scada_sum.resample("MS")["count"].sum()
-                scada_monthly["expected_count_monthly"] = (
-                    scada_monthly.index.daysinmonth
-                    * HOURS_PER_DAY
-                    * MINUTES_PER_HOUR
-                    / (pd.to_timedelta(self.plant.scada.frequency).total_seconds() / 60)
-                    * self.plant.n_turbines
-                )
-                scada_monthly["percent"] = (
-                    scada_monthly["count"] / scada_monthly["expected_count_monthly"]
-                )
+        combined_energy = self._combine_energy()
+        thresholds = self.inputs["correction_threshold"].to_numpy(dtype=float)
+        energy_columns = ["WTUR_SupWh", "MMTR_SupWh"]
+
+        # If monthly meter data, only the months with at least the threshold of turbine data
+        # availability are summed
+        if self.monthly_meter:
+            order = np.argsort(-combined_energy["percent"].to_numpy(), kind="stable")
+            percent = combined_energy["percent"].to_numpy()[order]
+            energy = combined_energy[energy_columns].to_numpy()[order]
+            energy = np.vstack([np.zeros((1, 2)), np.cumsum(energy, axis=0)])
+            n_months = np.searchsorted(-percent, -thresholds, side="right")
+            turbine_sum, meter_sum = energy[n_months].T
+            self.combined_energy = combined_energy.loc[combined_energy["percent"] >= thresholds[-1]]
+
+        # If sub-monthly meter data, the same days are summed for every simulation
+        else:
+            merge_sum = combined_energy.sum(axis=0)
+            turbine_sum = np.full(thresholds.size, merge_sum["WTUR_SupWh"])
+            meter_sum = np.full(thresholds.size, merge_sum["MMTR_SupWh"])
+            self.combined_energy = combined_energy
 
-                # Filter out months in which there was less than x% of total running (all turbines at all timesteps)
-                scada_monthly = scada_monthly.loc[
-                    scada_monthly["percent"] >= _run.correction_threshold, :
-                ]
-                self.combined_energy = meter_df.join(
-                    scada_monthly, lsuffix="_meter", rsuffix="_scada"
-                )
+        # Calculate electrical loss from difference of sum of turbine and meter energy
+        turbine_energy = turbine_sum * self.inputs["scada_data_fraction"].to_numpy(dtype=float)
+        meter_energy = meter_sum * self.inputs["meter_data_fraction"].to_numpy(dtype=float)
+        self.electrical_losses = (1 - meter_energy / turbine_energy).reshape(-1, 1)
 
-            # If sub-monthly meter data, merge the daily data for which all turbines are reporting at all timestamps
-            else:
-                # Note 'self.scada_full_count' only contains full reported data
-                self.combined_energy = self.meter_daily.join(
-                    self.scada_full_count, lsuffix="_meter", rsuffix="_scada"
-                )
+        # Keep the energy totals of the final simulation
+        self.total_turbine_energy = turbine_energy[-1]
+        self.total_meter_energy = meter_energy[-1]
 
-            # Drop non-concurrent timestamps and get total sums over concurrent period of record
-            self.combined_energy.dropna(inplace=True)
-            merge_sum = self.combined_energy.sum(axis=0)
+    def _combine_energy(self) -> pd.DataFrame:
+        """Joins the turbine and meter energy over their concurrent period of record. For monthly
+        meter data, the monthly sums of the corrected daily turbine energy are joined with their
+        turbine data availability, ``percent``, to be filtered by the correction threshold.
 
-            # Calculate electrical loss from difference of sum of turbine and meter energy
-            self.total_turbine_energy = merge_sum["WTUR_SupWh"] * _run.scada_data_fraction
-            self.total_meter_energy = merge_sum["MMTR_SupWh"] * _run.meter_data_fraction
+        Returns:
+            :obj:`pandas.DataFrame`: The concurrent turbine and meter energy data.
+        """
+        # If monthly meter data, sum the corrected daily turbine energy to monthly and merge
+        if self.monthly_meter:
+            scada_monthly = self.scada_daily.resample("MS")["corrected_energy"].sum().to_frame()
+            scada_monthly.columns = ["WTUR_SupWh"]
+
+            # Determine availability for each month represented
+            scada_monthly["count"] = self.scada_sum.resample("MS")["count"].sum()
+            scada_monthly["expected_count_monthly"] = (
+                scada_monthly.index.daysinmonth
+                * HOURS_PER_DAY
+                * MINUTES_PER_HOUR
+                / (ts.offset_to_seconds(self.plant.metadata.scada.frequency) / 60)
+                * self.plant.n_turbines
+            )
+            scada_monthly["percent"] = (
+                scada_monthly["count"] / scada_monthly["expected_count_monthly"]
+            )
+            combined_energy = self.plant.meter.join(
+                scada_monthly, lsuffix="_meter", rsuffix="_scada"
+            )
+
+        # If sub-monthly meter data, merge the daily data for which all turbines are reporting at all timestamps
+        else:
+            # Note 'self.scada_full_count' only contains full reported data
+            combined_energy = self.meter_daily.join(
+                self.scada_full_count, lsuffix="_meter", rsuffix="_scada"
+            )
 
-            self.electrical_losses[n] = 1 - self.total_meter_energy / self.total_turbine_energy
+        # Drop non-concurrent timestamps
+        return combined_energy.dropna()
 
     def plot_monthly_losses(
         self,
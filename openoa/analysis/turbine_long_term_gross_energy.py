@@ -7,7 +7,6 @@ output is a 'waterfall' plot linking the EYA-estimated and operational-estiamted
 
 from __future__ import annotations
 
-import random
 from copy import deepcopy
 from typing import Callable
 
@@ -27,6 +26,13 @@ from openoa.utils import met_data_processing as met
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
 from openoa.utils.power_curve import functions
+from openoa.analysis._parallel import (
+    RandomSampler,
+    random_streams,
+    run_iterations,
+    iteration_seeds,
+)
+from openoa.analysis._stage_cache import StageCache
 from openoa.analysis._analysis_validators import (
     validate_UQ_input,
     validate_half_closed_0_1_right,
@@ -92,6 +98,17 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
             scada energy data should be corrected. When :py:attr:`UQ` is True, then this should be a
             tuple of the lower and upper limits of this threshold, otherwise a single value should
             be used. Defaults to (0.85, 0.95)
+        seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+            The seed for the random sampling of the Monte Carlo inputs. An integer or
+            :py:class:`numpy.random.SeedSequence` reproduces the same results on every run, and a
+            :py:class:`numpy.random.Generator` is advanced by each run. If ``None``, the global
+            NumPy and Python random states are used. Defaults to ``None``.
+        stage_cache_memory(:obj:`float` | :obj:`None`): The memory budget, in MB, of the cache of
+            the filtered turbine data and the filtered and imputed daily SCADA data, which are
+            reused by the Monte Carlo iterations with the same filter and correction thresholds, and
+            of the separate cache of the reanalysis spline basis of the turbine models. The least
+            recently used results are evicted once a budget is exceeded. ``None`` is an unlimited
+            budget, and 0 disables the caches. Defaults to 256.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -116,6 +133,17 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
     correction_threshold: NDArrayFloat = field(
         default=(0.85, 0.95), validator=(validate_UQ_input, validate_half_closed_0_1_right)
     )
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None,
+        validator=attrs.validators.instance_of(
+            (int, np.integer, np.random.SeedSequence, np.random.Generator, type(None))
+        ),
+    )
+    stage_cache_memory: float | None = field(
+        default=256.0,
+        converter=attrs.converters.optional(float),
+        validator=attrs.validators.optional(attrs.validators.ge(0)),
+    )
 
     # Internally created attributes need to be given a type before usage
     por_start: pd.Timestamp = field(init=False)
@@ -128,12 +156,15 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
     model_results: dict = field(factory=dict, init=False)
     scada_daily_valid: pd.DataFrame = field(default=pd.DataFrame(), init=False)
     reanalysis_memo: dict[str, pd.DataFrame] = field(factory=dict, init=False)
+    stage_cache: StageCache = field(init=False)
+    basis_cache: StageCache = field(init=False)
     daily_reanalysis: dict[str, pd.DataFrame] = field(factory=dict, init=False)
     _run: pd.DataFrame = field(init=False)
     _inputs: pd.DataFrame = field(init=False)
+    _sampler: RandomSampler = field(factory=RandomSampler, init=False)
     scada_valid: pd.DataFrame = field(init=False)
     turbine_model_dict: dict[str, pd.DataFrame] = field(factory=dict, init=False)
-    _model_results: dict[str, Callable] = field(factory=dict, init=False)
+    _model_results: dict[tuple[str, ...], Callable] = field(factory=dict, init=False)
     turb_lt_gross: pd.DataFrame = field(default=pd.DataFrame(), init=False)
     summary_results: pd.DataFrame = field(init=False)
     plant_gross: dict[int, pd.DataFrame] = field(factory=dict, init=False)
@@ -175,6 +206,8 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         self.por_end = self.plant.scada.index.get_level_values("time").max()
 
         # Initially sort the different turbine data into dictionary entries
+        self.stage_cache = StageCache(self.stage_cache_memory)
+        self.basis_cache = StageCache(self.stage_cache_memory)
         logger.info("Processing SCADA data into dictionaries by turbine (this can take a while)")
         self.sort_scada_by_turbine()
 
@@ -187,6 +220,7 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         wind_bin_threshold: float | tuple[float, float] | None = None,
         max_power_filter: float | tuple[float, float] | None = None,
         correction_threshold: float | tuple[float, float] | None = None,
+        n_workers: int | None = None,
     ) -> None:
         """
         Pre-process the run-specific data settings for each simulation, then fit and apply the
@@ -215,6 +249,10 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
                 scada energy data should be corrected. When :py:attr:`UQ` is True, then this should be a
                 tuple of the lower and upper limits of this threshold, otherwise a single value should
                 be used. Defaults to (0.85, 0.95)
+            n_workers(:obj:`int` | :obj:`None`): The number of worker processes to split the Monte
+                Carlo iterations across. When provided, each iteration draws from its own random
+                stream, so the results are reproducible for any number of workers. ``None`` runs
+                the iterations serially. Defaults to ``None``.
         """
         initial_parameters = {}
         if num_sim is not None:
@@ -240,19 +278,23 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
             initial_parameters["correction_threshold"] = self.correction_threshold
             self.correction_threshold = correction_threshold
 
+        self._sampler, iteration_seed = random_streams(self.seed)
         self.setup_inputs()
         logger.info("Running the long term gross energy analysis")
 
         # Loop through number of simulations, store TIE results
-        for i in tqdm(np.arange(self.num_sim)):
-            self._run = self._inputs.loc[i]
-
-            self.filter_turbine_data()  # Filter turbine data
-            self.setup_daily_reanalysis_data()  # Setup daily reanalysis products
-            self.filter_sum_impute_scada()  # Setup daily scada data
-            self.setupturbine_model_dict()  # Setup daily data to be fit using the GAM
-            self.fit_model()  # Fit daily turbine energy to atmospheric data
-            self.apply_model(i)  # Apply fitting result to long-term reanalysis data
+        seeds = iteration_seeds(self.num_sim, iteration_seed, n_workers)
+        if seeds is None:
+            for i in tqdm(np.arange(self.num_sim)):
+                self._run_iteration(i, self._sampler)
+        else:
+            run_iterations(
+                self,
+                "_run_iteration",
+                seeds,
+                1 if n_workers is None else n_workers,
+                result_attributes=("plant_gross",),
+            )
 
         # Log the completion of the run
         logger.info("Run completed")
@@ -260,6 +302,24 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         # Reset the class arguments back to the initialized values
         self.set_values(initial_parameters)
 
+    def _run_iteration(self, i: int, sampler: RandomSampler) -> None:
+        """
+        Runs a single iteration of the Monte Carlo simulation.
+
+        Args:
+            i(:obj:`int`): The Monte Carlo iteration number.
+            sampler(:obj:`RandomSampler`): The sampler for the iteration's random draws, which are
+                all made up front in :py:meth:`setup_inputs` for this analysis.
+        """
+        self._run = self._inputs.loc[i]
+
+        self.filter_turbine_data()  # Filter turbine data
+        self.setup_daily_reanalysis_data()  # Setup daily reanalysis products
+        self.filter_sum_impute_scada()  # Setup daily scada data
+        self.setupturbine_model_dict()  # Setup daily data to be fit using the GAM
+        self.fit_model()  # Fit daily turbine energy to atmospheric data
+        self.apply_model(i)  # Apply fitting result to long-term reanalysis data
+
     def setup_inputs(self) -> None:
         """
         Create and populate the data frame defining the simulation parameters.
@@ -270,21 +330,23 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
                 np.repeat(self.reanalysis_products, self.num_sim)
             )  # Create extra long list of renanalysis product names to sample from
             inputs = {
-                "reanalysis_product": np.asarray(random.sample(reanal_list, self.num_sim)),
-                "scada_data_fraction": np.random.normal(1, self.uncertainty_scada, self.num_sim),
-                "wind_bin_thresh": np.random.randint(
+                "reanalysis_product": np.asarray(self._sampler.sample(reanal_list, self.num_sim)),
+                "scada_data_fraction": self._sampler.normal(
+                    1, self.uncertainty_scada, self.num_sim
+                ),
+                "wind_bin_thresh": self._sampler.integers(
                     self.wind_bin_threshold[0] * 100,
                     self.wind_bin_threshold[1] * 100,
                     self.num_sim,
                 )
                 / 100.0,
-                "max_power_filter": np.random.randint(
+                "max_power_filter": self._sampler.integers(
                     self.max_power_filter[0] * 100,
                     self.max_power_filter[1] * 100,
                     self.num_sim,
                 )
                 / 100.0,
-                "correction_threshold": np.random.randint(
+                "correction_threshold": self._sampler.integers(
                     self.correction_threshold[0] * 100,
                     self.correction_threshold[1] * 100,
                     self.num_sim,
@@ -314,6 +376,10 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         df = self.plant.scada.copy()
         dic = self.scada_dict
 
+        # Any cached stage results are no longer valid for the newly sorted data
+        self.stage_cache.clear()
+        self.basis_cache.clear()
+
         # Loop through turbine IDs
         for t in self.turbine_ids:
             # Store relevant variables in dictionary
@@ -335,54 +401,62 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
          4. Flags power values less than 2% of turbine capacity when wind speed above cut-in
          5. Flags windspeed and power values that don't mutually coincide within a reasonable range
          6. Combine the flags using an "or" combination to be a new column in scada: "flag_final"
+
+        The final flags are cached in :py:attr:`stage_cache` for each combination of the wind bin
+        threshold and maximum power filter.
         """
+        key = ("filter_turbine_data", self._run.wind_bin_thresh, self._run.max_power_filter)
+        if (flag_final := self.stage_cache.get(key)) is None:
+            flag_final = self._flag_turbine_data()
+            self.stage_cache.put(key, flag_final)
 
-        dic = self.scada_dict
+        # Split the final flags back out to each turbine's data
+        start = 0
+        for t in self.turbine_ids:
+            end = start + self.scada_dict[t].shape[0]
+            self.scada_dict[t].loc[:, "flag_final"] = flag_final[start:end]
+            start = end
 
-        # Loop through turbines
+    def _flag_turbine_data(self) -> np.ndarray:
+        """Computes the final flags of :py:meth:`filter_turbine_data` for all of the turbines.
+
+        Returns:
+            :obj:`numpy.ndarray`: The final flags of each turbine's data, in the order of
+                :py:attr:`turbine_ids`.
+        """
+        # Drop any data where scada wind speed or energy is NaN
         for t in self.turbine_ids:
-            scada_df = self.scada_dict[t]
-            turbine_capacity = self.plant.asset.loc[t, "rated_power"]
-
-            max_bin = (
-                self._run.max_power_filter * turbine_capacity
-            )  # Set maximum range for using bin-filter
-
-            scada_df.dropna(
-                subset=["WMET_HorWdSpd", "WTUR_SupWh"], inplace=True
-            )  # Drop any data where scada wind speed or energy is NaN
-
-            scada_df = scada_df.assign(
-                flag_neg=filters.range_flag(scada_df.WTUR_W, lower=0, upper=scada_df.WTUR_W.max()),
-                flag_range=filters.range_flag(scada_df.WMET_HorWdSpd, lower=0, upper=40),
-                flag_frozen=filters.unresponsive_flag(scada_df.WMET_HorWdSpd, threshold=3),
-                flag_window=filters.window_range_flag(
-                    window_col=dic[t].loc[:, "WMET_HorWdSpd"],
-                    window_start=5.0,
-                    window_end=40,
-                    value_col=dic[t].loc[:, "WTUR_W"],
-                    value_min=0.02 * turbine_capacity,
-                    value_max=1.2 * turbine_capacity,
-                ),
-                flag_bin=filters.bin_filter(
-                    bin_col=dic[t].loc[:, "WTUR_W"],
-                    value_col=dic[t].loc[:, "WMET_HorWdSpd"],
-                    bin_width=0.06 * turbine_capacity,
-                    threshold=self._run.wind_bin_thresh,
-                    center_type="median",
-                    bin_min=np.round(0.01 * turbine_capacity),
-                    bin_max=np.round(max_bin),
-                    threshold_type="std",
-                    direction="all",
-                ),
-            )
-            # Create a 'final' flag which is true if any of the previous flags are true
-            self.scada_dict[t].loc[:, "flag_final"] = (
-                scada_df.flag_range
-                | scada_df.flag_window
-                | scada_df.flag_bin
-                | scada_df.flag_frozen
-            )
+            self.scada_dict[t].dropna(subset=["WMET_HorWdSpd", "WTUR_SupWh"], inplace=True)
+
+        # Filter all of the turbines in a single pass, using each turbine's own capacity
+        scada_df = pd.concat([self.scada_dict[t] for t in self.turbine_ids])
+        turbine_capacity = self.plant.asset.loc[self.turbine_ids, "rated_power"]
+        max_bin = self._run.max_power_filter * turbine_capacity  # Maximum range for the bin-filter
+
+        flag_range = filters.grouped_range_flag(scada_df.WMET_HorWdSpd, lower=0, upper=40)
+        flag_frozen = filters.grouped_unresponsive_flag(scada_df.WMET_HorWdSpd, threshold=3)
+        flag_window = filters.grouped_window_range_flag(
+            window_col=scada_df.WMET_HorWdSpd,
+            window_start=5.0,
+            window_end=40,
+            value_col=scada_df.WTUR_W,
+            value_min=0.02 * turbine_capacity,
+            value_max=1.2 * turbine_capacity,
+        )
+        flag_bin = filters.grouped_bin_filter(
+            bin_col=scada_df.WTUR_W,
+            value_col=scada_df.WMET_HorWdSpd,
+            bin_width=0.06 * turbine_capacity,
+            threshold=self._run.wind_bin_thresh,
+            center_type="median",
+            bin_min=np.round(0.01 * turbine_capacity),
+            bin_max=np.round(max_bin),
+            threshold_type="std",
+            direction="all",
+        )
+
+        # Create a 'final' flag which is true if any of the previous flags are true
+        return (flag_range | flag_window | flag_bin | flag_frozen).to_numpy()
 
     @logged_method_call
     def setup_daily_reanalysis_data(self) -> None:
@@ -420,9 +494,20 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         energy based on amount of missing data and a threshold limit. Finally impute missing data for each turbine
         based on reported energy data from other highly correlated turbines.
         threshold
+
+        The imputed daily SCADA data are cached in :py:attr:`stage_cache` for each combination of
+        the wind bin threshold, maximum power filter, and correction threshold.
         """
+        key = (
+            "filter_sum_impute_scada",
+            self._run.wind_bin_thresh,
+            self._run.max_power_filter,
+            self._run.correction_threshold,
+        )
+        if (scada_valid := self.stage_cache.get(key)) is not None:
+            self.scada_valid = scada_valid
+            return
 
-        scada = self.scada_dict
         expected_count = (
             HOURS_PER_DAY
             * MINUTES_PER_HOUR
@@ -430,52 +515,62 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         )
         num_thres = self._run.correction_threshold * expected_count  # Allowable reported timesteps
 
-        self.scada_valid = pd.DataFrame()
-
-        # Loop through turbines
-        for t in self.turbine_ids:
-            scada_filt = scada[t].loc[~scada[t]["flag_final"]]  # Filter for valid data
-            # Calculate daily energy sum
-            scada_daily = (
-                scada_filt.groupby([pd.Grouper(freq="D", level="time")])["WTUR_SupWh"]
-                .sum()
-                .to_frame()
-            )
-
-            # Count number of entries in sum
-            scada_daily["data_count"] = (
-                scada_filt.groupby([pd.Grouper(freq="D", level="time")])["WTUR_SupWh"]
-                .count()
-                .to_frame()
-            )
-            scada_daily["percent_nan"] = (
-                scada_filt.groupby([pd.Grouper(freq="D", level="time")])["WTUR_SupWh"]
-                .apply(ts.percent_nan)
-                .to_frame()
-            )
+        # Gather the energy data of all turbines with the day and turbine of each value
+        day = pd.Timedelta(days=1)
+        first_day = self.por_start.floor("D")
+        n_days = (self.por_end.floor("D") - first_day) // day + 1
+        n_turbines = len(self.turbine_ids)
+        frames = [self.scada_dict[t] for t in self.turbine_ids]
+        valid = ~np.concatenate([df["flag_final"].to_numpy(dtype=bool) for df in frames])
+        energy = np.concatenate([df["WTUR_SupWh"].to_numpy(dtype=float) for df in frames])[valid]
+        days = np.concatenate(
+            [(df.index.get_level_values("time").floor("D") - first_day) // day for df in frames]
+        )[valid]
+        turbine = np.repeat(np.arange(n_turbines), [df.shape[0] for df in frames])[valid]
+
+        # Calculate the daily energy sum, the number of entries in the sum, and the percent of
+        # missing data, for all turbines and days at once
+        group = turbine * n_days + days
+        is_nan = np.isnan(energy)
+        size = np.bincount(group, minlength=n_turbines * n_days)
+        data_count = size - np.bincount(group, weights=is_nan, minlength=size.size)
+        energy_sum = np.bincount(group, weights=np.where(is_nan, 0, energy), minlength=size.size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent_nan = np.where(size > 0, 1 - data_count / size, 1.0)
 
             # Correct energy for missing data
-            scada_daily["energy_corrected"] = (
-                scada_daily["WTUR_SupWh"] * expected_count / scada_daily["data_count"]
-            )
-
-            # Discard daily sums if less than 140 data counts (90% reported data)
-            scada_daily = scada_daily.loc[scada_daily["data_count"] >= num_thres]
-
-            # Create temporary data frame that is gap filled and to be used for imputing
-            temp_df = pd.DataFrame(
-                index=pd.date_range(self.por_start, self.por_end, freq="D", name="time")
-            )
-            temp_df["energy_corrected"] = scada_daily["energy_corrected"]
-            temp_df["percent_nan"] = scada_daily["percent_nan"]
-            temp_df["asset_id"] = np.repeat(t, temp_df.shape[0])
-            temp_df["day"] = temp_df.index
-
-            # Append turbine data into single data frame for imputing
-            self.scada_valid = pd.concat([self.scada_valid, temp_df], axis=0)
-
-        # Reset index after all turbines has been combined
-        self.scada_valid = self.scada_valid.set_index("asset_id", append=True)
+            energy_corrected = energy_sum * expected_count / data_count
+
+        # Discard daily sums if less than 140 data counts (90% reported data)
+        keep = data_count >= num_thres
+        energy_corrected = np.where(keep, energy_corrected, np.nan).reshape(n_turbines, n_days)
+        percent_nan = np.where(keep, percent_nan, np.nan).reshape(n_turbines, n_days)
+
+        # Create the gap filled data frame of every turbine and day to be used for imputing, where
+        # only the days of the period of record that fall at midnight have daily sums
+        time = pd.date_range(self.por_start, self.por_end, freq="D", name="time")
+        time_day = (time.floor("D") - first_day) // day
+        ix_day = np.flatnonzero(time == time.floor("D"))
+        energy_grid = np.full((n_turbines, time.size), np.nan)
+        energy_grid[:, ix_day] = energy_corrected[:, time_day[ix_day]]
+        percent_nan_grid = np.full((n_turbines, time.size), np.nan)
+        percent_nan_grid[:, ix_day] = percent_nan[:, time_day[ix_day]]
+
+        index = pd.MultiIndex.from_arrays(
+            [
+                np.tile(time, n_turbines),
+                np.repeat(np.asarray(self.turbine_ids, dtype=object), time.size),
+            ],
+            names=["time", "asset_id"],
+        )
+        self.scada_valid = pd.DataFrame(
+            {
+                "energy_corrected": energy_grid.ravel(),
+                "percent_nan": percent_nan_grid.ravel(),
+                "day": np.tile(time, n_turbines),
+            },
+            index=index,
+        )
 
         # Impute missing days for each turbine - provides progress bar
         self.scada_valid["energy_imputed"] = imputing.impute_all_assets_by_correlation(
@@ -486,6 +581,7 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
 
         # Drop data that could not be imputed
         self.scada_valid.dropna(subset=["energy_imputed"], inplace=True)
+        self.stage_cache.put(key, self.scada_valid)
 
     @logged_method_call
     def setupturbine_model_dict(self) -> None:
@@ -502,25 +598,39 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
     @logged_method_call
     def fit_model(self) -> None:
         """Fit the daily turbine energy sum and atmospheric variable averages using a GAM model
-        using wind speed, wind direction, and air density.
+        using wind speed, wind direction, and air density. The turbines with data on the same days
+        share the same features, so their models are fit together.
+
+        The spline basis of the daily reanalysis data is cached in :py:attr:`basis_cache` for each
+        reanalysis product and set of edge knots, and is shared by the fits and their application
+        to the long-term reanalysis data in :py:meth:`apply_model`.
         """
 
         mod_dict = self.turbine_model_dict
-        mod_results = self._model_results
+        mod_results = {}
 
+        # Group the turbines by the days of their data
+        turbine_groups = {}
         for t in self.turbine_ids:  # Loop throuh turbines
             df = mod_dict[t]
 
             # Add Monte-Carlo sampled uncertainty to SCADA data
             df["energy_imputed"] = df["energy_imputed"] * self._run.scada_data_fraction
+            turbine_groups.setdefault(df.index.asi8.tobytes(), []).append(t)
+
+        for turbines in turbine_groups.values():
+            df = mod_dict[turbines[0]]
 
             # Consider wind speed, wind direction, and air density as features
-            mod_results[t] = functions.gam_3param(
+            mod_results[tuple(turbines)] = functions.gam_3param_batch(
                 windspeed_col="WMETR_HorWdSpd",
                 wind_direction_col="WMETR_HorWdDir",
                 air_density_col="WMETR_AirDen",
-                power_col="energy_imputed",
+                power=np.column_stack([mod_dict[t]["energy_imputed"] for t in turbines]),
                 data=df,
+                basis_cache=self.basis_cache,
+                basis_key=self._run.reanalysis_product,
+                basis_data=self.daily_reanalysis,
             )
         self._model_results = mod_results
 
@@ -532,7 +642,6 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         Args:
             i(:obj:`int`): The Monte Carlo iteration number.
         """
-        turb_gross = self.turb_lt_gross
         mod_results = self._model_results
 
         # Create a data frame to store final results
@@ -541,14 +650,14 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         )
 
         daily_reanalysis = self.daily_reanalysis
-        turb_gross = pd.DataFrame(index=daily_reanalysis.index)
-
-        # Loop through the turbines and apply the GAM to the reanalysis data
-        for t in self.turbine_ids:  # Loop through turbines
-            turb_gross.loc[:, t] = mod_results[t](
-                daily_reanalysis["WMETR_HorWdSpd"],
-                daily_reanalysis["WMETR_HorWdDir"],
-                daily_reanalysis["WMETR_AirDen"],
+        turb_gross = pd.DataFrame(
+            index=daily_reanalysis.index, columns=list(self.turbine_ids), dtype=float
+        )
+
+        # Apply the GAM of each group of turbines to the reanalysis data
+        for turbines, model in mod_results.items():
+            turb_gross.loc[:, list(turbines)] = model(
+                "WMETR_HorWdSpd", "WMETR_HorWdDir", "WMETR_AirDen", data=daily_reanalysis
             )
 
         turb_gross[turb_gross < 0] = 0
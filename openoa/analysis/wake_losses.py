@@ -30,8 +30,7 @@
 
 from __future__ import annotations
 
-import random
-import itertools
+import warnings
 from copy import deepcopy
 from typing import Callable
 
@@ -49,6 +48,12 @@ from openoa.utils import plot, filters, power_curve
 from openoa.utils import met_data_processing as met
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
+from openoa.analysis._parallel import (
+    RandomSampler,
+    random_streams,
+    run_iterations,
+    iteration_seeds,
+)
 from openoa.analysis._analysis_validators import (
     validate_UQ_input,
     validate_half_closed_0_1_right,
@@ -60,6 +65,102 @@ NDArrayFloat = npt.NDArray[np.float64]
 plot.set_styling()
 
 
+def _reduce_freestream(values: np.ndarray, method: str) -> np.ndarray:
+    """Reduces the freestream turbine values of each time period, ignoring NaN values.
+
+    Args:
+        values (np.ndarray): The (time periods x freestream turbines) array of values.
+        method (str): One of "mean", "median", or "max".
+
+    Returns:
+        np.ndarray: The reduced value of each time period, which is NaN for time periods without
+            any valid values.
+    """
+    reduce = {"mean": np.nanmean, "median": np.nanmedian, "max": np.nanmax}[method]
+    if values.shape[0] == 0:
+        return np.empty(0)
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return reduce(values, axis=1)
+
+
+def _wind_direction_sector_index(
+    wind_direction: np.ndarray, sector_wds: list[float], wd_bin_width: float
+) -> np.ndarray:
+    """Finds the index of the freestream wind direction sector of each time period. Each sector
+    starts half a wind direction bin before its wind direction and ends half a bin before the
+    wind direction of the next sector, and the last sector wraps around to the first.
+
+    Args:
+        wind_direction (np.ndarray): The wind direction of each time period, in degrees.
+        sector_wds (list[float]): The increasing starting wind direction bin of each sector.
+        wd_bin_width (float): The width of the wind direction bins, in degrees.
+
+    Returns:
+        np.ndarray: The sector index of each time period.
+    """
+    sector_edges = np.asarray(sector_wds) - 0.5 * wd_bin_width
+    sector_index = np.searchsorted(sector_edges, wind_direction, side="right") - 1
+    sector_index[sector_index < 0] = len(sector_wds) - 1
+
+    # Periods within half a bin below 360 degrees belong to the sector starting at 0 degrees,
+    # if there is one, and otherwise to the last sector
+    wrapped = wind_direction >= 360.0 - 0.5 * wd_bin_width
+    sector_index[wrapped] = 0 if sector_wds[0] == 0.0 else len(sector_wds) - 1
+    return sector_index
+
+
+def _weighted_bin_sums(
+    bins: np.ndarray, weights: np.ndarray, values: np.ndarray, num_bins: int
+) -> np.ndarray:
+    """Sums the weighted values of each column by bin, ignoring NaN values.
+
+    Args:
+        bins (np.ndarray): The bin index of each row of :py:attr:`values`.
+        weights (np.ndarray): The weight of each row of :py:attr:`values`.
+        values (np.ndarray): The (rows x columns) array of values.
+        num_bins (int): The number of bins.
+
+    Returns:
+        np.ndarray: The (bins x columns) array of weighted sums, which is NaN for empty bins.
+    """
+    weighted = np.nan_to_num(weights[:, None] * values)
+    sums = np.stack(
+        [np.bincount(bins, weights=col, minlength=num_bins) for col in weighted.T], axis=1
+    ).astype(float, copy=False)
+    sums[np.bincount(bins, minlength=num_bins) == 0] = np.nan
+    return sums
+
+
+def _weighted_hourly_mean(
+    hours: pd.DatetimeIndex, weights: np.ndarray, values: np.ndarray
+) -> np.ndarray:
+    """Calculates the weighted mean of each column of values by hour, ignoring NaN values.
+
+    Args:
+        hours (pd.DatetimeIndex): The hour of each row of :py:attr:`values`.
+        weights (np.ndarray): The weight of each row of :py:attr:`values`.
+        values (np.ndarray): The (rows x columns) array of values.
+
+    Returns:
+        np.ndarray: The (sorted unique hours x columns) array of weighted means, which is NaN for
+            hours without valid values.
+    """
+    if hours.size == 0:
+        return np.empty((0, values.shape[1]))
+
+    order = np.argsort(hours.asi8, kind="stable")
+    hours = hours.asi8[order]
+    starts = np.flatnonzero(np.r_[True, hours[1:] != hours[:-1]])
+    values = values[order]
+    valid = ~np.isnan(values)
+    weights = np.where(valid, weights[order, None], 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.add.reduceat(np.where(valid, weights * values, 0.0), starts) / np.add.reduceat(
+            weights, starts
+        )
+
+
 @define(auto_attribs=True)
 class WakeLosses(FromDictMixin, ResetValuesMixin):
     """
@@ -242,6 +343,11 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         bin_count_thresh_lin_reg (int, optional): The minimum number of samples required in a wind
             speed bin to include when finding linear regression from SCADA freestream wind speeds to
             reanalysis wind speeds. Defaults to 50.
+        seed (int | numpy.random.SeedSequence | numpy.random.Generator, optional): The seed for
+            all random sampling of the analysis. The Monte Carlo inputs and each iteration draw
+            from independent streams spawned from the seed, so an integer or SeedSequence
+            reproduces the same results on every run, and a Generator is advanced by each run. If
+            None, the global NumPy and Python random states are used. Defaults to None.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -291,12 +397,20 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
     no_wakes_ws_thresh_LT_corr: float = field(default=13.0)
     min_ws_bin_lin_reg: float = field(default=3.0)
     bin_count_thresh_lin_reg: int = field(default=50, validator=attrs.validators.instance_of(int))
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None,
+        validator=attrs.validators.instance_of(
+            (int, np.integer, np.random.SeedSequence, np.random.Generator, type(None))
+        ),
+    )
 
     # Internally created attributes need to be given a type before usage
     turbine_ids: list[str] = field(init=False)
     aggregate_df: pd.DataFrame = field(init=False)
     inputs: pd.DataFrame = field(init=False)
-    aggregate_df_sample: pd.DataFrame = field(init=False)
+    _por_rows: np.ndarray = field(init=False)
+    _por_weights: np.ndarray = field(init=False)
+    _por_values: np.ndarray = field(init=False)
     power_curve_func: Callable = field(init=False)
     wake_losses_por: NDArrayFloat = field(init=False)
     turbine_wake_losses_por: NDArrayFloat = field(init=False)
@@ -323,6 +437,7 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
     wake_losses_por_std: float = field(init=False)
     turbine_wake_losses_por_std: float = field(init=False)
     _run: pd.DataFrame = field(init=False)
+    _sampler: RandomSampler = field(factory=RandomSampler, init=False)
     run_parameters: list[str] = field(
         init=False,
         default=[
@@ -439,6 +554,7 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         no_wakes_ws_thresh_LT_corr: float | None = None,
         min_ws_bin_lin_reg: float | None = None,
         bin_count_thresh_lin_reg: int | None = None,
+        n_workers: int | None = None,
     ):
         """
         Estimates wake losses by comparing wind plant energy production to energy production of the
@@ -538,6 +654,10 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
             bin_count_thresh_lin_reg (int, optional): The minimum number of samples required in a
                 wind speed bin to include when finding linear regression from SCADA freestream wind
                 speeds to reanalysis wind speeds. Defaults to 50.
+            n_workers (int, optional): The number of worker processes to split the Monte Carlo
+                iterations across when :py:attr:`UQ` = True. When provided, each iteration draws from
+                its own random stream, so the results are reproducible for any number of workers.
+                None runs the iterations serially. Defaults to None.
         """
         initial_parameters = {}
         # Assign default parameter values depending on whether UQ is performed
@@ -608,379 +728,54 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
             self.bin_count_thresh_lin_reg = bin_count_thresh_lin_reg
 
         # Set up Monte Carlo simulation inputs if UQ = True or single simulation inputs if UQ = False.
+        self._sampler, iteration_seed = random_streams(self.seed)
         self._setup_monte_carlo_inputs()
 
-        for n in tqdm(range(self.num_sim)):
-            self._run = self.inputs.loc[n].copy()
-
-            # Estimate periods when each turbine is unavailable, derated, or curtailed, based on power curve filtering
-            # and when the turbine's measured wind speed is abnormal.
-            for t in self.turbine_ids:
-                self.aggregate_df[("derate_flag", t)] = False
-                self.aggregate_df[("abnormal_ws_flag", t)] = False
-
-            if self.correct_for_derating:
-                self._identify_derating()
-
-            # Randomly resample 10-minute periods for bootstrapping
-            if self.UQ:
-                self.aggregate_df_sample = self.aggregate_df.sample(frac=1.0, replace=True)
-            else:
-                self.aggregate_df_sample = self.aggregate_df.copy()
-
-            # For a set of wind direction bins, identify freestream turbines and calculate mean energy production and
-            # wind speed
-            self.aggregate_df_sample["power_mean_freestream"] = np.nan
-            self.aggregate_df_sample["windspeed_mean_freestream"] = np.nan
-
-            wd_bins = np.arange(0.0, 360.0, self.wd_bin_width)
-
-            # Create columns for turbine power and wind speed during normal operation (NaN otherwise)
-            for t in self.turbine_ids:
-                valid_inds = ~self.aggregate_df_sample[("derate_flag", t)]
-                self.aggregate_df_sample.loc[valid_inds, ("power_normal", t)] = (
-                    self.aggregate_df_sample.loc[valid_inds, ("WTUR_W", t)]
-                )
-                valid_inds = ~self.aggregate_df_sample[("abnormal_ws_flag", t)]
-                self.aggregate_df_sample.loc[valid_inds, ("windspeed_normal", t)] = (
-                    self.aggregate_df_sample.loc[valid_inds, ("WMET_HorWdSpd", t)]
-                )
-
-            if self.correct_for_ws_heterogeneity:
-                # Create a representative power curve model for the turbines in the plant
-                self.power_curve_func = power_curve.IEC(
-                    self.aggregate_df_sample.loc[:, "windspeed_normal"].stack(future_stack=True),
-                    self.aggregate_df_sample.loc[:, "power_normal"].stack(future_stack=True),
-                    windspeed_end=100.0,
-                    interpolate=True,
-                )
-
-                # Create column for speedup factor during normal operation (NaN otherwise)
-                for t in self.turbine_ids:
-                    valid_inds = ~self.aggregate_df_sample[("abnormal_ws_flag", t)]
-                    self.aggregate_df_sample.loc[valid_inds, ("speedup_factor_normal", t)] = (
-                        self.aggregate_df_sample.loc[valid_inds, ("speedup_factor", t)]
-                    )
-
-                # Initialize columns for estimated freestream wind speeds and powers
-                new_cols = ["windspeed_freestream_estimate", "power_freestream_estimate"]
-                self.aggregate_df_sample[list(itertools.product(new_cols, self.turbine_ids))] = (
-                    np.nan
-                )
-
-            # Find freestream turbines for each wind direction. Update the dictionary only when the set of turbines
-            # differs from the previous wind direction bin.
-            freestream_turbine_dict = {}
-            freestream_turbine_ids_prev = []
-
-            for wd in wd_bins:
-                # identify freestream turbines
-                freestream_turbine_ids = self.plant.get_freestream_turbines(
-                    wd, sector_width=self._run.freestream_sector_width
-                )
-
-                if freestream_turbine_ids != freestream_turbine_ids_prev:
-                    freestream_turbine_dict[wd] = freestream_turbine_ids
-                    freestream_turbine_ids_prev = freestream_turbine_ids
-
-            if freestream_turbine_dict[0.0] == list(freestream_turbine_dict.values())[-1]:
-                freestream_turbine_dict.pop(0.0)
-
-            # Find freestream energy production for each wind direction sector containing the same freestream turbines
-            freestream_sector_wds = list(freestream_turbine_dict.keys())
-
-            for i_wd, wd in enumerate(freestream_sector_wds):
-                freestream_turbine_ids = freestream_turbine_dict[wd]
-
-                # if UQ is enabled, randomly resample set of freestream turbines
-                if self.UQ:
-                    freestream_turbine_ids = random.choices(
-                        freestream_turbine_ids, k=len(freestream_turbine_ids)
-                    )
-
-                # Check whether last wind direction in dictionary and handle wind direction wrapping
-                # between 0 and 360 degrees
-                _agg_wd = self.aggregate_df_sample["wind_direction_ref"]
-                if wd == 0.0:
-                    wd_bin_flag = _agg_wd >= 360.0 - 0.5 * self.wd_bin_width
-                    wd_bin_flag |= _agg_wd < (
-                        freestream_sector_wds[i_wd + 1] - 0.5 * self.wd_bin_width
-                    )
-                elif i_wd < len(freestream_sector_wds) - 1:
-                    wd_bin_flag = _agg_wd >= (wd - 0.5 * self.wd_bin_width)
-                    wd_bin_flag &= _agg_wd < (
-                        freestream_sector_wds[i_wd + 1] - 0.5 * self.wd_bin_width
-                    )
-                elif (i_wd == len(freestream_sector_wds) - 1) & (freestream_sector_wds[0] == 0.0):
-                    wd_bin_flag = _agg_wd >= (wd - 0.5 * self.wd_bin_width)
-                    wd_bin_flag &= _agg_wd < (360.0 - 0.5 * self.wd_bin_width)
-                else:  # last wind direction in dictionary and first wind direction is not zero:
-                    wd_bin_flag = _agg_wd >= (wd - 0.5 * self.wd_bin_width)
-                    wd_bin_flag |= _agg_wd < (freestream_sector_wds[0] - 0.5 * self.wd_bin_width)
-
-                # Assign representative energy and wind speed of freestream turbines. If correct_for_derating
-                # is True, only freestream turbines operating normally will be considered.
-                _power = self.aggregate_df_sample.loc[wd_bin_flag, "power_normal"]
-                if self.freestream_power_method == "mean":
-                    _power = _power[freestream_turbine_ids].mean(axis=1)
-                elif self.freestream_power_method == "median":
-                    _power = _power[freestream_turbine_ids].median(axis=1)
-                elif self.freestream_power_method == "max":
-                    _power = _power[freestream_turbine_ids].max(axis=1)
-                self.aggregate_df_sample.loc[wd_bin_flag, "power_mean_freestream"] = _power.values
-
-                _ws = self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_normal"]
-                if self.freestream_wind_speed_method == "mean":
-                    _ws = _ws[freestream_turbine_ids].mean(axis=1)
-                elif self.freestream_wind_speed_method == "median":
-                    _ws = _ws[freestream_turbine_ids].median(axis=1)
-                self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_mean_freestream"] = _ws.values
-
-                if self.correct_for_ws_heterogeneity:
-                    # Estimate expected wind speed at each turbine location based on speedup
-                    # factors and wind speeds at normally operating freestream wind turbines.
-                    _mean_speedup_factor = self.aggregate_df_sample.loc[
-                        wd_bin_flag, "speedup_factor_normal"
-                    ]
-                    _mean_speedup_factor = _mean_speedup_factor[freestream_turbine_ids].mean(axis=1)
-                    self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_freestream_estimate"] = (
-                        self.aggregate_df_sample.loc[wd_bin_flag, "speedup_factor"]
-                        .mul(_ws.values / _mean_speedup_factor.values, axis=0)
-                        .values
-                    )
-
-                    # Correct mean freestream wind speed to represent mean freestream wind speed
-                    # over all turbines in the plant based on speedup factors of unwaked turbines
-                    self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_mean_freestream"] = (
-                        self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_mean_freestream"]
-                        / _mean_speedup_factor
-                    ).values
-
-                    # Interpolate power curve to estimate potential freestream power
-                    self.aggregate_df_sample.loc[wd_bin_flag, "power_freestream_estimate"] = (
-                        self.power_curve_func(
-                            self.aggregate_df_sample.loc[
-                                wd_bin_flag, "windspeed_freestream_estimate"
-                            ]
-                        )
-                    )
-
-                    # Get mean estimated freestream power of normally operating unwaked turbines
-                    _valid_inds = ~self.aggregate_df_sample.loc[wd_bin_flag, "derate_flag"]
-                    _valid_inds = _valid_inds[freestream_turbine_ids]
-                    _power_freestream_estimate = self.aggregate_df_sample.loc[
-                        wd_bin_flag, "power_freestream_estimate"
-                    ]
-                    self.aggregate_df_sample.loc[wd_bin_flag, "power_mean_freestream_estimate"] = (
-                        (_valid_inds * _power_freestream_estimate[freestream_turbine_ids]).sum(
-                            axis=1
-                        )
-                        / _valid_inds.sum(axis=1)
-                    ).values
-
-            # Remove rows where no freestream turbines in normal operation were identified
-            self.aggregate_df_sample = self.aggregate_df_sample.dropna(
-                subset=[("power_mean_freestream", ""), ("windspeed_mean_freestream", "")]
-            )
-
-            # Calculate total plant-level wake losses during period of record
-
-            # Determine ideal wind plant energy, correcting for derated turbines if correct_for_derating is True. If
-            # correct_for_derating is True, ideal energy is calculated as the sum of the power produced by derated
-            # turbines and the mean power produced by freestream turbines operating normally multiplied by the total
-            # number of turbines operating normally. If correcting for wind speed heterogeneity, the ideal power of
-            # the normally operating turbines is given by scaling the mean power of the normally operating freestream
-            # turbines by a correction factor determined using the estimated power variations across the wind plant
-            # from the provided wind speed speedup factors.
-            total_derated_turbine_power = (
-                self.aggregate_df_sample["WTUR_W"] * self.aggregate_df_sample["derate_flag"]
-            ).sum(axis=1)
-
-            if self.correct_for_ws_heterogeneity:
-                # Indices where mean measured power and the mean estimated freestream power of all
-                # turbines are greater than zero, and mean estimated freestream power is
-                # sufficiently large (treated as greater than 1 kW), allowing valid potential power
-                # corrections.
-                valid_ix = self.aggregate_df_sample["power_mean_freestream"] > 0
-                valid_ix &= (
-                    ~self.aggregate_df_sample["derate_flag"]
-                    * self.aggregate_df_sample["power_freestream_estimate"]
-                ).sum(axis=1) > 0
-                valid_ix &= self.aggregate_df_sample["power_mean_freestream_estimate"] > 1.0
-
-                total_potential_freestream_power = (
-                    self.aggregate_df_sample["power_mean_freestream"]
-                    * (
-                        ~self.aggregate_df_sample["derate_flag"]
-                        * self.aggregate_df_sample["power_freestream_estimate"]
-                    ).sum(axis=1)
-                    / self.aggregate_df_sample["power_mean_freestream_estimate"]
-                )
-
-                # For invalid indices, use measured power of freestream turbines
-                total_potential_freestream_power.loc[~valid_ix] = self.aggregate_df_sample.loc[
-                    ~valid_ix, "power_mean_freestream"
-                ] * (~self.aggregate_df_sample.loc[~valid_ix, "derate_flag"]).sum(axis=1)
-
-                # Check for corrected potential power values greater than the maximum possible
-                # output of number of normally operating turbines
-                plant_power_max = self.aggregate_df_sample["WTUR_W"].max().max() * (
-                    ~self.aggregate_df_sample["derate_flag"]
-                ).sum(axis=1)
-                total_potential_freestream_power.loc[
-                    total_potential_freestream_power > plant_power_max
-                ] = plant_power_max.loc[total_potential_freestream_power > plant_power_max]
-            else:
-                total_potential_freestream_power = self.aggregate_df_sample[
-                    "power_mean_freestream"
-                ] * (~self.aggregate_df_sample["derate_flag"]).sum(axis=1)
-
-            # Assign total potential power
-            self.aggregate_df_sample["potential_plant_power"] = (
-                total_potential_freestream_power + total_derated_turbine_power
-            )
-
-            # Assign actual total power produced by wind plant
-            self.aggregate_df_sample["actual_plant_power"] = self.aggregate_df_sample["WTUR_W"].sum(
-                axis=1
-            )
-
-            wake_losses_por = (
-                1
-                - self.aggregate_df_sample["actual_plant_power"].sum()
-                / self.aggregate_df_sample["potential_plant_power"].sum()
-            )
-
-            # bin wake losses by wind direction
-            # group wind farm efficiency by wind direction bin
-            self.aggregate_df_sample["wind_direction_bin"] = (
-                self.wd_bin_width_LT_corr
-                * (
-                    self.aggregate_df_sample["wind_direction_ref"] / self.wd_bin_width_LT_corr
-                ).round()
-            )
-            self.aggregate_df_sample.loc[
-                self.aggregate_df_sample["wind_direction_bin"] == 360.0, "wind_direction_bin"
-            ] = 0.0
-
-            # Calculate turbine-level wake losses during period of record
-            turbine_wake_losses_por = len(self.turbine_ids) * [0.0]
-            for i, t in enumerate(self.turbine_ids):
-                # Determine ideal turbine energy as sum of the power produced by the turbine when it
-                # is derated and the mean power produced by all freestream turbines when the turbine
-                # is operating normally
-
-                valid_inds = ~self.aggregate_df_sample[("derate_flag", t)]
-                if self.correct_for_ws_heterogeneity:
-                    # Indices where mean measured power and the mean estimated freestream power of all
-                    # turbines are greater than zero, and mean estimated freestream power is
-                    # sufficiently large (treated as greater than 1 kW times the number of normally
-                    # operating freestream turbines), allowing valid potential power corrections.
-                    valid_inds_freestream_power = (
-                        (self.aggregate_df_sample["power_mean_freestream"] > 0)
-                        & (self.aggregate_df_sample[("power_freestream_estimate", t)] > 0)
-                        & (self.aggregate_df_sample["power_mean_freestream_estimate"] > 1.0)
-                    )
-
-                    self.aggregate_df_sample.loc[valid_inds, ("potential_turbine_power", t)] = (
-                        self.aggregate_df_sample.loc[valid_inds, "power_mean_freestream"]
-                        * self.aggregate_df_sample.loc[valid_inds, ("power_freestream_estimate", t)]
-                        / self.aggregate_df_sample.loc[valid_inds, "power_mean_freestream_estimate"]
-                    )
-
-                    # For indices with insufficiently high freestream power, use measured power of freestream turbines
-                    self.aggregate_df_sample.loc[
-                        valid_inds & ~valid_inds_freestream_power, ("potential_turbine_power", t)
-                    ] = self.aggregate_df_sample.loc[
-                        valid_inds & ~valid_inds_freestream_power, "power_mean_freestream"
-                    ]
-
-                    # Check for corrected potential power values greater than the maximum possible
-                    turbine_power_max = self.aggregate_df_sample.loc[
-                        valid_inds, ("WTUR_W", t)
-                    ].max()
-                    self.aggregate_df_sample.loc[
-                        self.aggregate_df_sample[("potential_turbine_power", t)]
-                        > turbine_power_max,
-                        ("potential_turbine_power", t),
-                    ] = turbine_power_max
-                else:
-                    self.aggregate_df_sample.loc[valid_inds, ("potential_turbine_power", t)] = (
-                        self.aggregate_df_sample.loc[valid_inds, "power_mean_freestream"]
-                    )
-
-                self.aggregate_df_sample.loc[~valid_inds, ("potential_turbine_power", t)] = (
-                    self.aggregate_df_sample.loc[~valid_inds, ("WTUR_W", t)]
-                )
-                turbine_wake_losses_por[i] = (
-                    1
-                    - self.aggregate_df_sample[("WTUR_W", t)].sum()
-                    / self.aggregate_df_sample[("potential_turbine_power", t)].sum()
-                )
-
-            df_wd_bin = self.aggregate_df_sample.groupby("wind_direction_bin").sum()
-
-            index = np.arange(0.0, 360.0, self.wd_bin_width_LT_corr)
-            df_wd_bin = df_wd_bin.reindex(index)
-
-            # Save plant and turbine-level wake losses binned by wind direction
-            wake_losses_por_wd = (
-                df_wd_bin["actual_plant_power"] / df_wd_bin["potential_plant_power"]
-            ).values
-
-            turbine_wake_losses_por_wd = np.empty(
-                [len(self.turbine_ids), int(360.0 / self.wd_bin_width_LT_corr)]
+        seeds = iteration_seeds(self.num_sim, iteration_seed, n_workers)
+        if seeds is None or not self.UQ:
+            for n in tqdm(range(self.num_sim)):
+                results = self._run_iteration(n, self._sampler)
+        else:
+            run_iterations(
+                self,
+                "_run_iteration",
+                seeds,
+                1 if n_workers is None else n_workers,
+                result_attributes=(
+                    "wake_losses_por",
+                    "turbine_wake_losses_por",
+                    "wake_losses_por_wd",
+                    "turbine_wake_losses_por_wd",
+                    "energy_por_wd",
+                    "wake_losses_lt",
+                    "turbine_wake_losses_lt",
+                    "wake_losses_lt_wd",
+                    "turbine_wake_losses_lt_wd",
+                    "energy_lt_wd",
+                    "wake_losses_por_ws",
+                    "turbine_wake_losses_por_ws",
+                    "energy_por_ws",
+                    "wake_losses_lt_ws",
+                    "turbine_wake_losses_lt_ws",
+                    "energy_lt_ws",
+                ),
             )
-            for i, t in enumerate(self.turbine_ids):
-                turbine_wake_losses_por_wd[i, :] = (
-                    df_wd_bin[("WTUR_W", t)] / df_wd_bin[("potential_turbine_power", t)]
-                ).values
-
-            if self.UQ:
-                self.wake_losses_por[n] = wake_losses_por
-                self.turbine_wake_losses_por[n, :] = turbine_wake_losses_por
-                self.wake_losses_por_wd[n, :] = wake_losses_por_wd
-                self.turbine_wake_losses_por_wd[n, :, :] = turbine_wake_losses_por_wd
-                self.energy_por_wd[n, :] = (
-                    df_wd_bin["actual_plant_power"].values / df_wd_bin["actual_plant_power"].sum()
-                )
-
-                # apply long-term correction to wake losses
-                (
-                    wake_losses_lt,
-                    turbine_wake_losses_lt,
-                    wake_losses_lt_wd,
-                    turbine_wake_losses_lt_wd,
-                    energy_lt_wd,
-                    wake_losses_por_ws,
-                    turbine_wake_losses_por_ws,
-                    energy_por_ws,
-                    wake_losses_lt_ws,
-                    turbine_wake_losses_lt_ws,
-                    energy_lt_ws,
-                ) = self._apply_LT_correction()
-
-                self.wake_losses_lt[n] = wake_losses_lt
-                self.turbine_wake_losses_lt[n, :] = turbine_wake_losses_lt
-                self.wake_losses_lt_wd[n, :] = wake_losses_lt_wd
-                self.turbine_wake_losses_lt_wd[n, :, :] = turbine_wake_losses_lt_wd
-                self.energy_lt_wd[n, :] = energy_lt_wd
-                self.wake_losses_por_ws[n, :] = wake_losses_por_ws
-                self.turbine_wake_losses_por_ws[n, :, :] = turbine_wake_losses_por_ws
-                self.energy_por_ws[n, :] = energy_por_ws
-                self.wake_losses_lt_ws[n, :] = wake_losses_lt_ws
-                self.turbine_wake_losses_lt_ws[n, :, :] = turbine_wake_losses_lt_ws
-                self.energy_lt_ws[n, :] = energy_lt_ws
 
         if not self.UQ:
+            (
+                wake_losses_por,
+                turbine_wake_losses_por,
+                wake_losses_por_wd,
+                turbine_wake_losses_por_wd,
+                energy_por_wd,
+            ) = results
+
             # apply long-term correction to wake losses and average results over all reanalysis products
             self.wake_losses_por = wake_losses_por
             self.turbine_wake_losses_por = turbine_wake_losses_por
             self.wake_losses_por_wd = wake_losses_por_wd
             self.turbine_wake_losses_por_wd = turbine_wake_losses_por_wd
-            self.energy_por_wd = (
-                df_wd_bin["actual_plant_power"].values / df_wd_bin["actual_plant_power"].sum()
-            )
+            self.energy_por_wd = energy_por_wd
 
             wake_losses_lt_all_products = np.empty([len(self.reanalysis_products), 1])
             turbine_wake_losses_lt_all_products = np.empty(
@@ -1095,6 +890,350 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
 
         self.set_values(initial_parameters)
 
+    def _run_iteration(self, n: int, sampler: RandomSampler) -> tuple | None:
+        """
+        Runs a single iteration of the Monte Carlo simulation. When :py:attr:`UQ` = True, the
+        results are stored in the Monte Carlo result arrays, otherwise the period of record wake
+        losses are returned to be long-term corrected for each reanalysis product.
+
+        Args:
+            n(:obj:`int`): The Monte Carlo iteration number.
+            sampler(:obj:`RandomSampler`): The sampler for the iteration's random draws.
+
+        Returns:
+            tuple | None: The plant-level, turbine-level, plant-level by wind direction, and
+            turbine-level by wind direction period of record wake losses, and the normalized
+            energy production by wind direction bin, when :py:attr:`UQ` = False.
+        """
+        self._run = self.inputs.loc[n].copy()
+
+        # Estimate periods when each turbine is unavailable, derated, or curtailed, based on power curve filtering
+        # and when the turbine's measured wind speed is abnormal.
+        for t in self.turbine_ids:
+            self.aggregate_df[("derate_flag", t)] = False
+            self.aggregate_df[("abnormal_ws_flag", t)] = False
+
+        if self.correct_for_derating:
+            self._identify_derating()
+
+        # Randomly resample 10-minute periods for bootstrapping. Rather than copying the resampled
+        # data, each unique period is evaluated once and weighted by the number of times it is drawn
+        num_rows = self.aggregate_df.shape[0]
+        if self.UQ:
+            sample = sampler.bootstrap(num_rows)
+            weights = np.bincount(sample, minlength=num_rows)
+            rows = np.flatnonzero(weights)
+            weights = weights[rows].astype(np.float64)
+        else:
+            sample = rows = np.arange(num_rows)
+            weights = np.ones(num_rows)
+
+        def turbine_values(col: str, dtype: type = np.float64) -> np.ndarray:
+            return self.aggregate_df[col][self.turbine_ids].to_numpy(dtype=dtype)[rows]
+
+        power = turbine_values("WTUR_W")
+        derate_flag = turbine_values("derate_flag", bool)
+        abnormal_ws_flag = turbine_values("abnormal_ws_flag", bool)
+        wind_direction = self.aggregate_df[("wind_direction_ref", "")].to_numpy()[rows]
+
+        # Turbine power and wind speed during normal operation (NaN otherwise)
+        power_normal = np.where(derate_flag, np.nan, power)
+        windspeed_normal = np.where(abnormal_ws_flag, np.nan, turbine_values("WMET_HorWdSpd"))
+
+        # For a set of wind direction bins, identify freestream turbines and calculate mean energy production and
+        # wind speed
+        wd_bins = np.arange(0.0, 360.0, self.wd_bin_width)
+
+        if self.correct_for_ws_heterogeneity:
+            # Create a representative power curve model for the turbines in the plant from the
+            # resampled data
+            ix_sample = np.searchsorted(rows, sample)
+            self.power_curve_func = power_curve.IEC(
+                pd.Series(windspeed_normal[ix_sample].ravel()),
+                pd.Series(power_normal[ix_sample].ravel()),
+                windspeed_end=100.0,
+                interpolate=True,
+            )
+            del ix_sample
+
+            # Speedup factors, and those during normal operation (NaN otherwise)
+            speedup_factor = turbine_values("speedup_factor")
+            speedup_factor_normal = np.where(abnormal_ws_flag, np.nan, speedup_factor)
+
+        # Find freestream turbines for each wind direction. Update the dictionary only when the set of turbines
+        # differs from the previous wind direction bin.
+        freestream_mask = self.plant.get_freestream_turbine_mask(
+            wd_bins, sector_width=self._run.freestream_sector_width
+        )
+        freestream_turbine_dict = {}
+        freestream_mask_prev = np.zeros(len(self.turbine_ids), dtype=bool)
+
+        for wd, mask in zip(wd_bins, freestream_mask):
+            if (mask != freestream_mask_prev).any():
+                freestream_turbine_dict[wd] = list(np.asarray(self.turbine_ids)[mask])
+                freestream_mask_prev = mask
+
+        if freestream_turbine_dict[0.0] == list(freestream_turbine_dict.values())[-1]:
+            freestream_turbine_dict.pop(0.0)
+
+        # Find freestream energy production for each wind direction sector containing the same
+        # freestream turbines. Each period is assigned the index of its sector, and the columns of
+        # the sector's freestream turbines are gathered into a (time, freestream turbine) array
+        # that is padded with NaN, so all sectors are reduced in a single pass.
+        freestream_sector_wds = list(freestream_turbine_dict.keys())
+        sector_index = _wind_direction_sector_index(
+            wind_direction, freestream_sector_wds, self.wd_bin_width
+        )
+        turbine_index = {t: i for i, t in enumerate(self.turbine_ids)}
+        num_turbines = len(self.turbine_ids)
+
+        sector_turbines = np.full(
+            (len(freestream_sector_wds), max(map(len, freestream_turbine_dict.values()))),
+            num_turbines,
+        )
+        for i_wd, wd in enumerate(freestream_sector_wds):
+            freestream_turbine_ids = freestream_turbine_dict[wd]
+
+            # if UQ is enabled, randomly resample set of freestream turbines
+            if self.UQ:
+                freestream_turbine_ids = sampler.choices(
+                    freestream_turbine_ids, k=len(freestream_turbine_ids)
+                )
+            sector_turbines[i_wd, : len(freestream_turbine_ids)] = [
+                turbine_index[t] for t in freestream_turbine_ids
+            ]
+        freestream_columns = sector_turbines[sector_index]
+        time_index = np.arange(rows.size)[:, None]
+
+        def freestream_values(values: np.ndarray, fill: float = np.nan) -> np.ndarray:
+            padded = np.hstack([values, np.full((values.shape[0], 1), fill, dtype=values.dtype)])
+            return padded[time_index, freestream_columns]
+
+        # Assign representative energy and wind speed of freestream turbines. If correct_for_derating
+        # is True, only freestream turbines operating normally will be considered.
+        power_mean_freestream = _reduce_freestream(
+            freestream_values(power_normal), self.freestream_power_method
+        )
+        windspeed_mean_freestream = _reduce_freestream(
+            freestream_values(windspeed_normal), self.freestream_wind_speed_method
+        )
+
+        if self.correct_for_ws_heterogeneity:
+            # Estimate expected wind speed at each turbine location based on speedup
+            # factors and wind speeds at normally operating freestream wind turbines.
+            _mean_speedup_factor = _reduce_freestream(
+                freestream_values(speedup_factor_normal), "mean"
+            )
+            windspeed_freestream_estimate = speedup_factor * (
+                windspeed_mean_freestream / _mean_speedup_factor
+            ).reshape(-1, 1)
+
+            # Correct mean freestream wind speed to represent mean freestream wind speed
+            # over all turbines in the plant based on speedup factors of unwaked turbines
+            windspeed_mean_freestream /= _mean_speedup_factor
+
+            # Interpolate power curve to estimate potential freestream power
+            power_freestream_estimate = self.power_curve_func(windspeed_freestream_estimate)
+
+            # Get mean estimated freestream power of normally operating unwaked turbines
+            _valid_inds = freestream_values(~derate_flag, False)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                power_mean_freestream_estimate = np.nansum(
+                    _valid_inds * freestream_values(power_freestream_estimate), axis=1
+                ) / _valid_inds.sum(axis=1)
+
+        # Remove periods where no freestream turbines in normal operation were identified
+        keep = ~np.isnan(power_mean_freestream) & ~np.isnan(windspeed_mean_freestream)
+        rows = rows[keep]
+        weights = weights[keep]
+        power = power[keep]
+        derate_flag = derate_flag[keep]
+        wind_direction = wind_direction[keep]
+        power_mean_freestream = power_mean_freestream[keep]
+        windspeed_mean_freestream = windspeed_mean_freestream[keep]
+        if self.correct_for_ws_heterogeneity:
+            power_freestream_estimate = power_freestream_estimate[keep]
+            power_mean_freestream_estimate = power_mean_freestream_estimate[keep]
+        del power_normal, windspeed_normal, keep
+        num_normal = (~derate_flag).sum(axis=1)
+
+        # Calculate total plant-level wake losses during period of record
+
+        # Determine ideal wind plant energy, correcting for derated turbines if correct_for_derating is True. If
+        # correct_for_derating is True, ideal energy is calculated as the sum of the power produced by derated
+        # turbines and the mean power produced by freestream turbines operating normally multiplied by the total
+        # number of turbines operating normally. If correcting for wind speed heterogeneity, the ideal power of
+        # the normally operating turbines is given by scaling the mean power of the normally operating freestream
+        # turbines by a correction factor determined using the estimated power variations across the wind plant
+        # from the provided wind speed speedup factors.
+        total_derated_turbine_power = np.nansum(power * derate_flag, axis=1)
+
+        if self.correct_for_ws_heterogeneity:
+            # Indices where mean measured power and the mean estimated freestream power of all
+            # turbines are greater than zero, and mean estimated freestream power is
+            # sufficiently large (treated as greater than 1 kW), allowing valid potential power
+            # corrections.
+            normal_power_freestream_estimate = np.nansum(
+                ~derate_flag * power_freestream_estimate, axis=1
+            )
+            valid_ix = power_mean_freestream > 0
+            valid_ix &= normal_power_freestream_estimate > 0
+            valid_ix &= power_mean_freestream_estimate > 1.0
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                total_potential_freestream_power = (
+                    power_mean_freestream
+                    * normal_power_freestream_estimate
+                    / power_mean_freestream_estimate
+                )
+
+            # For invalid indices, use measured power of freestream turbines
+            total_potential_freestream_power[~valid_ix] = (
+                power_mean_freestream[~valid_ix] * num_normal[~valid_ix]
+            )
+
+            # Check for corrected potential power values greater than the maximum possible
+            # output of number of normally operating turbines
+            plant_power_max = np.full(rows.size, np.nan)
+            if rows.size > 0:
+                plant_power_max = np.nanmax(power) * num_normal
+            ix_max = total_potential_freestream_power > plant_power_max
+            total_potential_freestream_power[ix_max] = plant_power_max[ix_max]
+        else:
+            total_potential_freestream_power = power_mean_freestream * num_normal
+
+        # Total potential power and actual total power produced by wind plant
+        potential_plant_power = total_potential_freestream_power + total_derated_turbine_power
+        actual_plant_power = np.nansum(power, axis=1)
+
+        wake_losses_por = 1 - np.nansum(weights * actual_plant_power) / np.nansum(
+            weights * potential_plant_power
+        )
+
+        # Calculate turbine-level wake losses during period of record. Determine ideal turbine
+        # energy as sum of the power produced by the turbine when it is derated and the mean power
+        # produced by all freestream turbines when the turbine is operating normally
+        valid_inds = ~derate_flag
+        if self.correct_for_ws_heterogeneity:
+            # Indices where mean measured power and the mean estimated freestream power of all
+            # turbines are greater than zero, and mean estimated freestream power is
+            # sufficiently large (treated as greater than 1 kW times the number of normally
+            # operating freestream turbines), allowing valid potential power corrections.
+            valid_inds_freestream_power = (
+                (power_mean_freestream > 0)[:, None]
+                & (power_freestream_estimate > 0)
+                & (power_mean_freestream_estimate > 1.0)[:, None]
+            )
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                potential_turbine_power = (
+                    power_mean_freestream[:, None]
+                    * power_freestream_estimate
+                    / power_mean_freestream_estimate[:, None]
+                )
+
+            # For indices with insufficiently high freestream power, use measured power of freestream turbines
+            potential_turbine_power = np.where(
+                valid_inds_freestream_power,
+                potential_turbine_power,
+                power_mean_freestream[:, None],
+            )
+
+            # Check for corrected potential power values greater than the maximum possible
+            turbine_power_max = np.full(len(self.turbine_ids), np.nan)
+            if rows.size > 0:
+                turbine_power_max = np.fmax.reduce(np.where(valid_inds, power, np.nan), axis=0)
+            potential_turbine_power = np.where(
+                potential_turbine_power > turbine_power_max,
+                turbine_power_max,
+                potential_turbine_power,
+            )
+        else:
+            potential_turbine_power = np.broadcast_to(power_mean_freestream[:, None], power.shape)
+        potential_turbine_power = np.where(valid_inds, potential_turbine_power, power)
+
+        turbine_wake_losses_por = list(
+            1
+            - np.nansum(weights[:, None] * power, axis=0)
+            / np.nansum(weights[:, None] * potential_turbine_power, axis=0)
+        )
+
+        # Save plant and turbine-level wake losses and energy binned by wind direction
+        num_wd_bins = int(360.0 / self.wd_bin_width_LT_corr)
+        wd_bin = np.round(wind_direction / self.wd_bin_width_LT_corr).astype(int) % num_wd_bins
+        with np.errstate(invalid="ignore", divide="ignore"):
+            wd_bin_sums = _weighted_bin_sums(
+                wd_bin,
+                weights,
+                np.column_stack([actual_plant_power, potential_plant_power]),
+                num_wd_bins,
+            )
+            wake_losses_por_wd = wd_bin_sums[:, 0] / wd_bin_sums[:, 1]
+            energy_por_wd = wd_bin_sums[:, 0] / np.nansum(wd_bin_sums[:, 0])
+
+            turbine_wd_bin_sums = _weighted_bin_sums(
+                wd_bin, weights, np.hstack([power, potential_turbine_power]), num_wd_bins
+            )
+            turbine_wake_losses_por_wd = (
+                turbine_wd_bin_sums[:, :num_turbines] / turbine_wd_bin_sums[:, num_turbines:]
+            ).T
+
+        # Store the bootstrapped period of record data needed for the long-term correction
+        self._por_rows = rows
+        self._por_weights = weights
+        self._por_values = np.column_stack(
+            [
+                wind_direction,
+                windspeed_mean_freestream,
+                actual_plant_power,
+                potential_plant_power,
+                power,
+                potential_turbine_power,
+            ]
+        )
+
+        if self.UQ:
+            self.wake_losses_por[n] = wake_losses_por
+            self.turbine_wake_losses_por[n, :] = turbine_wake_losses_por
+            self.wake_losses_por_wd[n, :] = wake_losses_por_wd
+            self.turbine_wake_losses_por_wd[n, :, :] = turbine_wake_losses_por_wd
+            self.energy_por_wd[n, :] = energy_por_wd
+
+            # apply long-term correction to wake losses
+            (
+                wake_losses_lt,
+                turbine_wake_losses_lt,
+                wake_losses_lt_wd,
+                turbine_wake_losses_lt_wd,
+                energy_lt_wd,
+                wake_losses_por_ws,
+                turbine_wake_losses_por_ws,
+                energy_por_ws,
+                wake_losses_lt_ws,
+                turbine_wake_losses_lt_ws,
+                energy_lt_ws,
+            ) = self._apply_LT_correction()
+
+            self.wake_losses_lt[n] = wake_losses_lt
+            self.turbine_wake_losses_lt[n, :] = turbine_wake_losses_lt
+            self.wake_losses_lt_wd[n, :] = wake_losses_lt_wd
+            self.turbine_wake_losses_lt_wd[n, :, :] = turbine_wake_losses_lt_wd
+            self.energy_lt_wd[n, :] = energy_lt_wd
+            self.wake_losses_por_ws[n, :] = wake_losses_por_ws
+            self.turbine_wake_losses_por_ws[n, :, :] = turbine_wake_losses_por_ws
+            self.energy_por_ws[n, :] = energy_por_ws
+            self.wake_losses_lt_ws[n, :] = wake_losses_lt_ws
+            self.turbine_wake_losses_lt_ws[n, :, :] = turbine_wake_losses_lt_ws
+            self.energy_lt_ws[n, :] = energy_lt_ws
+        else:
+            return (
+                wake_losses_por,
+                turbine_wake_losses_por,
+                wake_losses_por_wd,
+                turbine_wake_losses_por_wd,
+                energy_por_wd,
+            )
+
     @logged_method_call
     def _setup_monte_carlo_inputs(self):
         """
@@ -1104,28 +1243,30 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
 
         if self.UQ:
             inputs = {
-                "reanalysis_product": random.choices(self.reanalysis_products, k=self.num_sim),
-                "freestream_sector_width": np.random.randint(
+                "reanalysis_product": self._sampler.choices(
+                    self.reanalysis_products, k=self.num_sim
+                ),
+                "freestream_sector_width": self._sampler.integers(
                     self.freestream_sector_width[0],
                     self.freestream_sector_width[1] + 1,
                     self.num_sim,
                 ),
-                "wind_bin_mad_thresh": np.random.randint(
+                "wind_bin_mad_thresh": self._sampler.integers(
                     self.wind_bin_mad_thresh[0], self.wind_bin_mad_thresh[1] + 1, self.num_sim
                 ),
-                "derating_filter_wind_speed_start": np.random.randint(
+                "derating_filter_wind_speed_start": self._sampler.integers(
                     self.derating_filter_wind_speed_start[0] * 10,
                     self.derating_filter_wind_speed_start[1] * 10 + 1,
                     self.num_sim,
                 )
                 / 10.0,
-                "max_power_filter": np.random.randint(
+                "max_power_filter": self._sampler.integers(
                     self.max_power_filter[0] * 100,
                     self.max_power_filter[1] * 100 + 1,
                     self.num_sim,
                 )
                 / 100.0,
-                "num_years_LT": np.random.randint(
+                "num_years_LT": self._sampler.integers(
                     self.num_years_LT[0], self.num_years_LT[1] + 1, self.num_sim
                 ),
             }
@@ -1312,67 +1453,63 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         power curve filtering. A derated flag is then added to the aggregate data frame for each turbine.
         """
 
-        for t in self.turbine_ids:
-            # Apply window range filter to flag samples for which wind speed is greater than a threshold and power is
-            # below 1% of rated power
-
-            turb_capac = self.plant.asset.loc[t, "rated_power"]
-
-            flag_window = filters.window_range_flag(
-                window_col=self.aggregate_df[("WMET_HorWdSpd", t)],
-                window_start=self._run.derating_filter_wind_speed_start,
-                window_end=40,
-                value_col=self.aggregate_df[("WTUR_W", t)],
-                value_min=0.01 * turb_capac,
-                value_max=1.2 * turb_capac,
-            )
+        # Filter all of the turbines in a single pass by stacking their data in (time, asset_id) order
+        turbine_capacity = self.plant.asset.loc[self.turbine_ids, "rated_power"]
+        windspeed, power = (
+            self.aggregate_df[col][self.turbine_ids]
+            .rename_axis(columns="asset_id")
+            .stack(future_stack=True)
+            for col in ("WMET_HorWdSpd", "WTUR_W")
+        )
 
-            # Apply bin-based filter to flag samples for which wind speed is greater than a threshold from the median
-            # wind speed in each power bin
-            bin_width_frac = 0.04 * (
-                self._run.max_power_filter - 0.01
-            )  # split into 25 bins TODO: make this an optional argument?
-            flag_bin = filters.bin_filter(
-                bin_col=self.aggregate_df[("WTUR_W", t)],
-                value_col=self.aggregate_df[("WMET_HorWdSpd", t)],
-                bin_width=bin_width_frac * turb_capac,
-                threshold=self._run.wind_bin_mad_thresh,  # wind bin thresh
-                center_type="median",
-                bin_min=0.01 * turb_capac,
-                bin_max=self._run.max_power_filter * turb_capac,
-                threshold_type="mad",
-                direction="above",
+        def unstack(flag: pd.Series) -> np.ndarray:
+            """Returns the stacked flags to the (time, turbine) layout of :py:attr:`aggregate_df`."""
+            flag = flag.unstack("asset_id").reindex(
+                index=self.aggregate_df.index, columns=self.turbine_ids
             )
+            return flag.to_numpy()
+
+        # Apply window range filter to flag samples for which wind speed is greater than a threshold and power is
+        # below 1% of rated power
+        flag_window = filters.grouped_window_range_flag(
+            window_col=windspeed,
+            window_start=self._run.derating_filter_wind_speed_start,
+            window_end=40,
+            value_col=power,
+            value_min=0.01 * turbine_capacity,
+            value_max=1.2 * turbine_capacity,
+        )
 
-            self.aggregate_df[("derate_flag", t)] = (
-                self.aggregate_df[("derate_flag", t)] | flag_window | flag_bin
-            )
+        # Apply bin-based filter to flag samples for which wind speed is greater than a threshold from the median
+        # wind speed in each power bin
+        bin_width_frac = 0.04 * (
+            self._run.max_power_filter - 0.01
+        )  # split into 25 bins TODO: make this an optional argument?
+        bin_kwargs = dict(
+            bin_col=power,
+            value_col=windspeed,
+            bin_width=bin_width_frac * turbine_capacity,
+            threshold=self._run.wind_bin_mad_thresh,  # wind bin thresh
+            center_type="median",
+            bin_min=0.01 * turbine_capacity,
+            bin_max=self._run.max_power_filter * turbine_capacity,
+            threshold_type="mad",
+        )
+        flag_bin = filters.grouped_bin_filter(direction="above", **bin_kwargs)
 
-            # Apply bin-based filter to flag samples for which wind speed is less than a threshold from the median
-            # wind speed in each power bin, which likely indicates a faulty wind speed measurement
-            bin_width_frac = 0.04 * (
-                self._run.max_power_filter - 0.01
-            )  # split into 25 bins TODO: make this an optional argument?
-            flag_bin = filters.bin_filter(
-                bin_col=self.aggregate_df[("WTUR_W", t)],
-                value_col=self.aggregate_df[("WMET_HorWdSpd", t)],
-                bin_width=bin_width_frac * turb_capac,
-                threshold=self._run.wind_bin_mad_thresh,  # wind bin thresh
-                center_type="median",
-                bin_min=0.01 * turb_capac,
-                bin_max=self._run.max_power_filter * turb_capac,
-                threshold_type="mad",
-                direction="below",
-            )
+        derate_cols = [("derate_flag", t) for t in self.turbine_ids]
+        derate_flag = self.aggregate_df[derate_cols].to_numpy() | unstack(flag_window | flag_bin)
+        self.aggregate_df[derate_cols] = derate_flag
 
-            self.aggregate_df[("abnormal_ws_flag", t)] = (
-                self.aggregate_df[("abnormal_ws_flag", t)] | flag_bin
-            )
+        # Apply bin-based filter to flag samples for which wind speed is less than a threshold from the median
+        # wind speed in each power bin, which likely indicates a faulty wind speed measurement
+        flag_bin = filters.grouped_bin_filter(direction="below", **bin_kwargs)
 
-            # Classify the wind speed as abnormal if it is either faulty or corresponding to a derated period
-            self.aggregate_df[("abnormal_ws_flag", t)] = (
-                self.aggregate_df[("abnormal_ws_flag", t)] | self.aggregate_df[("derate_flag", t)]
-            )
+        # Classify the wind speed as abnormal if it is either faulty or corresponding to a derated period
+        abnormal_cols = [("abnormal_ws_flag", t) for t in self.turbine_ids]
+        self.aggregate_df[abnormal_cols] = (
+            self.aggregate_df[abnormal_cols].to_numpy() | unstack(flag_bin) | derate_flag
+        )
 
     @logged_method_call
     def _apply_LT_correction(self):
@@ -1387,20 +1524,28 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
                 turbine-level wake losses as well as the normalized wind plant energy production
                 binned by wind direction
         """
-        # First, create hourly data frame for LT correction to match resolution of reanalysis data
-        df_1hr = self.aggregate_df_sample[
-            [
-                ("wind_direction_ref", ""),
-                ("windspeed_mean_freestream", ""),
-                ("actual_plant_power", ""),
-                ("potential_plant_power", ""),
-            ]
-            + [("WTUR_W", t) for t in self.turbine_ids]
-            + [("potential_turbine_power", t) for t in self.turbine_ids]
-            + [(f"WMETR_HorWdSpd_{self._run.reanalysis_product}", "")]
-        ].copy()
-
-        df_1hr = df_1hr.resample("h").mean().dropna(how="any")
+        # First, create hourly data frame for LT correction to match resolution of reanalysis data.
+        # Each bootstrapped 10-minute period is weighted by the number of times it was sampled.
+        reanalysis_col = (f"WMETR_HorWdSpd_{self._run.reanalysis_product}", "")
+        values = np.column_stack(
+            [self._por_values, self.aggregate_df[reanalysis_col].to_numpy()[self._por_rows]]
+        )
+        hours = self.aggregate_df.index[self._por_rows].floor("h")
+        df_1hr = pd.DataFrame(
+            _weighted_hourly_mean(hours, self._por_weights, values),
+            index=hours.unique().sort_values(),
+            columns=pd.MultiIndex.from_tuples(
+                [
+                    ("wind_direction_ref", ""),
+                    ("windspeed_mean_freestream", ""),
+                    ("actual_plant_power", ""),
+                    ("potential_plant_power", ""),
+                ]
+                + [("WTUR_W", t) for t in self.turbine_ids]
+                + [("potential_turbine_power", t) for t in self.turbine_ids]
+                + [reanalysis_col]
+            ),
+        ).dropna(how="any")
 
         df_1hr["windspeed_mean_freestream_bin"] = df_1hr["windspeed_mean_freestream"].round()
 
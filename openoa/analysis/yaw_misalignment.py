@@ -48,6 +48,12 @@ from openoa.plant import PlantData
 from openoa.utils import plot, filters
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
+from openoa.analysis._parallel import (
+    RandomSampler,
+    random_streams,
+    run_iterations,
+    iteration_seeds,
+)
 from openoa.analysis._analysis_validators import validate_UQ_input, validate_half_closed_0_1_right
 
 logger = logging.getLogger(__name__)
@@ -70,6 +76,105 @@ def cos_curve(x, A, Offset, cos_exp):
     return A * np.cos((np.pi / 180) * (x - Offset)) ** cos_exp
 
 
+def fit_cos_curves(
+    x: NDArrayFloat,
+    y: NDArrayFloat,
+    p0: NDArrayFloat | None = None,
+    max_iter: int = 200,
+    tol: float = 1.49012e-08,
+) -> NDArrayFloat:
+    """Fits :py:func:`cos_curve` to each of a batch of curves at once using a vectorized
+    Levenberg-Marquardt solver with the analytic Jacobian of the cosine exponent curve, which
+    converges to the same least squares fits as fitting each curve with
+    :py:func:`scipy.optimize.curve_fit`.
+
+    Args:
+        x (:obj:`numpy.ndarray`): The wind vane angles shared by all of the curves, in degrees.
+        y (:obj:`numpy.ndarray`): The values of each curve at :py:attr:`x`, with :py:attr:`x` along
+            the last axis, where NaN values are excluded from the fit.
+        p0 (:obj:`numpy.ndarray`, optional): The initial amplitude, offset, and exponent of each
+            curve, along the last axis. Defaults to None, which uses the maximum of each curve, 0,
+            and 2, respectively.
+        max_iter (:obj:`int`, optional): The maximum number of iterations. Defaults to 200.
+        tol (:obj:`float`, optional): The relative tolerance of the reduction in the sum of
+            squares and of the parameter steps for convergence. Defaults to 1.49012e-08.
+
+    Returns:
+        :obj:`numpy.ndarray`: The amplitude, offset, and exponent of each curve, along the last
+            axis, which are NaN for curves with fewer than three values.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    shape = y.shape[:-1]
+    y = y.reshape(-1, x.size)
+    valid = ~np.isnan(y)
+    y = np.where(valid, y, 0.0)
+
+    if p0 is None:
+        p0 = np.zeros((y.shape[0], 3))
+        p0[:, 0] = np.where(valid, y, -np.inf).max(axis=1)
+        p0[:, 2] = 2.0
+    params = np.array(np.broadcast_to(np.reshape(p0, (-1, 3)), (y.shape[0], 3)), dtype=float)
+
+    def residuals(p: NDArrayFloat, ix: np.ndarray) -> tuple[NDArrayFloat, NDArrayFloat]:
+        """Computes the residuals and their negative Jacobian for the curves :py:attr:`ix`."""
+        A, offset, exp = (p[:, [j]] for j in range(3))
+        theta = (np.pi / 180) * (x - offset)
+        cos = np.cos(theta)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cos_n = cos**exp
+            jac = np.stack(
+                [
+                    cos_n,
+                    A * exp * cos ** (exp - 1) * np.sin(theta) * (np.pi / 180),
+                    A * cos_n * np.log(cos),
+                ],
+                axis=-1,
+            )
+        mask = valid[ix]
+        return np.where(mask, y[ix] - A * cos_n, 0.0), np.where(mask[..., None], jac, 0.0)
+
+    # Iterate the curves that have enough values to fit and have not converged
+    active = np.flatnonzero(valid.sum(axis=1) >= 3)
+    r, jac = residuals(params[active], active)
+    cost = np.full(y.shape[0], np.nan)
+    cost[active] = np.square(r).sum(axis=1)
+    r_all = np.zeros(y.shape)
+    jac_all = np.zeros(y.shape + (3,))
+    r_all[active], jac_all[active] = r, jac
+    damping = np.full(y.shape[0], 1e-3)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        r, jac = r_all[active], jac_all[active]
+        jtj = np.einsum("kmi,kmj->kij", jac, jac)
+        jtr = np.einsum("kmi,km->ki", jac, r)
+        diag = np.einsum("kii->ki", jtj)
+        lhs = jtj + damping[active, None, None] * (diag[:, :, None] * np.eye(3))
+        step = np.einsum("kij,kj->ki", np.linalg.pinv(lhs), jtr)
+
+        trial = params[active] + step
+        r_trial, jac_trial = residuals(trial, active)
+        cost_trial = np.square(r_trial).sum(axis=1)
+        improved = np.isfinite(cost_trial) & (cost_trial < cost[active])
+
+        # Accept the improved steps and relax their damping, otherwise increase the damping
+        ix = active[improved]
+        converged = improved & (
+            (cost[active] - cost_trial <= tol * cost[active])
+            | np.all(np.abs(step) <= tol * (np.abs(trial) + tol), axis=1)
+        )
+        params[ix] = trial[improved]
+        cost[ix] = cost_trial[improved]
+        r_all[ix], jac_all[ix] = r_trial[improved], jac_trial[improved]
+        damping[active] = np.where(improved, damping[active] / 10, damping[active] * 10)
+        stalled = damping[active] > 1e16
+        active = active[~(converged | stalled)]
+
+    params[~(valid.sum(axis=1) >= 3)] = np.nan
+    return params.reshape(shape + (3,))
+
+
 @define(auto_attribs=True)
 class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
     """
@@ -155,6 +260,22 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
         use_power_coeff (bool, optional): If True, power performance as a function of wind vane
             angle will be quantified by normalizing power by the cube of the wind speed,
             approximating the power coefficient. If False, only power will be used. Defaults to False.
+        seed (int | numpy.random.SeedSequence | numpy.random.Generator, optional): The seed for
+            all random sampling of the analysis. The Monte Carlo inputs and each iteration draw
+            from independent streams spawned from the seed, so an integer or SeedSequence
+            reproduces the same results on every run, and a Generator is advanced by each run. If
+            None, the global NumPy random state is used. Defaults to None.
+        batch_fit (bool, optional): If True, the power performance of every turbine, wind speed
+            bin, and Monte Carlo iteration is binned by wind vane angle with NumPy, and all of the
+            cosine curves are fit at once with :py:func:`fit_cos_curves` after the iterations. If
+            False, each cosine curve is fit separately with :py:func:`scipy.optimize.curve_fit`.
+            Defaults to False.
+        binned_bootstrap (bool, optional): If True, the filtered data of each turbine and wind
+            speed bin are binned by wind vane angle once for each combination of the power curve
+            filter parameters, and each Monte Carlo iteration bootstraps the binned statistics
+            instead of the data: the number of samples in each wind vane bin are drawn from a
+            multinomial distribution, and the bin means from the normal distribution of the mean
+            of that many samples. Implies :py:attr:`batch_fit`. Defaults to False.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -184,6 +305,14 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
         default=(4.0, 10.0), validator=validate_UQ_input
     )
     use_power_coeff: bool = field(default=False, validator=attrs.validators.instance_of(bool))
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None,
+        validator=attrs.validators.instance_of(
+            (int, np.integer, np.random.SeedSequence, np.random.Generator, type(None))
+        ),
+    )
+    batch_fit: bool = field(default=False, validator=attrs.validators.instance_of(bool))
+    binned_bootstrap: bool = field(default=False, validator=attrs.validators.instance_of(bool))
 
     # Internally created attributes need to be given a type before usage
     inputs: pd.DataFrame = field(init=False)
@@ -200,9 +329,17 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
     yaw_misalignment_95ci_ws: NDArrayFloat = field(init=False)
     _run: pd.DataFrame = field(init=False)
     _vane_bins: list[float] = field(init=False)
+    _df_filtered: pd.DataFrame = field(init=False)
     _df_turb: pd.DataFrame = field(init=False)
     _df_turb_ws: pd.DataFrame = field(init=False)
     _curve_fit_params_ws: NDArrayFloat = field(init=False)
+    _vane_bin_grid: NDArrayFloat = field(init=False)
+    _vane_bin_index: np.ndarray = field(init=False)
+    _power_values_bin_ws: NDArrayFloat = field(init=False)
+    _vane_statistics: dict[tuple[float, float], dict[str, NDArrayFloat]] = field(
+        factory=dict, init=False
+    )
+    _sampler: RandomSampler = field(factory=RandomSampler, init=False)
     run_parameters: list[str] = field(
         init=False,
         default=[
@@ -258,6 +395,7 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
         max_power_filter: float | None = None,
         power_bin_mad_thresh: float | None = None,
         use_power_coeff: bool | None = None,
+        n_workers: int | None = None,
     ):
         """
         Estimates static yaw misalignment for each wind speed bin for each specified wind turbine.
@@ -305,6 +443,10 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             use_power_coeff (bool, optional): If True, power performance as a function of wind vane
                 angle will be quantified by normalizing power by the cube of the wind speed,
                 approximating the power coefficient. If False, only power will be used. Defaults to False.
+            n_workers(:obj:`int` | :obj:`None`, optional): The number of worker processes to split
+                the Monte Carlo iterations across when :py:attr:`UQ` = True. When provided, each
+                iteration draws from its own random stream, so the results are reproducible for any
+                number of workers. ``None`` runs the iterations serially. Defaults to None.
         """
         initial_parameters = {}
         if num_sim is not None:
@@ -351,58 +493,49 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             -1 * max_abs_vane_angle_trunc, max_abs_vane_angle_trunc, self.vane_bin_width
         ).tolist()
 
+        # determine all of the wind vane angle bins used in the curve fits, which include the
+        # bin at the maximum absolute wind vane angle
+        if self._fit_in_batch:
+            k_max = np.ceil(self.max_abs_vane_angle / self.vane_bin_width) + 1
+            grid = self.vane_bin_width * np.arange(-k_max, k_max + 1)
+            self._vane_bin_grid = grid[np.abs(grid) <= self.max_abs_vane_angle]
+            self._vane_bin_index = pd.Index(self._vane_bin_grid).get_indexer(self._vane_bins)
+            self._vane_statistics = {}
+
         # Set up Monte Carlo simulation inputs if UQ = True or single simulation inputs if UQ = False.
+        self._sampler, iteration_seed = random_streams(self.seed)
         self._setup_monte_carlo_inputs()
 
-        for n in tqdm(range(self.num_sim)):
-            self._run = self.inputs.loc[n].copy()
-
-            # Estimate static yaw misalginment for each turbine
-            for i, t in enumerate(self.turbine_ids):
-                # Get turbine-sepcific scada dataframe
-                self._df_turb = self.plant.scada.loc[
-                    (slice(None), t),
-                    ["WMET_HorWdSpd", "WTUR_W", "WMET_HorWdDirRel", "WROT_BlPthAngVal"],
-                ]
-
-                # remove power curve outliers
-                self._remove_power_curve_outliers(t)
-
-                # Estimate static yaw misalginment for each wind speed bin
-                for k, ws in enumerate(self.ws_bins):
-                    self._df_turb_ws = self._df_turb.loc[
-                        (self._df_turb["WMET_HorWdSpd"] >= (ws - self.ws_bin_width / 2))
-                        & (self._df_turb["WMET_HorWdSpd"] < (ws + self.ws_bin_width / 2))
-                    ].copy()
-
-                    # Randomly resample 10-minute periods for bootstrapping
-                    if self.UQ:
-                        self._df_turb_ws = self._df_turb_ws.sample(frac=1.0, replace=True)
-
-                    (
-                        yaw_misalignment,
-                        mean_vane_angle,
-                        curve_fit_params,
-                        power_values_vane,
-                    ) = self._estimate_static_yaw_misalignment()
-
-                    if self.UQ:
-                        self.yaw_misalignment_ws[n, i, k] = yaw_misalignment
-                        self.mean_vane_angle_ws[n, i, k] = mean_vane_angle
-                        self.power_values_vane_ws[n, i, k, :] = power_values_vane
-                        self._curve_fit_params_ws[n, i, k, :] = curve_fit_params
-                    else:
-                        self.yaw_misalignment_ws[i, k] = yaw_misalignment
-                        self.mean_vane_angle_ws[i, k] = mean_vane_angle
-                        self.power_values_vane_ws[i, k, :] = power_values_vane
-                        self._curve_fit_params_ws[i, k, :] = curve_fit_params
+        seeds = iteration_seeds(self.num_sim, iteration_seed, n_workers)
+        if seeds is None or not self.UQ:
+            for n in tqdm(range(self.num_sim)):
+                self._run_iteration(n, self._sampler)
+        else:
+            if self._fit_in_batch:
+                result_attributes = (
+                    "power_values_vane_ws",
+                    "mean_vane_angle_ws",
+                    "_power_values_bin_ws",
+                )
+            else:
+                result_attributes = (
+                    "power_values_vane_ws",
+                    "_curve_fit_params_ws",
+                    "yaw_misalignment_ws",
+                    "mean_vane_angle_ws",
+                    "yaw_misalignment",
+                    "mean_vane_angle",
+                )
+            run_iterations(
+                self,
+                "_run_iteration",
+                seeds,
+                1 if n_workers is None else n_workers,
+                result_attributes=result_attributes,
+            )
 
-                if self.UQ:
-                    self.yaw_misalignment[n, i] = np.mean(self.yaw_misalignment_ws[n, i, :])
-                    self.mean_vane_angle[n, i] = np.mean(self.mean_vane_angle_ws[n, i, :])
-                else:
-                    self.yaw_misalignment[i] = np.mean(self.yaw_misalignment_ws[i, :])
-                    self.mean_vane_angle[i] = np.mean(self.mean_vane_angle_ws[i, :])
+        if self._fit_in_batch:
+            self._fit_cos_curves()
 
         # Compute mean, std. dev., and 95% confidence intervals of yaw misalginments
         if self.UQ:
@@ -420,6 +553,81 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
 
         self.set_values(initial_parameters)
 
+    def _run_iteration(self, n: int, sampler: RandomSampler) -> None:
+        """
+        Runs a single iteration of the Monte Carlo simulation, estimating the static yaw
+        misalignment of each turbine.
+
+        Args:
+            n(:obj:`int`): The Monte Carlo iteration number.
+            sampler(:obj:`RandomSampler`): The sampler for the iteration's random draws.
+        """
+        self._run = self.inputs.loc[n].copy()
+
+        # Bootstrap the vane-binned statistics of each turbine and wind speed bin
+        if self.binned_bootstrap:
+            self._bootstrap_vane_statistics(n, sampler)
+            return
+
+        # remove power curve outliers for all of the turbines at once
+        self._remove_power_curve_outliers()
+        df_turbines = dict(list(self._df_filtered.groupby(level="asset_id", sort=False)))
+
+        # Estimate static yaw misalginment for each turbine
+        for i, t in enumerate(self.turbine_ids):
+            # Get turbine-sepcific scada dataframe
+            self._df_turb = df_turbines.get(t, self._df_filtered.iloc[:0])
+
+            # Estimate static yaw misalginment for each wind speed bin
+            for k, ws in enumerate(self.ws_bins):
+                self._df_turb_ws = self._df_turb.loc[
+                    (self._df_turb["WMET_HorWdSpd"] >= (ws - self.ws_bin_width / 2))
+                    & (self._df_turb["WMET_HorWdSpd"] < (ws + self.ws_bin_width / 2))
+                ].copy()
+
+                # Randomly resample 10-minute periods for bootstrapping
+                if self.UQ:
+                    sample = sampler.bootstrap(self._df_turb_ws.shape[0])
+                    self._df_turb_ws = self._df_turb_ws.take(sample)
+
+                # Only bin the power performance, and fit all of the cosine curves after the
+                # iterations
+                if self.batch_fit:
+                    self._store_power_values_bin(n, i, k, *self._bin_power_performance())
+                    continue
+
+                (
+                    yaw_misalignment,
+                    mean_vane_angle,
+                    curve_fit_params,
+                    power_values_vane,
+                ) = self._estimate_static_yaw_misalignment()
+
+                if self.UQ:
+                    self.yaw_misalignment_ws[n, i, k] = yaw_misalignment
+                    self.mean_vane_angle_ws[n, i, k] = mean_vane_angle
+                    self.power_values_vane_ws[n, i, k, :] = power_values_vane
+                    self._curve_fit_params_ws[n, i, k, :] = curve_fit_params
+                else:
+                    self.yaw_misalignment_ws[i, k] = yaw_misalignment
+                    self.mean_vane_angle_ws[i, k] = mean_vane_angle
+                    self.power_values_vane_ws[i, k, :] = power_values_vane
+                    self._curve_fit_params_ws[i, k, :] = curve_fit_params
+
+            if self.batch_fit:
+                continue
+            if self.UQ:
+                self.yaw_misalignment[n, i] = np.mean(self.yaw_misalignment_ws[n, i, :])
+                self.mean_vane_angle[n, i] = np.mean(self.mean_vane_angle_ws[n, i, :])
+            else:
+                self.yaw_misalignment[i] = np.mean(self.yaw_misalignment_ws[i, :])
+                self.mean_vane_angle[i] = np.mean(self.mean_vane_angle_ws[i, :])
+
+    @property
+    def _fit_in_batch(self) -> bool:
+        """Whether all of the cosine curves are fit at once after the Monte Carlo iterations."""
+        return self.batch_fit or self.binned_bootstrap
+
     @logged_method_call
     def _setup_monte_carlo_inputs(self):
         """
@@ -430,10 +638,10 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
 
         if self.UQ:
             inputs = {
-                "power_bin_mad_thresh": np.random.randint(
+                "power_bin_mad_thresh": self._sampler.integers(
                     self.power_bin_mad_thresh[0], self.power_bin_mad_thresh[1] + 1, self.num_sim
                 ),
-                "max_power_filter": np.random.randint(
+                "max_power_filter": self._sampler.integers(
                     self.max_power_filter[0] * 100,
                     self.max_power_filter[1] * 100 + 1,
                     self.num_sim,
@@ -451,6 +659,15 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             self._curve_fit_params_ws = np.empty(
                 [self.num_sim, len(self.turbine_ids), len(self.ws_bins), 3]
             )
+            if self._fit_in_batch:
+                self._power_values_bin_ws = np.empty(
+                    [
+                        self.num_sim,
+                        len(self.turbine_ids),
+                        len(self.ws_bins),
+                        len(self._vane_bin_grid),
+                    ]
+                )
             self.yaw_misalignment_ws = np.empty(
                 [self.num_sim, len(self.turbine_ids), len(self.ws_bins)]
             )
@@ -483,6 +700,10 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
 
             # For saving cosine curve fit parameters, yaw misalignment, and mean wind vane angle for each wind speed bin
             self._curve_fit_params_ws = np.empty([len(self.turbine_ids), len(self.ws_bins), 3])
+            if self._fit_in_batch:
+                self._power_values_bin_ws = np.empty(
+                    [len(self.turbine_ids), len(self.ws_bins), len(self._vane_bin_grid)]
+                )
             self.yaw_misalignment_ws = np.empty([len(self.turbine_ids), len(self.ws_bins)])
             self.mean_vane_angle_ws = np.empty([len(self.turbine_ids), len(self.ws_bins)])
 
@@ -493,28 +714,32 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             self.num_sim = 1
 
     @logged_method_call
-    def _remove_power_curve_outliers(self, turbine_id):
+    def _remove_power_curve_outliers(self):
         """
-        Removes power curve outliers for a specific turbine by removing timestamps where the pitch
-        angle is above a threshold and timestamps where the wind speed is more than a specific
-        threshold from the median wind speed in each power bin. The filtered turbine data frame is
-        meant to include timestamps when the turbine is operating normally in below-rated
-        conditions.
-
-        Args:
-            turbine_id (str): The name of the turbine for which power curve outlier removal will be performed.
+        Removes power curve outliers for all turbines by removing timestamps where the pitch angle
+        is above a threshold and timestamps where the wind speed is more than a specific threshold
+        from the median wind speed in each of a turbine's power bins. The filtered data frame,
+        :py:attr:`_df_filtered`, is meant to include timestamps when the turbines are operating
+        normally in below-rated conditions.
         """
 
+        # Get the scada data for the analyzed turbines
+        df = self.plant.scada
+        df = df.loc[
+            df.index.get_level_values("asset_id").isin(self.turbine_ids),
+            ["WMET_HorWdSpd", "WTUR_W", "WMET_HorWdDirRel", "WROT_BlPthAngVal"],
+        ]
+
         # Limit to pitch angles below the specified threshold
-        self._df_turb = self._df_turb.loc[self._df_turb["WROT_BlPthAngVal"] <= self.pitch_thresh]
+        df = df.loc[df["WROT_BlPthAngVal"] <= self.pitch_thresh]
 
         # Apply bin-based filter to flag samples for which wind speed is greater than a threshold from the median
-        # wind speed in each power bin
-        turb_capac = self.plant.asset.loc[turbine_id, "rated_power"]
+        # wind speed in each of a turbine's power bins
+        turb_capac = self.plant.asset.loc[self.turbine_ids, "rated_power"]
         bin_width_frac = (self._run.max_power_filter - self.min_power_filter) / self.num_power_bins
-        flag_bin = filters.bin_filter(
-            bin_col=self._df_turb["WTUR_W"],
-            value_col=self._df_turb["WMET_HorWdSpd"],
+        flag_bin = filters.grouped_bin_filter(
+            bin_col=df["WTUR_W"],
+            value_col=df["WMET_HorWdSpd"],
             bin_width=bin_width_frac * turb_capac,
             threshold=self._run.power_bin_mad_thresh,
             center_type="median",
@@ -524,7 +749,7 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             direction="all",
         )
 
-        self._df_turb = self._df_turb.loc[~flag_bin]
+        self._df_filtered = df.loc[~flag_bin]
 
     @logged_method_call
     def _estimate_static_yaw_misalignment(self):
@@ -567,9 +792,12 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             & (np.abs(df_bin.index) <= self.max_abs_vane_angle)
         ]
 
-        # Find best fit cosine curve parameters
+        # Find best fit cosine curve parameters, in double precision for compacted "float32" data
         curve_fit_params, _ = curve_fit(
-            cos_curve, df_bin.index, df_bin["pow_ratio"], [df_bin["pow_ratio"].max(), 0.0, 2.0]
+            cos_curve,
+            df_bin.index.to_numpy(dtype=float),
+            df_bin["pow_ratio"].to_numpy(dtype=float),
+            [df_bin["pow_ratio"].max(), 0.0, 2.0],
         )
 
         # yaw_misalignment, mean_vane_angle, curve_fit_params, power_values_vane
@@ -581,6 +809,191 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             df_bin["pow_ratio"].reindex(self._vane_bins).values,
         )
 
+    def _bin_power_performance(self) -> tuple[float, NDArrayFloat]:
+        """
+        Bins the power performance of a single turbine and wind speed bin by wind vane angle, as in
+        :py:meth:`_estimate_static_yaw_misalignment`, for the batched cosine curve fits.
+
+        Returns:
+            tuple[float, np.ndarray]: The mean wind vane angle, and the power performance values
+                binned by the wind vane angles of :py:attr:`_vane_bin_grid`, which are NaN for bins
+                with too few samples.
+        """
+        vane = self._df_turb_ws["WMET_HorWdDirRel"].values
+        power = self._df_turb_ws["WTUR_W"].values
+
+        # Normalize by wind speed cubed if using power coefficient to determine power performance
+        if self.use_power_coeff:
+            pow_ratio = power / self._df_turb_ws["WMET_HorWdSpd"].values ** 3
+        else:
+            pow_ratio = power / 1.0
+
+        # Bin power performance by wind vane, ignoring vane angles that are too large
+        vane_bin = np.round(vane / self.vane_bin_width)
+        in_range = np.abs(self.vane_bin_width * vane_bin) <= self.max_abs_vane_angle
+        bins = (vane_bin[in_range] - self._vane_bin_grid[0] / self.vane_bin_width).round()
+        bins = bins.astype(int)
+        has_power = ~np.isnan(power[in_range])
+        has_ratio = ~np.isnan(pow_ratio[in_range])
+        n_bins = self._vane_bin_grid.size
+        count = np.bincount(bins[has_power], minlength=n_bins)
+        ratio_sum = np.bincount(
+            bins[has_ratio], weights=pow_ratio[in_range][has_ratio], minlength=n_bins
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            power_values_bin = ratio_sum / np.bincount(bins[has_ratio], minlength=n_bins)
+
+        # Remove bins with too few samples
+        power_values_bin[count <= self.min_vane_bin_count] = np.nan
+        return vane.mean(), power_values_bin
+
+    def _store_power_values_bin(
+        self, n: int, i: int, k: int, mean_vane_angle: float, power_values_bin: NDArrayFloat
+    ) -> None:
+        """
+        Stores the mean wind vane angle and the binned power performance values of a turbine and
+        wind speed bin for the batched cosine curve fits.
+
+        Args:
+            n (int): The Monte Carlo iteration number.
+            i (int): The index of the turbine.
+            k (int): The index of the wind speed bin.
+            mean_vane_angle (float): The mean wind vane angle.
+            power_values_bin (np.ndarray): The power performance values binned by the wind vane
+                angles of :py:attr:`_vane_bin_grid`.
+        """
+        ix = (n, i, k) if self.UQ else (i, k)
+        self.mean_vane_angle_ws[ix] = mean_vane_angle
+        self._power_values_bin_ws[ix] = power_values_bin
+        self.power_values_vane_ws[ix] = np.where(
+            self._vane_bin_index >= 0, power_values_bin[self._vane_bin_index], np.nan
+        )
+
+    def _bin_vane_statistics(self) -> dict[str, NDArrayFloat]:
+        """
+        Bins the filtered data of every turbine and wind speed bin by wind vane angle into the
+        number of samples, and the sums and sums of squares of the power performance and wind vane
+        angle in each bin.
+
+        Returns:
+            dict[str, np.ndarray]: The "count", "ratio_sum", "ratio_sum_sq", "vane_sum", and
+                "vane_sum_sq" arrays, with axes of the turbines, the wind speed bins, and the wind
+                vane bins of :py:attr:`_vane_bin_grid` followed by a bin for the remaining samples
+                and a bin for the samples without a wind vane angle.
+        """
+        df = self._df_filtered
+        n_grid = self._vane_bin_grid.size
+        n_cat = n_grid + 2
+        n_turbines = len(self.turbine_ids)
+
+        turbine = pd.Index(self.turbine_ids).get_indexer(df.index.get_level_values("asset_id"))
+        ws = df["WMET_HorWdSpd"].values
+        vane = df["WMET_HorWdDirRel"].values
+        power = df["WTUR_W"].values
+
+        # Normalize by wind speed cubed if using power coefficient to determine power performance
+        pow_ratio = power / ws**3 if self.use_power_coeff else power / 1.0
+
+        # Assign the samples with power data within the wind vane angle limits to their bins
+        vane_bin = np.round(vane / self.vane_bin_width)
+        in_range = (np.abs(self.vane_bin_width * vane_bin) <= self.max_abs_vane_angle) & ~np.isnan(
+            power
+        )
+        category = np.full(vane.size, n_grid)
+        category[in_range] = np.round(
+            vane_bin[in_range] - self._vane_bin_grid[0] / self.vane_bin_width
+        )
+        category[np.isnan(vane)] = n_grid + 1
+        ratio = np.where(category < n_grid, pow_ratio, 0.0)
+        vane = np.where(category <= n_grid, vane, 0.0)
+
+        stats = {
+            name: np.zeros((n_turbines, len(self.ws_bins), n_cat))
+            for name in ("count", "ratio_sum", "ratio_sum_sq", "vane_sum", "vane_sum_sq")
+        }
+        for k, ws_bin in enumerate(self.ws_bins):
+            rows = (
+                (ws >= (ws_bin - self.ws_bin_width / 2))
+                & (ws < (ws_bin + self.ws_bin_width / 2))
+                & (turbine >= 0)
+            )
+            key = turbine[rows] * n_cat + category[rows]
+            for name, weights in (
+                ("count", None),
+                ("ratio_sum", ratio[rows]),
+                ("ratio_sum_sq", ratio[rows] ** 2),
+                ("vane_sum", vane[rows]),
+                ("vane_sum_sq", vane[rows] ** 2),
+            ):
+                stats[name][:, k] = np.bincount(
+                    key, weights=weights, minlength=n_turbines * n_cat
+                ).reshape(n_turbines, n_cat)
+        return stats
+
+    def _bootstrap_vane_statistics(self, n: int, sampler: RandomSampler) -> None:
+        """
+        Estimates the mean wind vane angle and the binned power performance values of each turbine
+        and wind speed bin from their vane-binned statistics, which are bootstrapped when
+        :py:attr:`UQ` = True. The number of samples in each bin of a bootstrap sample is drawn from
+        a multinomial distribution, and the mean of each bin from the normal distribution of the
+        mean of that many samples. The statistics are computed once for each combination of the
+        power curve filter parameters.
+
+        Args:
+            n(:obj:`int`): The Monte Carlo iteration number.
+            sampler(:obj:`RandomSampler`): The sampler for the iteration's random draws.
+        """
+        key = (self._run.power_bin_mad_thresh, self._run.max_power_filter)
+        if (stats := self._vane_statistics.get(key)) is None:
+            self._remove_power_curve_outliers()
+            stats = self._vane_statistics[key] = self._bin_vane_statistics()
+
+        n_grid = self._vane_bin_grid.size
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio_mean = stats["ratio_sum"] / stats["count"]
+            ratio_var = np.maximum(stats["ratio_sum_sq"] / stats["count"] - ratio_mean**2, 0)
+            vane_mean = stats["vane_sum"] / stats["count"]
+            vane_var = np.maximum(stats["vane_sum_sq"] / stats["count"] - vane_mean**2, 0)
+
+        for i in range(len(self.turbine_ids)):
+            for k in range(len(self.ws_bins)):
+                count = stats["count"][i, k]
+                total = count.sum()
+                ratio, vane = ratio_mean[i, k], vane_mean[i, k]
+
+                # Draw the number of samples in each bin, and the means of the bins
+                if self.UQ and total > 0:
+                    count = sampler.multinomial(int(total), count / total)
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        ratio = ratio + np.sqrt(ratio_var[i, k] / count) * sampler.normal(
+                            0, 1, count.size
+                        )
+                        vane = vane + np.sqrt(vane_var[i, k] / count) * sampler.normal(
+                            0, 1, count.size
+                        )
+
+                # Remove bins with too few samples
+                power_values_bin = np.where(
+                    count[:n_grid] > self.min_vane_bin_count, ratio[:n_grid], np.nan
+                )
+                if count[n_grid + 1] > 0 or total == 0:
+                    mean_vane_angle = np.nan
+                else:
+                    vane_sum = (count * np.where(count > 0, vane, 0.0))[: n_grid + 1].sum()
+                    mean_vane_angle = vane_sum / total
+                self._store_power_values_bin(n, i, k, mean_vane_angle, power_values_bin)
+
+    def _fit_cos_curves(self):
+        """
+        Fits the cosine curves of every turbine, wind speed bin, and Monte Carlo iteration at once
+        with :py:func:`fit_cos_curves`, and estimates the static yaw misalignments as the
+        differences between the best-fit offsets and the mean wind vane angles.
+        """
+        self._curve_fit_params_ws = fit_cos_curves(self._vane_bin_grid, self._power_values_bin_ws)
+        self.yaw_misalignment_ws = self._curve_fit_params_ws[..., 1] - self.mean_vane_angle_ws
+        self.yaw_misalignment = np.mean(self.yaw_misalignment_ws, axis=-1)
+        self.mean_vane_angle = np.mean(self.mean_vane_angle_ws, axis=-1)
+
     def plot_yaw_misalignment_by_turbine(
         self,
         turbine_ids: list[str] = None,
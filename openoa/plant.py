@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import sys
+import json
+import shutil
+import hashlib
 import logging
 import itertools
 from typing import Callable, Optional, Sequence
@@ -13,7 +16,9 @@ import pandas as pd
 from attrs import field, define
 from pyproj import Transformer
 from tabulate import tabulate
+from scipy.spatial import KDTree
 from IPython.display import Markdown, display
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 from shapely.geometry import Point
 
 import openoa.utils.timeseries as ts
@@ -26,6 +31,12 @@ from openoa.utils.unit_conversion import convert_power_to_energy
 setup_logging(level="WARNING")
 logger = logging.getLogger(__name__)
 
+# The number of rows of memory-mapped SCADA data that are validated when loading
+_MEMORY_MAP_VALIDATION_ROWS = 10_000
+
+# The data types that `PlantData.compact` stores the float and string columns of the schema as
+_COMPACT_DTYPES = {float: "float32", str: "category"}
+
 
 # ****************************************
 # Validators, Loading, and General methods
@@ -330,6 +341,332 @@ def rename_columns(df: pd.DataFrame, col_map: dict, reverse: bool = True) -> pd.
     return df.rename(columns=col_map)
 
 
+def _remove_path(path: Path) -> None:
+    """Removes a previously saved file, or folder of files, if it exists."""
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+
+def _save_memory_mapped(df: pd.DataFrame, path: Path) -> None:
+    """Saves a (time, asset_id)-indexed data frame to a folder of .npy files that can be memory
+    mapped by :py:func:`_load_memory_mapped`. The columns of each data type are stored together as
+    a column-major 2D array, so each column is contiguous on disk, and are loaded grouped by data
+    type. The index is stored as the codes and values of its levels.
+
+    Args:
+        df (pd.DataFrame): The data frame with a (time, asset_id) MultiIndex.
+        path (Path): The folder to save the data to, which is replaced if it exists.
+
+    Raises:
+        ValueError: Raised if any of the columns are not numeric or boolean.
+    """
+    dtypes = df.dtypes
+    if invalid := [
+        col
+        for col, dtype in dtypes.items()
+        if not is_bool_dtype(dtype) and not is_numeric_dtype(dtype)
+    ]:
+        raise ValueError(f"Only numeric and boolean columns can be memory mapped: {invalid}")
+
+    _remove_path(path)
+    path.mkdir(parents=True)
+
+    time, asset_id = df.index.levels
+    tz = None if time.tz is None else str(time.tz)
+    if tz is not None:
+        time = time.tz_convert("UTC").tz_localize(None)
+    np.save(path / "time.npy", time.values)
+    np.save(path / "time_codes.npy", df.index.codes[0])
+    np.save(path / "asset_id_codes.npy", df.index.codes[1])
+
+    blocks = []
+    for i, (dtype, columns) in enumerate(dtypes.groupby(dtypes.astype(str), sort=False)):
+        values = np.lib.format.open_memmap(
+            path / f"values_{i}.npy",
+            mode="w+",
+            dtype=np.dtype(dtype),
+            shape=(len(df), columns.size),
+            fortran_order=True,
+        )
+        for j, col in enumerate(columns.index):
+            values[:, j] = df[col].to_numpy()
+        values.flush()
+        del values
+        blocks.append(columns.index.tolist())
+
+    manifest = dict(asset_id=asset_id.tolist(), tz=tz, columns=blocks)
+    with open(path / "manifest.json", "w") as f:
+        json.dump(manifest, f)
+
+
+def _load_memory_mapped(path: Path, mmap_mode: str | None = "c") -> pd.DataFrame:
+    """Loads a data frame saved by :py:func:`_save_memory_mapped` without reading its values
+    into memory, so only the parts of the data that are used are read from disk.
+
+    Args:
+        path (Path): The folder of the saved data.
+        mmap_mode (str | None, optional): The :py:func:`numpy.load` memory mapping mode, where the
+            default, "c", is copy-on-write, so the loaded data can be modified without changing the
+            saved data. None reads all of the data into memory. Defaults to "c".
+
+    Returns:
+        pd.DataFrame: The data frame with a (time, asset_id) MultiIndex.
+    """
+    with open(path / "manifest.json") as f:
+        manifest = json.load(f)
+
+    time = pd.DatetimeIndex(np.load(path / "time.npy"))
+    if manifest["tz"] is not None:
+        time = time.tz_localize("UTC").tz_convert(manifest["tz"])
+    index = pd.MultiIndex(
+        levels=[time, manifest["asset_id"]],
+        codes=[np.load(path / "time_codes.npy"), np.load(path / "asset_id_codes.npy")],
+        names=["time", "asset_id"],
+        verify_integrity=False,
+    )
+
+    # Each data type is a single block, so pandas does not consolidate, and copy, the values
+    blocks = [
+        pd.DataFrame(
+            np.load(path / f"values_{i}.npy", mmap_mode=mmap_mode),
+            index=index,
+            columns=columns,
+            copy=False,
+        )
+        for i, columns in enumerate(manifest["columns"])
+    ]
+    if not blocks:
+        return pd.DataFrame(index=index)
+    return pd.concat(blocks, axis=1, copy=False)
+
+
+def _compact_dtypes(dtypes: dict) -> dict:
+    """Maps the float and string data types of a metadata schema to the compact data types of
+    :py:meth:`PlantData.compact`, except for the time and asset ID index columns.
+
+    Args:
+        dtypes (dict): The data type of each column of the metadata schema.
+
+    Returns:
+        dict: The compact data type of each column.
+    """
+    return {
+        col: dtype if col in ("time", "asset_id") else _COMPACT_DTYPES.get(dtype, dtype)
+        for col, dtype in dtypes.items()
+    }
+
+
+def _checksum(root: Path, file_names: list[str]) -> str:
+    """Computes the SHA-256 checksum of the saved files, and of the files in each saved folder, in
+    :py:attr:`root`, including their names.
+
+    Args:
+        root (Path): The folder of the saved data.
+        file_names (list[str]): The names of the saved files and folders in :py:attr:`root`.
+
+    Returns:
+        str: The hexadecimal checksum.
+    """
+    digest = hashlib.sha256()
+    for name in file_names:
+        path = root / name
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        for fn in files:
+            digest.update(fn.relative_to(root).as_posix().encode())
+            with open(fn, "rb") as f:
+                while chunk := f.read(1 << 20):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _restore_index(df: pd.DataFrame, col_map: dict) -> pd.DataFrame:
+    """Sets the time and/or asset ID index of data saved by :py:meth:`PlantData.to_parquet` in
+    place, which, unlike ``DataFrame.set_index``, does not copy the data.
+
+    Args:
+        df (pd.DataFrame): The loaded data, with the index as columns.
+        col_map (dict): The column mapping of the saved data.
+
+    Returns:
+        pd.DataFrame: The data with the "time" and/or "asset_id" index, or the data as is, if it is
+            already indexed.
+    """
+    names = [name for name in ("time", "asset_id") if col_map.get(name) in df]
+    if not names:
+        return df
+    levels = [df.pop(col_map[name]) for name in names]
+    if len(levels) == 1:
+        df.index = pd.Index(levels[0], name=names[0])
+    else:
+        df.index = pd.MultiIndex.from_arrays(levels, names=names)
+    return df
+
+
+def _localize_timestamp(value: str | pd.Timestamp, tz) -> pd.Timestamp:
+    """Converts a timestamp to the time zone, :py:attr:`tz`, of the data it selects, where
+    timezone-naive timestamps are assumed to be in that time zone.
+    """
+    timestamp = pd.Timestamp(value)
+    if tz is not None:
+        if timestamp.tz is None:
+            timestamp = timestamp.tz_localize(tz)
+        else:
+            timestamp = timestamp.tz_convert(tz)
+    elif timestamp.tz is not None:
+        raise ValueError("Timezone-aware timestamps can't be used to select timezone-naive data.")
+    return timestamp
+
+
+def _build_select_index(df: pd.DataFrame) -> dict:
+    """Creates the time-sorted row positions, and the row offsets of each asset, of a time-indexed,
+    or (time, asset_id)-indexed, data frame used by :py:func:`_select_positions`.
+
+    Args:
+        df (pd.DataFrame): The data frame.
+
+    Returns:
+        dict: The time zone, "tz", the row times, "times", the row positions sorted by time,
+            "order", which is None if the rows are already sorted, and for (time, asset_id)-indexed
+            data, the asset IDs, "asset_ids", the row positions sorted by asset and time,
+            "asset_order", and the start and end of each asset's rows in "asset_order",
+            "asset_offsets".
+    """
+    index = df.index
+    if isinstance(index, pd.MultiIndex):
+        time = index.levels[0]
+        times = time.as_unit("ns").asi8[index.codes[0]]
+    else:
+        time = index
+        times = index.as_unit("ns").asi8
+
+    order = None if np.all(times[1:] >= times[:-1]) else np.argsort(times, kind="stable")
+    select_index = dict(
+        tz=time.tz, times=times if order is None else times[order], order=order, asset_ids=None
+    )
+    if isinstance(index, pd.MultiIndex):
+        asset_codes = index.codes[1]
+        asset_order = np.lexsort((times, asset_codes))
+        asset_counts = np.bincount(asset_codes, minlength=index.levels[1].size)
+        select_index.update(
+            asset_ids=index.levels[1],
+            asset_order=asset_order,
+            asset_times=times[asset_order],
+            asset_offsets=np.r_[0, np.cumsum(asset_counts)],
+        )
+    return select_index
+
+
+def _select_time_range(select_index: dict) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Finds the first and last timestamps of the index created by :py:func:`_build_select_index`.
+
+    Args:
+        select_index (dict): The index created by :py:func:`_build_select_index`.
+
+    Returns:
+        tuple[pd.Timestamp, pd.Timestamp]: The first and last timestamps, in the time zone of the
+            data, or ``NaT`` if there are no rows.
+    """
+    times = select_index["times"]
+    if times.size == 0:
+        return pd.NaT, pd.NaT
+
+    bounds = pd.DatetimeIndex(times[[0, -1]].astype("datetime64[ns]"))
+    if (tz := select_index["tz"]) is not None:
+        bounds = bounds.tz_localize("UTC").tz_convert(tz)
+    return bounds[0], bounds[1]
+
+
+def _select_positions(
+    select_index: dict,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+    asset_ids: Sequence[str] | None = None,
+) -> slice | np.ndarray:
+    """Finds the rows between :py:attr:`start` and :py:attr:`end`, inclusive, of the
+    :py:attr:`asset_ids` with binary searches of the index created by
+    :py:func:`_build_select_index`.
+
+    Args:
+        select_index (dict): The index created by :py:func:`_build_select_index`.
+        start (str | pd.Timestamp, optional): The first timestamp to select. Defaults to None.
+        end (str | pd.Timestamp, optional): The last timestamp to select. Defaults to None.
+        asset_ids (Sequence[str], optional): The asset IDs to select. Defaults to None.
+
+    Raises:
+        ValueError: Raised if :py:attr:`asset_ids` are provided for data without asset IDs.
+        KeyError: Raised if any of the :py:attr:`asset_ids` are not in the data.
+
+    Returns:
+        slice | np.ndarray: A slice of the rows for the time-sorted data of all assets, otherwise
+            the sorted positions of the rows.
+    """
+    tz = select_index["tz"]
+    start = None if start is None else _localize_timestamp(start, tz).as_unit("ns").value
+    end = None if end is None else _localize_timestamp(end, tz).as_unit("ns").value
+
+    def _window(times: np.ndarray) -> tuple[int, int]:
+        lo = 0 if start is None else np.searchsorted(times, start, side="left")
+        hi = times.size if end is None else np.searchsorted(times, end, side="right")
+        return lo, max(lo, hi)
+
+    if asset_ids is None:
+        lo, hi = _window(select_index["times"])
+        if select_index["order"] is None:
+            return slice(lo, hi)
+        return np.sort(select_index["order"][lo:hi])
+
+    if select_index["asset_ids"] is None:
+        raise ValueError("`asset_ids` can only be selected for data with an asset_id index.")
+    asset_ids = convert_to_list(asset_ids)
+    codes = select_index["asset_ids"].get_indexer(asset_ids)
+    if (codes < 0).any():
+        missing = [asset_id for asset_id, code in zip(asset_ids, codes) if code < 0]
+        raise KeyError(f"The following asset IDs are not in the data: {missing}")
+
+    offsets = select_index["asset_offsets"]
+    positions = []
+    for code in codes:
+        first, last = offsets[code], offsets[code + 1]
+        lo, hi = _window(select_index["asset_times"][first:last])
+        positions.append(select_index["asset_order"][first + lo : first + hi])
+    return np.sort(np.concatenate(positions)) if positions else np.empty(0, dtype=int)
+
+
+def _nearest_neighbor(
+    asset_ids: np.ndarray,
+    coordinates: np.ndarray,
+    neighbor_ids: np.ndarray,
+    neighbor_coordinates: np.ndarray,
+) -> np.ndarray:
+    """Finds the nearest neighbor of each asset, other than the asset itself, using a KD-tree of
+    the neighbor coordinates.
+
+    Args:
+        asset_ids (np.ndarray): The IDs of the assets to find the nearest neighbors of.
+        coordinates (np.ndarray): The (n_assets, 2) array of asset coordinates.
+        neighbor_ids (np.ndarray): The IDs of the candidate neighbors.
+        neighbor_coordinates (np.ndarray): The (n_neighbors, 2) array of neighbor coordinates.
+
+    Returns:
+        np.ndarray: The ID of the nearest neighbor of each asset, which is the asset itself if it is
+            the only candidate, or NaN if there are no candidates.
+    """
+    neighbor_ids = np.asarray(neighbor_ids)
+    if neighbor_ids.size == 0:
+        return np.full(len(asset_ids), np.nan)
+
+    # Query the two nearest neighbors, so the next nearest is used when the nearest is the asset
+    k = [1, 2] if neighbor_ids.size > 1 else [1]
+    _, ix = KDTree(neighbor_coordinates).query(coordinates, k=k)
+    nearest = neighbor_ids[ix[:, 0]]
+    if neighbor_ids.size > 1:
+        is_self = nearest == np.asarray(asset_ids)
+        nearest[is_self] = neighbor_ids[ix[is_self, 1]]
+    return nearest
+
+
 ############################
 # Define the PlantData class
 ############################
@@ -402,6 +739,9 @@ class PlantData:
             the data source, such as "era5" or "merra2", or a dictionary of paths to the
             location of the data to be imported following the same key naming convention.
             See :py:class:`ReanalysisMetaData` for column data specifications.
+        asset_matrix_dtype (``str``): The floating point data type of the asset distance and
+            direction matrices, either "float64" or "float32". Using "float32" halves the
+            memory of the matrices for large portfolios. Defaults to "float64".
 
     Raises:
         ValueError: Raised if any analysis specific validation checks don't pass with an
@@ -433,6 +773,9 @@ class PlantData:
     reanalysis: dict[str, pd.DataFrame] | None = field(
         default=None, converter=load_to_pandas_dict  # noqa: F821
     )
+    asset_matrix_dtype: str = field(
+        default="float64", validator=attrs.validators.in_(["float64", "float32"])
+    )
 
     # No user initialization required for attributes defined below here
     # Error catching in validation
@@ -442,6 +785,9 @@ class PlantData:
     eia: dict = field(default={}, init=False)
     asset_distance_matrix: pd.DataFrame = field(init=False, default=pd.DataFrame([]))
     asset_direction_matrix: pd.DataFrame = field(init=False, default=pd.DataFrame([]))
+    _freestream_cache: dict = field(init=False, factory=dict, repr=False, eq=False)
+    _select_cache: dict = field(init=False, factory=dict, repr=False, eq=False)
+    _compact: bool = field(init=False, default=False, repr=False)
 
     def __attrs_post_init__(self):
         """Post-initialization hook."""
@@ -462,10 +808,6 @@ class PlantData:
 
         # Post-validation data manipulations
         self.calculate_asset_geometries()
-        if self.asset is not None:
-            self.parse_asset_geometry()
-            self.calculate_asset_distance_matrix()
-            self.calculate_asset_direction_matrix()
 
         if self.scada is not None:
             self.calculate_turbine_energy()
@@ -782,23 +1124,9 @@ class PlantData:
         if not save_path.exists():
             save_path.mkdir()
 
-        meta = self.metadata.column_map
-
+        meta = self._saved_column_map(with_openoa_col_names)
         if not with_openoa_col_names:
             self.update_column_names(to_original=True)
-        else:
-            for name, col_map in meta.items():
-                if name == "reanalysis":
-                    for re_name, re_col_map in col_map.items():
-                        re_col_map = {k: k for k in re_col_map}
-                        re_col_map["frequency"] = self.metadata.reanalysis[re_name].frequency
-                        meta[name][re_name] = re_col_map
-                    continue
-                col_map = {k: k for k in col_map}
-                meta_obj = getattr(self.metadata, name)
-                if hasattr(meta_obj, "frequency"):
-                    col_map["frequency"] = meta_obj.frequency
-                meta[name] = col_map
 
         with open((save_path / metadata).with_suffix(".yml"), "w") as f:
             yaml.safe_dump(meta, f, default_flow_style=False, sort_keys=False)
@@ -839,6 +1167,499 @@ class PlantData:
                 df.reset_index(drop=False).to_csv(reanalysis_fn, index=False)
                 logger.info(f"{name} reanalysis data saved to: {reanalysis_fn}")
 
+    def _saved_column_map(self, with_openoa_col_names: bool = True) -> dict[str, dict]:
+        """Creates the metadata column mapping of the saved data, with the frequency of each data
+        type.
+
+        Args:
+            with_openoa_col_names (bool, optional): Map the PlantData column names to themselves
+                (``True``), or use the originally provided column mapping. Defaults to True.
+
+        Returns:
+            dict[str, dict]: The column mapping of each data type, with the reanalysis products
+                nested under "reanalysis".
+        """
+        meta = self.metadata.column_map
+        for name, col_map in meta.items():
+            if name == "reanalysis":
+                for re_name, re_col_map in col_map.items():
+                    if with_openoa_col_names:
+                        re_col_map = {k: k for k in re_col_map}
+                    else:
+                        re_col_map = dict(re_col_map)
+                    re_col_map["frequency"] = self.metadata.reanalysis[re_name].frequency
+                    meta[name][re_name] = re_col_map
+                continue
+            col_map = {k: k for k in col_map} if with_openoa_col_names else dict(col_map)
+            meta_obj = getattr(self.metadata, name)
+            if hasattr(meta_obj, "frequency"):
+                col_map["frequency"] = meta_obj.frequency
+            meta[name] = col_map
+        return meta
+
+    @logged_method_call
+    def to_parquet(
+        self,
+        save_path: str | Path,
+        with_openoa_col_names: bool = True,
+        partition_by: str | list[str] | None = None,
+        memory_map: bool = False,
+        snapshot: bool = False,
+        metadata: str = "metadata",
+        scada: str = "scada",
+        meter: str = "meter",
+        tower: str = "tower",
+        asset: str = "asset",
+        status: str = "status",
+        curtail: str = "curtail",
+        reanalysis: str = "reanalysis",
+    ) -> None:
+        """Saves all of the dataframe objects to Parquet files in the provided `save_path`
+        directory, which keeps the data types of each column, and the metadata, including the
+        plant location and capacity, to a YAML file. Requires the pyarrow package. The data can be
+        reloaded with :py:meth:`from_parquet`.
+
+        Args:
+            save_path (str | Path): The folder where all the data should be saved.
+            with_openoa_col_names (bool, optional): Use the PlantData column names (``True``), or
+                convert the column names back to the originally provided values. Defaults to True.
+            partition_by (str | list[str], optional): Partition the time series data into a
+                directory of files for each "asset_id" and/or "month", so that a subset of the
+                assets or months can be loaded without reading the other files. The "asset_id"
+                partitioning only applies to the SCADA, tower, and status data. Defaults to None.
+            memory_map (bool, optional): Save the SCADA data as .npy files in a "{scada}.npy"
+                folder instead of a Parquet file, which :py:meth:`from_parquet` memory maps, so
+                that only the SCADA data that are used are read from disk. The SCADA columns must
+                be numeric or boolean, are reloaded grouped by data type, and are not partitioned.
+                Defaults to False.
+            snapshot (bool, optional): Save a trusted snapshot of the validated plant, with the
+                analysis types it was validated for, the asset geometries, distance and direction
+                matrices, and a checksum of the saved files, to "{metadata}_snapshot.json" and
+                "{metadata}_snapshot.npz", so :py:meth:`from_parquet` can reload it with
+                ``trusted=True`` without validating the data again. Requires
+                :py:attr:`with_openoa_col_names`. Defaults to False.
+            metadata (str, optional): File name (without extension) to be used for the metadata.
+                Defaults to "metadata".
+            scada (str, optional): File name (without extension) to be used for the SCADA data.
+                Defaults to "scada".
+            meter (str, optional): File name (without extension) to be used for the meter data.
+                Defaults to "meter".
+            tower (str, optional): File name (without extension) to be used for the tower data.
+                Defaults to "tower".
+            asset (str, optional): File name (without extension) to be used for the asset data.
+                Defaults to "asset".
+            status (str, optional): File name (without extension) to be used for the status data.
+                Defaults to "status".
+            curtail (str, optional): File name (without extension) to be used for the curtailment
+                data. Defaults to "curtail".
+            reanalysis (str, optional): Base file name (without extension) to be used for the
+                reanalysis data, where each dataset will use the name provided to form the following
+                file name: {save_path}/{reanalysis}_{name}. Defaults to "reanalysis".
+
+        Raises:
+            ValueError: Raised if :py:attr:`partition_by` has values other than "asset_id" and
+                "month".
+            ValueError: Raised if :py:attr:`memory_map` is True, and any SCADA columns are not
+                numeric or boolean.
+            ValueError: Raised if :py:attr:`snapshot` is True, and
+                :py:attr:`with_openoa_col_names` is False.
+        """
+        if snapshot and not with_openoa_col_names:
+            raise ValueError("A trusted snapshot requires `with_openoa_col_names=True`.")
+        partition_by = [] if partition_by is None else convert_to_list(partition_by)
+        if invalid := set(partition_by).difference(("asset_id", "month")):
+            raise ValueError(f"`partition_by` must only contain 'asset_id' and 'month': {invalid}")
+
+        save_path = Path(save_path).resolve()
+        if not save_path.exists():
+            save_path.mkdir()
+
+        # Remove any previous snapshot, which no longer matches the saved data
+        snapshot_fn = save_path / f"{metadata}_snapshot"
+        _remove_path(snapshot_fn.with_suffix(".json"))
+        _remove_path(snapshot_fn.with_suffix(".npz"))
+
+        meta = self._saved_column_map(with_openoa_col_names)
+        for name in (
+            "latitude",
+            "longitude",
+            "reference_system",
+            "reference_longitude",
+            "utm_zone",
+            "capacity",
+        ):
+            meta[name] = getattr(self.metadata, name)
+        with open((save_path / metadata).with_suffix(".yml"), "w") as f:
+            yaml.safe_dump(meta, f, default_flow_style=False, sort_keys=False)
+        saved = [f"{metadata}.yml"]
+
+        if not with_openoa_col_names:
+            self.update_column_names(to_original=True)
+
+        file_names = dict(
+            scada=scada, meter=meter, tower=tower, status=status, curtail=curtail, asset=asset
+        )
+        data = {
+            name: (getattr(self, name), meta[name], file_name)
+            for name, file_name in file_names.items()
+        }
+        if self.reanalysis is not None:
+            for name, df in self.reanalysis.items():
+                data[f"{reanalysis}_{name}"] = (
+                    df,
+                    meta["reanalysis"][name],
+                    f"{reanalysis}_{name}",
+                )
+
+        try:
+            for name, (df, col_map, file_name) in data.items():
+                if df is None:
+                    continue
+
+                if name == "scada" and memory_map:
+                    _remove_path((save_path / file_name).with_suffix(".parquet"))
+                    fn = (save_path / file_name).with_suffix(".npy")
+                    _save_memory_mapped(df, fn)
+                    saved.append(fn.name)
+                    logger.info(f"{name} data saved to: {fn}")
+                    continue
+
+                # Save the index with the column names of the metadata
+                df = df.reset_index(drop=False).rename(
+                    columns={col: col_map[col] for col in df.index.names if col in col_map}
+                )
+
+                # The asset geometries are recreated from the coordinates when loading
+                if name == "asset":
+                    df = df.drop(columns=["geometry"], errors="ignore")
+
+                partition_cols = []
+                if name in ("scada", "tower", "status") and "asset_id" in partition_by:
+                    partition_cols.append(col_map["asset_id"])
+                if name != "asset" and "month" in partition_by:
+                    df["month"] = df[col_map["time"]].dt.to_period("M").astype(str)
+                    partition_cols.append("month")
+
+                # Replace any previously saved data, which may have been saved differently
+                fn = (save_path / file_name).with_suffix(".parquet")
+                _remove_path(fn)
+                if name == "scada":
+                    _remove_path(fn.with_suffix(".npy"))
+                df.to_parquet(fn, index=False, partition_cols=partition_cols or None)
+                saved.append(fn.name)
+                logger.info(f"{name} data saved to: {fn}")
+        finally:
+            if not with_openoa_col_names:
+                self.update_column_names()
+
+        if not snapshot:
+            return
+
+        if self.asset is not None:
+            np.savez(
+                snapshot_fn.with_suffix(".npz"),
+                asset_id=self.asset.index.values.astype(str),
+                geometry=np.array([(point.x, point.y) for point in self.asset["geometry"]]),
+                distance=self.asset_distance_matrix.values,
+                direction=self.asset_direction_matrix.values,
+            )
+            saved.append(snapshot_fn.with_suffix(".npz").name)
+        state = dict(
+            analysis_type=self.analysis_type,
+            asset_matrix_dtype=self.asset_matrix_dtype,
+            compact=self._compact,
+            errors=self._errors,
+            files=saved,
+            checksum=_checksum(save_path, saved),
+        )
+        with open(snapshot_fn.with_suffix(".json"), "w") as f:
+            json.dump(state, f, default=sorted)
+        logger.info(f"Trusted snapshot saved to: {snapshot_fn.with_suffix('.json')}")
+
+    @classmethod
+    def from_parquet(
+        cls,
+        load_path: str | Path,
+        columns: dict[str, list[str] | dict[str, list[str]]] | None = None,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        asset_ids: str | Sequence[str] | None = None,
+        memory_map: bool = True,
+        trusted: bool = False,
+        verify_checksum: bool = True,
+        metadata: str = "metadata",
+        scada: str = "scada",
+        meter: str = "meter",
+        tower: str = "tower",
+        asset: str = "asset",
+        status: str = "status",
+        curtail: str = "curtail",
+        reanalysis: str = "reanalysis",
+        **kwargs,
+    ) -> PlantData:
+        """Loads a ``PlantData`` object from the Parquet files and metadata saved with
+        :py:meth:`to_parquet`. Requires the pyarrow package.
+
+        Args:
+            load_path (str | Path): The folder where all the data was saved.
+            columns (dict[str, list[str] | dict[str, list[str]]], optional): The columns to load
+                for each data type, such as ``{"scada": ["WTUR_W", "WMET_HorWdSpd"]}``, with the
+                columns of each reanalysis product nested under "reanalysis", such as
+                ``{"reanalysis": {"era5": ["WMETR_HorWdSpd"]}}``. The time and asset ID columns,
+                the SCADA power, and the asset coordinates are always loaded. Data types that are
+                not provided load all of their columns. SCADA data saved with ``memory_map=True``
+                are always loaded with all of their columns, which are only read when used.
+                Defaults to None.
+            start (str | pd.Timestamp, optional): The first timestamp of the SCADA, meter, tower,
+                status, and curtailment data to load, as in :py:meth:`select`. The Parquet files
+                are filtered as they are read, so only the files of the selected months and assets
+                of partitioned data are read. The reanalysis data are not filtered. Defaults to
+                None.
+            end (str | pd.Timestamp, optional): The last timestamp of the SCADA, meter, tower,
+                status, and curtailment data to load. Defaults to None.
+            asset_ids (str | Sequence[str], optional): The asset IDs of the SCADA, tower, status,
+                and asset data to load. Defaults to None.
+            memory_map (bool, optional): Memory map the SCADA data saved with
+                ``memory_map=True``, instead of reading it into memory. The memory mapping is
+                copy-on-write, so modifying the data does not change the saved data, and the
+                SCADA data are only validated on their first rows, as they were validated before
+                being saved. Defaults to True.
+            trusted (bool, optional): Load the trusted snapshot saved with ``snapshot=True``, which
+                restores the validated plant, and its asset geometries, distance and direction
+                matrices, directly, without validating, reindexing, or renaming the data again.
+                The checksum of the saved files is verified first. The :py:attr:`analysis_type`
+                defaults to the analysis types that the snapshot was validated for, and can only be
+                a subset of them. Defaults to False.
+            verify_checksum (bool, optional): Verify the checksum of the saved files when
+                :py:attr:`trusted` is True, which reads all of the saved files. Only use False when
+                the saved files cannot have changed, such as on read-only storage. Defaults to
+                True.
+            metadata (str, optional): File name (without extension) of the metadata. Defaults to
+                "metadata".
+            scada (str, optional): File name (without extension) of the SCADA data. Defaults to
+                "scada".
+            meter (str, optional): File name (without extension) of the meter data. Defaults to
+                "meter".
+            tower (str, optional): File name (without extension) of the tower data. Defaults to
+                "tower".
+            asset (str, optional): File name (without extension) of the asset data. Defaults to
+                "asset".
+            status (str, optional): File name (without extension) of the status data. Defaults to
+                "status".
+            curtail (str, optional): File name (without extension) of the curtailment data.
+                Defaults to "curtail".
+            reanalysis (str, optional): Base file name (without extension) of the reanalysis data,
+                as in :py:meth:`to_parquet`. Defaults to "reanalysis".
+            kwargs: Additional ``PlantData`` arguments, such as :py:attr:`analysis_type`.
+
+        Raises:
+            ValueError: Raised if :py:attr:`trusted` is True, and there is no snapshot, the saved
+                files have changed since the snapshot was saved, or the snapshot was not validated
+                for the :py:attr:`analysis_type`.
+
+        Returns:
+            PlantData: The reloaded plant data.
+        """
+        load_path = Path(load_path).resolve()
+        columns = {} if columns is None else columns
+        asset_ids = None if asset_ids is None else convert_to_list(asset_ids)
+
+        snapshot_fn = load_path / f"{metadata}_snapshot"
+        if trusted:
+            if not snapshot_fn.with_suffix(".json").exists():
+                raise ValueError(
+                    f"No trusted snapshot was saved to {load_path}, see `to_parquet(snapshot=True)`."
+                )
+            with open(snapshot_fn.with_suffix(".json")) as f:
+                snapshot = json.load(f)
+            if verify_checksum and _checksum(load_path, snapshot["files"]) != snapshot["checksum"]:
+                raise ValueError(
+                    f"The data saved to {load_path} have changed since the trusted snapshot was"
+                    " saved, and must be loaded with `trusted=False`."
+                )
+        meta = PlantMetaData.load((load_path / metadata).with_suffix(".yml"))
+
+        def _filters(fn: Path, col_map: dict, time_filter: bool) -> list[tuple] | None:
+            filters = []
+            if asset_ids is not None and "asset_id" in col_map:
+                filters.append((col_map["asset_id"], "in", asset_ids))
+            if not time_filter or "time" not in col_map or (start is None and end is None):
+                return filters or None
+
+            # Take the time window in the stored time zone, and skip the months outside of it for
+            # month-partitioned data
+            import pyarrow.dataset
+
+            schema = pyarrow.dataset.dataset(fn, partitioning="hive").schema
+            tz = schema.field(col_map["time"]).type.tz
+            by_month = fn.is_dir() and next(fn.glob("**/month=*"), None) is not None
+            for value, op in ((start, ">="), (end, "<=")):
+                if value is None:
+                    continue
+                value = _localize_timestamp(value, tz)
+                filters.append((col_map["time"], op, value))
+                if by_month:
+                    filters.append(("month", op, value.strftime("%Y-%m")))
+            return filters or None
+
+        def _read(
+            fn: Path,
+            col_map: dict,
+            required: list[str],
+            usecols: list[str] | None,
+            time_filter: bool = True,
+        ):
+            if not fn.exists():
+                return None
+            index_cols = [col_map[col] for col in ("time", "asset_id") if col in col_map]
+            if usecols is not None:
+                required = [col_map[col] for col in required]
+                usecols = list(dict.fromkeys([*index_cols, *required, *usecols]))
+            df = pd.read_parquet(fn, columns=usecols, filters=_filters(fn, col_map, time_filter))
+            if not fn.is_dir():
+                return df
+
+            # Restore the partition columns and the row order of the partitioned data
+            df = df.drop(columns=["month"], errors="ignore")
+            for col in df.columns[df.dtypes == "category"]:
+                df[col] = df[col].astype(df[col].cat.categories.dtype)
+            return df.sort_values(index_cols, kind="stable", ignore_index=True)
+
+        # Validate a sample of the memory-mapped SCADA data, which replaces it once loaded
+        data = {}
+        scada_mm = None
+        if (fn := (load_path / scada).with_suffix(".npy")).is_dir():
+            col_map = meta.scada.col_map
+            scada_mm = _load_memory_mapped(fn, mmap_mode="c" if memory_map else None)
+            if start is not None or end is not None or asset_ids is not None:
+                ids = asset_ids
+                if ids is not None:
+                    ids = [asset_id for asset_id in ids if asset_id in scada_mm.index.levels[1]]
+                rows = _select_positions(_build_select_index(scada_mm), start, end, ids)
+                scada_mm = scada_mm.iloc[rows]
+            if trusted:
+                data["scada"] = scada_mm
+            else:
+                data["scada"] = (
+                    scada_mm.iloc[:_MEMORY_MAP_VALIDATION_ROWS]
+                    .copy()
+                    .reset_index(drop=False)
+                    .rename(columns={"time": col_map["time"], "asset_id": col_map["asset_id"]})
+                )
+                original_to_openoa = {v: k for k, v in col_map.items()}
+                scada_mm.columns = [original_to_openoa.get(col, col) for col in scada_mm.columns]
+
+        for name, file_name, required in (
+            ("scada", scada, ["WTUR_W"]),
+            ("meter", meter, []),
+            ("tower", tower, []),
+            ("status", status, []),
+            ("curtail", curtail, []),
+            ("asset", asset, ["latitude", "longitude"]),
+        ):
+            if name in data:
+                continue
+            fn = (load_path / file_name).with_suffix(".parquet")
+            data[name] = _read(fn, getattr(meta, name).col_map, required, columns.get(name))
+
+        reanalysis_data = {}
+        for name, re_meta in meta.reanalysis.items():
+            fn = (load_path / f"{reanalysis}_{name}").with_suffix(".parquet")
+            usecols = columns.get("reanalysis", {}).get(name)
+            if (df := _read(fn, re_meta.col_map, [], usecols, time_filter=False)) is not None:
+                reanalysis_data[name] = df
+
+        if trusted:
+            return cls._from_snapshot(
+                meta, data, reanalysis_data, snapshot, snapshot_fn.with_suffix(".npz"), **kwargs
+            )
+
+        plant = cls(
+            metadata=meta,
+            **data,
+            reanalysis=reanalysis_data if reanalysis_data else None,
+            **kwargs,
+        )
+        if scada_mm is not None:
+            with attrs.validators.disabled():
+                plant.scada = scada_mm
+            if "WTUR_SupWh" not in plant.scada:
+                plant.calculate_turbine_energy()
+        return plant
+
+    @classmethod
+    def _from_snapshot(
+        cls,
+        metadata: PlantMetaData,
+        data: dict[str, pd.DataFrame | None],
+        reanalysis: dict[str, pd.DataFrame],
+        snapshot: dict,
+        arrays_fn: Path,
+        **kwargs,
+    ) -> PlantData:
+        """Creates a ``PlantData`` object from the data and trusted snapshot loaded by
+        :py:meth:`from_parquet`, without validating the data.
+
+        Args:
+            metadata (PlantMetaData): The metadata of the saved data.
+            data (dict[str, pd.DataFrame | None]): The loaded data of each data type, with their
+                index as columns, except for memory-mapped SCADA data.
+            reanalysis (dict[str, pd.DataFrame]): The loaded data of each reanalysis product.
+            snapshot (dict): The snapshot saved by :py:meth:`to_parquet`.
+            arrays_fn (Path): The file of the saved asset geometries, distance and direction
+                matrices.
+            kwargs: Additional ``PlantData`` arguments, such as :py:attr:`analysis_type`.
+
+        Raises:
+            ValueError: Raised if the snapshot was not validated for the :py:attr:`analysis_type`.
+
+        Returns:
+            PlantData: The plant data.
+        """
+        validated = snapshot["analysis_type"]
+        analysis_type = convert_to_list(kwargs.pop("analysis_type", validated))
+        if "all" not in validated and analysis_type != [None]:
+            if invalid := set(analysis_type).difference(validated):
+                raise ValueError(
+                    f"The trusted snapshot was validated for {validated}, and not for {invalid},"
+                    " so the data must be loaded with `trusted=False`."
+                )
+        kwargs.setdefault("asset_matrix_dtype", snapshot["asset_matrix_dtype"])
+
+        # Without data or analysis types the initialization does not validate or modify anything
+        with attrs.validators.disabled():
+            plant = cls(metadata=metadata, **kwargs)
+            for name, df in data.items():
+                if df is not None:
+                    setattr(plant, name, _restore_index(df, getattr(metadata, name).col_map))
+            if reanalysis:
+                plant.reanalysis = {
+                    name: _restore_index(df, metadata.reanalysis[name].col_map)
+                    for name, df in reanalysis.items()
+                }
+            plant.analysis_type = analysis_type
+        plant._compact = snapshot["compact"]
+        plant._errors = snapshot["errors"]
+        for key in ("missing", "dtype"):
+            plant._errors[key] = {name: set(cols) for name, cols in plant._errors[key].items()}
+
+        if plant.asset is not None:
+            with np.load(arrays_fn) as arrays:
+                ix = plant.asset.index.values
+                positions = pd.Index(arrays["asset_id"]).get_indexer(ix.astype(str))
+                plant.asset["geometry"] = [Point(x, y) for x, y in arrays["geometry"][positions]]
+                matrices = {
+                    name: arrays[name][np.ix_(positions, positions)].astype(
+                        plant.asset_matrix_dtype, copy=False
+                    )
+                    for name in ("distance", "direction")
+                }
+            plant.asset_distance_matrix = pd.DataFrame(matrices["distance"], index=ix, columns=ix)
+            plant.asset_direction_matrix = pd.DataFrame(matrices["direction"], index=ix, columns=ix)
+        if plant.scada is not None and "WTUR_SupWh" not in plant.scada:
+            plant.calculate_turbine_energy()
+        return plant
+
     @logged_method_call
     def _validate_column_names(self, category: str = "all") -> dict[str, list[str]]:
         """Validates that the column names in each of the data types matches the mapping
@@ -892,6 +1713,13 @@ class PlantData:
         # TODO: Consider if this should be a encoded in the metadata/plantdata object elsewhere
         column_name_map = self.metadata.column_map
         column_dtype_map = self.metadata.dtype_map
+        if self._compact:
+            for name in ("scada", "tower", "status"):
+                column_dtype_map[name] = _compact_dtypes(column_dtype_map[name])
+            column_dtype_map["reanalysis"] = {
+                name: _compact_dtypes(dtypes)
+                for name, dtypes in column_dtype_map["reanalysis"].items()
+            }
         column_map = {}
         for name in column_name_map:
             if name == "reanalysis":
@@ -1158,6 +1986,59 @@ class PlantData:
         frequency = self.metadata.scada.frequency
         self.scada[energy_col] = convert_power_to_energy(self.scada[power_col], frequency)
 
+    @logged_method_call
+    def compact(self) -> dict[str, int]:
+        """Reduces the memory of the SCADA, met tower, status, and reanalysis data, at the cost of
+        their precision. The columns that the metadata schema defines as floats are downcast to
+        "float32", which has about 7 significant digits, and the columns defined as strings, such
+        as the turbine status, are stored as "category". The asset IDs of the (time, asset_id)
+        index are already stored once, with an integer code for each row, and boolean columns, such
+        as filter flags, already use a byte per row, so neither is changed. Data that are validated
+        after compacting, including by :py:meth:`validate`, keep the compact data types.
+        Memory-mapped SCADA data are read into memory.
+
+        Returns:
+            dict[str, int]: The number of bytes saved for each data type, with each reanalysis
+                product as "reanalysis-{name}".
+        """
+        data = {
+            name: (getattr(self, name), getattr(self.metadata, name).dtypes)
+            for name in ("scada", "tower", "status")
+        }
+        if self.reanalysis is not None:
+            for name, df in self.reanalysis.items():
+                data[f"reanalysis-{name}"] = (df, self.metadata.reanalysis[name].dtypes)
+
+        saved = {}
+        compacted = {}
+        for name, (df, dtypes) in data.items():
+            if df is None:
+                continue
+            new_dtypes = {
+                col: dtype
+                for col, dtype in _compact_dtypes(dtypes).items()
+                if col in df.columns
+                and dtype in _COMPACT_DTYPES.values()
+                and str(df[col].dtype) != dtype
+            }
+            nbytes = df.memory_usage(index=True, deep=True).sum()
+            if new_dtypes:
+                df = df.astype(new_dtypes)
+            saved[name] = int(nbytes - df.memory_usage(index=True, deep=True).sum())
+            compacted[name] = df
+
+        with attrs.validators.disabled():
+            for name in ("scada", "tower", "status"):
+                if name in compacted:
+                    setattr(self, name, compacted[name])
+            if self.reanalysis is not None:
+                self.reanalysis = {
+                    name: compacted[f"reanalysis-{name}"] for name in self.reanalysis
+                }
+        self._compact = True
+        logger.info(f"Compacting the data saved {sum(saved.values()) / 1e6:,.1f} MB")
+        return saved
+
     @property
     def turbine_ids(self) -> np.ndarray:
         """The 1D array of turbine IDs. This is created from the `asset` data, or unique IDs from the
@@ -1172,18 +2053,22 @@ class PlantData:
         """The number of turbines contained in the data."""
         return self.turbine_ids.size
 
-    def turbine_df(self, turbine_id: str) -> pd.DataFrame:
+    def turbine_df(self, turbine_id: str, columns: list[str] | None = None) -> pd.DataFrame:
         """Filters `scada` on a single `turbine_id` and returns the filtered data frame.
 
         Args:
             turbine_id (str): The asset_id of the turbine to retrieve its data.
+            columns (list[str], optional): The columns to retrieve, so that the other columns are
+                not copied, or read from disk for memory-mapped data. Defaults to all columns.
 
         Returns:
             pd.DataFrame: The turbine-specific SCADA data frame.
         """
         if self.scada is None:
             raise AttributeError("This method can't be used unless `scada` data is provided.")
-        return self.scada.xs(turbine_id, level=1)
+        if columns is None:
+            return self.scada.xs(turbine_id, level=1)
+        return self.scada.loc[pd.IndexSlice[:, turbine_id], columns].droplevel("asset_id")
 
     @property
     def tower_ids(self) -> np.ndarray:
@@ -1199,18 +2084,114 @@ class PlantData:
         """The number of met towers contained in the data."""
         return self.tower_ids.size
 
-    def tower_df(self, tower_id: str) -> pd.DataFrame:
+    def tower_df(self, tower_id: str, columns: list[str] | None = None) -> pd.DataFrame:
         """Filters `tower` on a single `tower_id` and returns the filtered data frame.
 
         Args:
             tower_id (str): The ID of the met tower to retrieve its data.
+            columns (list[str], optional): The columns to retrieve, so that the other columns are
+                not copied. Defaults to all columns.
 
         Returns:
             pd.DataFrame: The met tower-specific data frame.
         """
         if self.tower is None:
             raise AttributeError("This method can't be used unless `tower` data is provided.")
-        return self.tower.xs(tower_id, level=1)
+        if columns is None:
+            return self.tower.xs(tower_id, level=1)
+        return self.tower.loc[pd.IndexSlice[:, tower_id], columns].droplevel("asset_id")
+
+    def _select_data(self, data: str) -> pd.DataFrame:
+        """Returns the :py:attr:`data` time series data used by :py:meth:`select` and
+        :py:meth:`time_range`.
+
+        Raises:
+            ValueError: Raised if :py:attr:`data` is not a valid data type.
+            AttributeError: Raised if there is no :py:attr:`data` data.
+        """
+        if data not in ("scada", "meter", "tower", "status", "curtail"):
+            raise ValueError(
+                "`data` must be one of 'scada', 'meter', 'tower', 'status', or 'curtail'."
+            )
+        df = getattr(self, data)
+        if df is None:
+            raise AttributeError(f"This method can't be used unless `{data}` data is provided.")
+        return df
+
+    def _select_index(self, name: str) -> dict:
+        """Returns the time-sorted row positions, and row offsets of each asset, of the
+        :py:attr:`name` data used by :py:meth:`select`, which are computed once per data frame.
+        """
+        df = getattr(self, name)
+        cache = self._select_cache.get(name)
+        if cache is not None and cache["data"] is df and cache["index"] is df.index:
+            return cache["select_index"]
+
+        select_index = _build_select_index(df)
+        self._select_cache[name] = dict(data=df, index=df.index, select_index=select_index)
+        return select_index
+
+    def select(
+        self,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        asset_ids: str | Sequence[str] | None = None,
+        columns: list[str] | None = None,
+        data: str = "scada",
+    ) -> pd.DataFrame:
+        """Selects the rows of a time window, and of a subset of the assets, from the time series
+        data. The rows are found with binary searches of the time-sorted data of each asset, which
+        are computed on the first selection of each data frame, instead of comparing every
+        timestamp, and only the selected rows and columns are copied. Time windows of
+        time-sorted data for all of the assets and columns are returned as a view of the data.
+
+        Args:
+            start (str | pd.Timestamp, optional): The first timestamp to select, where
+                timezone-naive timestamps are assumed to be in the time zone of the data. Defaults
+                to the start of the data.
+            end (str | pd.Timestamp, optional): The last timestamp to select. Defaults to the end
+                of the data.
+            asset_ids (str | Sequence[str], optional): The asset IDs to select, which can only be
+                used for the SCADA, tower, and status data. Defaults to all assets.
+            columns (list[str], optional): The columns to select. Defaults to all columns.
+            data (str, optional): The data type to select from, one of "scada", "meter", "tower",
+                "status", or "curtail". Defaults to "scada".
+
+        Raises:
+            ValueError: Raised if :py:attr:`data` is not a valid data type.
+            AttributeError: Raised if there is no :py:attr:`data` data.
+            KeyError: Raised if any of the :py:attr:`asset_ids` or :py:attr:`columns` are not in
+                the data.
+
+        Returns:
+            pd.DataFrame: The selected data, in the same order as the data.
+        """
+        df = self._select_data(data)
+        rows = _select_positions(self._select_index(data), start, end, asset_ids)
+        if columns is None:
+            return df.iloc[rows]
+        if missing := set(columns).difference(df.columns):
+            raise KeyError(f"The following columns are not in the `{data}` data: {missing}")
+        return df.iloc[rows, df.columns.get_indexer_for(columns)]
+
+    def time_range(self, data: str = "scada") -> tuple[pd.Timestamp, pd.Timestamp]:
+        """Returns the first and last timestamps of the time series data from the time-sorted
+        index used by :py:meth:`select`, instead of parsing every timestamp.
+
+        Args:
+            data (str, optional): The data type, one of "scada", "meter", "tower", "status", or
+                "curtail". Defaults to "scada".
+
+        Raises:
+            ValueError: Raised if :py:attr:`data` is not a valid data type.
+            AttributeError: Raised if there is no :py:attr:`data` data.
+
+        Returns:
+            tuple[pd.Timestamp, pd.Timestamp]: The first and last timestamps, in the time zone of
+                the data, or ``NaT`` if there is no data.
+        """
+        self._select_data(data)
+        return _select_time_range(self._select_index(data))
 
     @property
     def asset_ids(self) -> np.ndarray:
@@ -1223,6 +2204,20 @@ class PlantData:
 
     # NOTE: v2 AssetData methods
 
+    def _asset_coordinates(self, asset_ids: Sequence[str] | np.ndarray | None = None) -> np.ndarray:
+        """Returns the (x, y) coordinates of the asset geometries as an (n_assets, 2) array.
+
+        Args:
+            asset_ids (Sequence[str] | np.ndarray, optional): The asset IDs to return the
+                coordinates of. If None, all assets are returned. Defaults to None.
+        Returns:
+            np.ndarray: The x and y coordinate of each asset.
+        """
+        geometry = (
+            self.asset["geometry"] if asset_ids is None else self.asset.loc[asset_ids, "geometry"]
+        )
+        return np.array([(point.x, point.y) for point in geometry], dtype=float).reshape(-1, 2)
+
     @logged_method_call
     def calculate_asset_distance_matrix(self) -> pd.DataFrame:
         """Calculates the distance between all assets on the site with `np.inf` for the distance
@@ -1232,26 +2227,15 @@ class PlantData:
             pd.DataFrame: Dataframe containing distances between each pair of assets
         """
         ix = self.asset.index.values
-        distance = (
-            pd.DataFrame(
-                [i, j, self.asset.loc[i, "geometry"].distance(self.asset.loc[j, "geometry"])]
-                for i, j in itertools.combinations(ix, 2)
-            )
-            .pivot(index=0, columns=1, values=2)
-            .rename_axis(index={0: None}, columns={1: None})
-            .fillna(0)
-            .loc[ix[:-1], ix[1:]]
-        )
-
-        # Insert the first column and last row because the self-self combinations are not produced in the above
-        distance.insert(0, ix[0], 0.0)
-        distance.loc[ix[-1]] = 0
+        coordinates = self._asset_coordinates()
+        dx, dy = (coordinates[None, :, :] - coordinates[:, None, :]).transpose(2, 0, 1)
+        distance = np.sqrt(dx * dx + dy * dy)
 
         # Maintain v2 compatibility of np.inf for the diagonal
-        distance = distance + distance.values.T - np.diag(np.diag(distance.values))
-        distance_array = distance.values
-        np.fill_diagonal(distance_array, np.inf)
-        distance.loc[:, :] = distance_array
+        np.fill_diagonal(distance, np.inf)
+        distance = pd.DataFrame(
+            distance.astype(self.asset_matrix_dtype, copy=False), index=ix, columns=ix
+        )
         self.asset_distance_matrix = distance
 
     def turbine_distance_matrix(self, turbine_id: str = None) -> pd.DataFrame:
@@ -1298,40 +2282,20 @@ class PlantData:
                 from the asset given by the row index to the asset given by the column index, relative to north)
         """
         ix = self.asset.index.values
-        direction = (
-            pd.DataFrame(
-                [
-                    i,
-                    j,
-                    np.degrees(
-                        np.arctan2(
-                            self.asset.loc[j, "geometry"].x - self.asset.loc[i, "geometry"].x,
-                            self.asset.loc[j, "geometry"].y - self.asset.loc[i, "geometry"].y,
-                        )
-                    )
-                    % 360.0,
-                ]
-                for i, j in itertools.combinations(ix, 2)
-            )
-            .pivot(index=0, columns=1, values=2)
-            .rename_axis(index={0: None}, columns={1: None})
-            .fillna(0)
-            .loc[ix[:-1], ix[1:]]
-        )
+        coordinates = self._asset_coordinates()
+        dx, dy = (coordinates[None, :, :] - coordinates[:, None, :]).transpose(2, 0, 1)
+        direction = np.degrees(np.arctan2(dx, dy)) % 360.0
 
-        # Insert the first column and last row because the self-self combinations are not produced in the above
-        direction.insert(0, ix[0], 0.0)
-        direction.loc[ix[-1]] = 0
+        # The direction from a later asset to an earlier asset is the reverse of the direction from
+        # the earlier asset to the later asset
+        upper = np.triu(np.ones(direction.shape, dtype=bool), 1)
+        direction = np.where(upper, direction, (direction.T - 180.0) % 360.0)
 
         # Maintain v2 compatibility of np.inf for the diagonal
-        direction = (
-            direction
-            + np.triu((direction.values - 180.0) % 360.0, 1).T
-            - np.diag(np.diag(direction.values))
+        np.fill_diagonal(direction, np.inf)
+        direction = pd.DataFrame(
+            direction.astype(self.asset_matrix_dtype, copy=False), index=ix, columns=ix
         )
-        direction_array = direction.values
-        np.fill_diagonal(direction_array, np.inf)
-        direction.loc[:, :] = direction_array
         self.asset_direction_matrix = direction
 
     def turbine_direction_matrix(self, turbine_id: str = None) -> pd.DataFrame:
@@ -1402,49 +2366,115 @@ class PlantData:
         Returns:
             list: List of freestream turbine asset IDs
         """
-        turbine_direction_matrix = self.turbine_direction_matrix()
+        freestream_indices = self.get_freestream_turbine_mask(
+            wd, freestream_method=freestream_method, sector_width=sector_width
+        )[0]
+        return list(self.asset.loc[self.asset["type"] == "turbine"].index[freestream_indices])
 
-        if freestream_method == "sector":
-            # find turbines for which no other upstream turbines are within half of the sector width of the specified
-            # wind direction
-            freestream_indices = np.all(
-                (np.abs(met.wrap_180(wd - turbine_direction_matrix.values)) > 0.5 * sector_width)
-                | np.diag(np.ones(len(turbine_direction_matrix), dtype=bool)),
-                axis=1,
-            )
-        elif freestream_method == "IEC":
-            # find freestream turbines according to the definition in Annex A of IEC 61400-12-1 (2005)
-            turbine_distance_matrix = self.turbine_distance_matrix()
-
-            # normalize distances by rotor diameters of upstream turbines
-            rotor_diameters_vector = self.asset.loc[
-                turbine_direction_matrix.index, "rotor_diameter"
-            ].values
-            rotor_diameters = np.ones((len(turbine_direction_matrix), 1)) * rotor_diameters_vector
-            turbine_distance_matrix /= rotor_diameters
-
-            freestream_indices = np.all(
-                (
-                    (turbine_distance_matrix.values > 2)
-                    & (
-                        np.abs(met.wrap_180(wd - turbine_direction_matrix.values))
-                        > 0.5
-                        * (
-                            1.3 * np.degrees(np.arctan(2.5 / turbine_distance_matrix.values + 0.15))
-                            + 10
-                        )
-                    )
-                )
-                | (turbine_distance_matrix.values > 20)
-                | (turbine_distance_matrix.values < 0),
-                axis=1,
-            )
-        else:
+    def _freestream_geometry(self) -> dict:
+        """Returns the turbine layout arrays used to identify freestream turbines, which are
+        computed once per asset distance and direction matrices, along with the memoized
+        freestream masks for that layout.
+        """
+        cache = self._freestream_cache
+        if (
+            cache.get("distance") is self.asset_distance_matrix
+            and cache.get("direction") is self.asset_direction_matrix
+        ):
+            return cache
+
+        cache.clear()
+        cache["direction_values"] = self.turbine_direction_matrix().to_numpy(dtype=float)
+        cache["distance"] = self.asset_distance_matrix
+        cache["direction"] = self.asset_direction_matrix
+        cache["masks"] = {}
+        return cache
+
+    def get_freestream_turbine_mask(
+        self,
+        wd: float | Sequence[float] | np.ndarray,
+        freestream_method: str = "sector",
+        sector_width: float | Sequence[float] | np.ndarray = 90.0,
+    ) -> np.ndarray:
+        """
+        Returns a boolean mask of the freestream (unwaked) turbines for each of a set of wind
+        directions, using the same methods as :py:meth:`get_freestream_turbines`. All wind
+        directions are evaluated at once, and the masks are memoized for the turbine layout, so
+        repeated calls with the same arguments do not recompute them.
+
+        Args:
+            wd (float | Sequence[float] | np.ndarray): Wind direction(s) to identify freestream
+                turbines for (degrees).
+            freestream_method (str, optional): Method used to identify freestream turbines
+                ("sector" or "IEC"). Defaults to "sector".
+            sector_width (float | Sequence[float] | np.ndarray, optional): Width of wind direction
+                sector centered on the wind direction of interest used to determine whether a
+                turbine is waked for the "sector" method (degrees). Either a single width, or one
+                width for each wind direction. Defaults to 90 degrees.
+
+        Raises:
+            ValueError: Raised if :py:attr:`freestream_method` is not one of "sector" or "IEC".
+
+        Returns:
+            np.ndarray: Read-only boolean array of shape (number of wind directions, number of
+                turbines) that is True for the freestream turbines, with the turbines ordered as
+                :py:attr:`turbine_ids`.
+        """
+        if freestream_method not in ("sector", "IEC"):
             raise ValueError(
                 'Invalid freestream method. Currently, "sector" and "IEC" are supported.'
             )
 
-        return list(self.asset.loc[self.asset["type"] == "turbine"].index[freestream_indices])
+        wd = np.atleast_1d(np.asarray(wd, dtype=float))
+        sector_width = np.broadcast_to(np.asarray(sector_width, dtype=float), wd.shape)
+
+        geometry = self._freestream_geometry()
+        key = (
+            freestream_method,
+            wd.tobytes(),
+            sector_width.tobytes() if freestream_method == "sector" else None,
+        )
+        if (mask := geometry["masks"].get(key)) is not None:
+            return mask
+
+        direction = geometry["direction_values"]
+        n_turbines = direction.shape[0]
+        if freestream_method == "sector":
+            # A turbine is never upstream of itself
+            ignore = np.eye(n_turbines, dtype=bool)
+            threshold = 0.5 * sector_width[:, None, None]
+        else:
+            # find freestream turbines according to the definition in Annex A of IEC 61400-12-1
+            # (2005), with distances normalized by rotor diameters of upstream turbines
+            if "distance_normalized" not in geometry:
+                geometry["distance_normalized"] = self.turbine_distance_matrix().to_numpy(
+                    dtype=float
+                ) / self.asset.loc[self.turbine_ids, "rotor_diameter"].to_numpy(dtype=float)
+            distance = geometry["distance_normalized"]
+            ignore = (distance > 20) | (distance < 0)
+            with np.errstate(divide="ignore"):
+                threshold = 0.5 * (1.3 * np.degrees(np.arctan(2.5 / distance + 0.15)) + 10)
+            threshold = np.where(distance > 2, threshold, np.inf)[None]
+
+        # Evaluate the wind directions in chunks to bound the size of the (direction, turbine,
+        # turbine) arrays for large layouts
+        mask = np.empty((wd.size, n_turbines), dtype=bool)
+        chunk = max(1, 2**22 // max(1, n_turbines**2))
+        with np.errstate(invalid="ignore"):
+            for i in range(0, wd.size, chunk):
+                ix = slice(i, i + chunk)
+                angle = np.abs(
+                    np.reshape(met.wrap_180(wd[ix, None, None] - direction), (-1, *direction.shape))
+                )
+                _threshold = threshold[ix] if threshold.shape[0] > 1 else threshold
+                mask[ix] = np.all((angle > _threshold) | ignore, axis=2)
+
+        mask.setflags(write=False)
+        masks = geometry["masks"]
+        if len(masks) >= 256:
+            masks.pop(next(iter(masks)))
+        masks[key] = mask
+        return mask
 
     @logged_method_call
     def calculate_nearest_neighbor(
@@ -1468,20 +2498,16 @@ class PlantData:
         ix_tower = self.tower_ids if tower_ids is None else np.array(tower_ids)
         ix = np.concatenate([ix_turb, ix_tower])
 
-        distance = self.asset_distance_matrix.loc[ix, ix]
-
-        nearest_turbine = distance[ix_turb].values.argsort(axis=1)
-        nearest_turbine = pd.DataFrame(
-            distance.columns.values[nearest_turbine], index=distance.index
-        ).loc[ix, 0]
-
-        nearest_tower = distance[ix_tower].values.argsort(axis=1)
-        nearest_tower = pd.DataFrame(
-            distance.columns.values[nearest_tower], index=distance.index
-        ).loc[ix, 0]
+        coordinates = self._asset_coordinates(ix)
+        nearest_turbine = _nearest_neighbor(
+            ix, coordinates, ix_turb, self._asset_coordinates(ix_turb)
+        )
+        nearest_tower = _nearest_neighbor(
+            ix, coordinates, ix_tower, self._asset_coordinates(ix_tower)
+        )
 
-        self.asset.loc[ix, "nearest_turbine_id"] = nearest_turbine.values
-        self.asset.loc[ix, "nearest_tower_id"] = nearest_tower.values
+        self.asset.loc[ix, "nearest_turbine_id"] = nearest_turbine
+        self.asset.loc[ix, "nearest_tower_id"] = nearest_tower
 
     def nearest_turbine(self, asset_id: str) -> str:
         """Finds the nearest turbine to the provided `asset_id`.
@@ -6,9 +6,9 @@ intended for application in wind plant operational energy analysis, particularly
 from __future__ import annotations
 
 import numpy as np
-import scipy as sp
 import pandas as pd
-from sklearn.cluster import KMeans
+from sklearn.utils import check_random_state
+from sklearn.cluster import KMeans, MiniBatchKMeans
 
 from openoa.utils._converters import (
     series_to_df,
@@ -18,6 +18,13 @@ from openoa.utils._converters import (
 )
 
 
+def _float_values(data: pd.Series) -> np.ndarray:
+    """Returns the values of :py:attr:`data` as floats, keeping the "float32" values of compacted
+    data, see :py:meth:`openoa.plant.PlantData.compact`, as "float32" instead of copying them.
+    """
+    return data.to_numpy(dtype=np.float32 if data.dtype == np.float32 else float)
+
+
 def range_flag(
     data: pd.DataFrame | pd.Series,
     lower: float | list[float],
@@ -57,7 +64,7 @@ def range_flag(
         raise ValueError("The inputs to `col`, `above`, and `below` must be the same length.")
 
     # Only flag the desired columns
-    subset = data.loc[:, col].copy()
+    subset = data.loc[:, col]
     flag = ~(subset.ge(lower) & subset.le(upper))
 
     # Return back a pd.Series if one was provided, else a pd.DataFrame
@@ -96,7 +103,7 @@ def unresponsive_flag(
 
     # Get boolean value of the difference in successive time steps is not equal to zero, and take the
     # rolling sum of the boolean diff column in period lengths defined by threshold
-    subset = data.loc[:, col].copy()
+    subset = data.loc[:, col]
     flag = subset.diff(axis=0).ne(0).rolling(threshold - 1).sum()
 
     # Create boolean series that is True if rolling sum is zero
@@ -147,7 +154,7 @@ def std_range_flag(
     if len(col) != len(threshold):
         raise ValueError("The inputs to `col` and `threshold` must be the same length.")
 
-    subset = data.loc[:, col].copy()
+    subset = data.loc[:, col]
     data_mean = np.nanmean(subset.values, axis=0)
     data_std = np.nanstd(subset.values, ddof=1, axis=0) * np.array(threshold)
     flag = subset.le(data_mean - data_std) | subset.ge(data_mean + data_std)
@@ -222,6 +229,39 @@ def bin_filter(
     Returns:
         :obj:`pandas.Series(bool)`: Array-like object with boolean entries.
     """
+    _validate_bin_filter_options(center_type, threshold_type, direction)
+
+    # Set bin min and max values if not passed to function
+    if bin_min is None:
+        bin_min = np.min(bin_col.values)
+    if bin_max is None:
+        bin_max = np.max(bin_col.values)
+
+    # Bin the data, and flag the data sorted by its time stamp
+    which_bin_col = np.digitize(bin_col, _bin_edges(bin_min, bin_max, bin_width), right=True)
+    order = value_col.index.argsort()
+    flag = _binned_flags(
+        which_bin_col[order],
+        _float_values(value_col)[order],
+        threshold,
+        center_type,
+        threshold_type,
+        direction,
+    )
+
+    # Reset any values outside the bin limits
+    flag = pd.Series(flag, index=value_col.index[order], dtype="bool")
+    flag.loc[(bin_col <= bin_min) | (bin_col > bin_max)] = False
+    return flag
+
+
+def _validate_bin_filter_options(center_type: str, threshold_type: str, direction: str) -> None:
+    """Checks the :py:attr:`center_type`, :py:attr:`threshold_type`, and :py:attr:`direction`
+    options of the bin filters.
+
+    Raises:
+        ValueError: Raised if any of the options is invalid.
+    """
     if center_type not in ("mean", "median"):
         raise ValueError("Incorrect `center_type` specified; must be one of 'mean' or 'median'.")
     if threshold_type not in ("std", "scalar", "mad"):
@@ -231,61 +271,366 @@ def bin_filter(
             "Incorrect `direction` specified; must be one of 'all', 'above', or 'below'."
         )
 
-    # Set bin min and max values if not passed to function
-    if bin_min is None:
-        bin_min = np.min(bin_col.values)
-    if bin_max is None:
-        bin_max = np.max(bin_col.values)
 
-    # Define bin edges
+def _bin_edges(bin_min: float, bin_max: float, bin_width: float) -> np.ndarray:
+    """Creates the bin edges from :py:attr:`bin_min` to :py:attr:`bin_max` in steps of
+    :py:attr:`bin_width`, where the last bin edge is always :py:attr:`bin_max`.
+    """
     bin_edges = np.arange(bin_min, bin_max, bin_width)
+    return np.unique(np.clip(np.append(bin_edges, bin_max), bin_min, bin_max))
 
-    # Ensure the last bin edge value is bin_max
-    bin_edges = np.unique(np.clip(np.append(bin_edges, bin_max), bin_min, bin_max))
 
-    # Bin the data and recreate the comparison data as a multi-column data frame
-    which_bin_col = np.digitize(bin_col, bin_edges, right=True)
+def _binned_flags(
+    bins: np.ndarray,
+    values: np.ndarray,
+    threshold: float | np.ndarray,
+    center_type: str,
+    threshold_type: str,
+    direction: str,
+    n_bins: int | None = None,
+) -> np.ndarray:
+    """Flags the values that are outside the threshold of their bin's center, where the center and
+    threshold of each bin are computed in a single pass over the data, ignoring NaN values.
 
-    # Create the flag values as a matrix with each column being the timestamp's binned value,
-    # e.g., all columns values are NaN if the data point is not in that bin
-    flag_vals = (
-        value_col.to_frame().set_index(pd.Series(which_bin_col, name="bin"), append=True).unstack()
-    )
-    drop = [i for i, el in enumerate(flag_vals.columns.names) if el != "bin"]
-    flag_vals.columns = flag_vals.columns.droplevel(drop).rename(None)
+    Args:
+        bins (:obj:`numpy.ndarray`): The non-negative integer bin of each value.
+        values (:obj:`numpy.ndarray`): The values to be flagged.
+        threshold (:obj:`float` | :obj:`numpy.ndarray`): The outlier threshold, or the outlier
+            threshold of each bin.
+        center_type (:obj:`str`): Option to use a 'mean' or 'median' center for each bin.
+        threshold_type (:obj:`str`): Option to apply a 'std', 'scalar', or 'mad' based threshold.
+        direction (:obj:`str`): Option to flag data 'above' or 'below' the center, or 'all'.
+        n_bins (:obj:`int`, optional): The number of bins, which must be provided when
+            :py:attr:`threshold` is an array. Defaults to one more than the largest bin.
 
-    # Create a False array as default, so flags are set to True
-    flag_df = pd.DataFrame(np.zeros_like(flag_vals, dtype=bool), index=flag_vals.index)
+    Returns:
+        :obj:`numpy.ndarray`: Boolean array that is True for flagged values.
+    """
+    valid = ~np.isnan(values)
+    valid_bins = bins[valid]
+    valid_values = values[valid]
+    if n_bins is None:
+        n_bins = bins.max() + 1 if bins.size > 0 else 0
+
+    count = np.bincount(valid_bins, minlength=n_bins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(valid_bins, weights=valid_values, minlength=n_bins) / count
+
+        # Get center of binned data
+        if center_type == "median":
+            center = _binned_median(valid_bins, valid_values, n_bins)
+        else:
+            center = mean
+
+        # Define threshold of data flag
+        if threshold_type == "std":
+            squared_deviation = (valid_values - mean[valid_bins]) ** 2
+            variance = np.bincount(valid_bins, weights=squared_deviation, minlength=n_bins)
+            variance = np.where(count > 1, variance / (count - 1), np.nan)
+            deviation = np.sqrt(variance) * threshold
+        elif threshold_type == "scalar":
+            deviation = np.broadcast_to(np.asarray(threshold, dtype=float), (n_bins,))
+        else:  # median absolute deviation (mad)
+            absolute_deviation = np.abs(valid_values - center[valid_bins])
+            deviation = _binned_median(valid_bins, absolute_deviation, n_bins) * threshold
+
+    # Perform flagging depending on specfied direction, where NaN values are never flagged
+    center = center[bins]
+    deviation = deviation[bins]
+    flag = np.zeros(values.size, dtype=bool)
+    if direction in ("above", "all"):
+        flag |= values > center + deviation
+    if direction in ("below", "all"):
+        flag |= values < center - deviation
+    return flag
 
-    # Get center of binned data
-    if center_type == "median":
-        center = np.nanmedian(flag_vals.values, axis=0)
-    else:
-        center = np.nanmean(flag_vals.values, axis=0)
-    center = pd.DataFrame(
-        np.full(flag_vals.shape, center),
-        index=flag_vals.index,
-        columns=flag_vals.columns,
-    )
 
-    # Define threshold of data flag
-    if threshold_type == "std":
-        deviation = np.nanstd(flag_vals.values, ddof=1, axis=0) * threshold
-    elif threshold_type == "scalar":
-        deviation = threshold
-    else:  # median absolute deviation (mad)
-        deviation = np.nanmedian(np.abs(flag_vals.values - center.values), axis=0) * threshold
+def _binned_median(bins: np.ndarray, values: np.ndarray, n_bins: int) -> np.ndarray:
+    """Computes the median of the values in each bin by sorting the values within each bin.
 
-    # Perform flagging depending on specfied direction
-    if direction in ("above", "all"):
-        flag_df |= flag_vals > center + deviation
-    if direction in ("below", "all"):
-        flag_df |= flag_vals < center - deviation
+    Args:
+        bins (:obj:`numpy.ndarray`): The bin index of each value.
+        values (:obj:`numpy.ndarray`): The values, without any NaNs.
+        n_bins (:obj:`int`): The number of bins.
 
-    # Get all instances where the value is True, and reset any values outside the bin limits
-    flag = pd.Series(np.nanmax(flag_df, axis=1), index=flag_df.index, dtype="bool")
-    flag.loc[(bin_col <= bin_min) | (bin_col > bin_max)] = False
-    return flag
+    Returns:
+        :obj:`numpy.ndarray`: The median of each bin, or NaN for empty bins.
+    """
+    sorted_values = values[np.lexsort((values, bins))]
+    count = np.bincount(bins, minlength=n_bins)
+    start = np.cumsum(count) - count
+
+    # The median is the mean of the two middle values, which are the same for an odd count
+    median = np.full(n_bins, np.nan)
+    has_values = count > 0
+    lower = sorted_values[(start + (count - 1) // 2)[has_values]]
+    upper = sorted_values[(start + count // 2)[has_values]]
+    median[has_values] = (lower + upper) / 2
+    return median
+
+
+def _group_rows(index: pd.Index, group_level: str | int) -> tuple[np.ndarray, np.ndarray, pd.Index]:
+    """Finds the group of each row of a (time, asset) indexed pandas object, and the order that
+    sorts the rows by group and then by the remaining index levels, e.g., time.
+
+    Args:
+        index (:obj:`pandas.Index`): The MultiIndex of the data.
+        group_level (:obj:`str` | :obj:`int`): The name or position of the index level of the groups.
+
+    Returns:
+        tuple[:obj:`numpy.ndarray`, :obj:`numpy.ndarray`, :obj:`pandas.Index`]: The integer group code
+            of each row, the order that sorts the rows, and the unique groups.
+    """
+    if not isinstance(index, pd.MultiIndex):
+        raise TypeError(
+            "The grouped filters require data with a MultiIndex, e.g., (time, asset_id)."
+        )
+    codes, groups = pd.factorize(index.get_level_values(group_level))
+    rank = np.empty(index.size, dtype=np.intp)
+    rank[index.droplevel(group_level).argsort()] = np.arange(index.size)
+    return codes, np.lexsort((rank, codes)), groups
+
+
+def _group_parameter(
+    value: float | dict | pd.Series, groups: pd.Index, name: str = "parameter"
+) -> np.ndarray:
+    """Converts a parameter that is either a single value for all groups, or a dictionary or
+    pandas ``Series`` of values by group, to an array of the value of each group.
+
+    Args:
+        value (:obj:`float` | :obj:`dict` | :obj:`pandas.Series`): The parameter value(s).
+        groups (:obj:`pandas.Index`): The groups to get the values of.
+        name (:obj:`str`, optional): The name of the parameter, for error messages.
+
+    Raises:
+        ValueError: Raised if the value of any of the :py:attr:`groups` is missing.
+
+    Returns:
+        :obj:`numpy.ndarray`: The value of each group.
+    """
+    if not isinstance(value, (dict, pd.Series)):
+        return np.full(groups.size, value, dtype=float)
+
+    value = pd.Series(value)
+    if len(missing := groups.difference(value.index)) > 0:
+        raise ValueError(f"`{name}` is missing values for the following groups: {missing.tolist()}")
+    return value.loc[groups].to_numpy(dtype=float)
+
+
+def grouped_range_flag(
+    data: pd.Series,
+    lower: float | dict | pd.Series,
+    upper: float | dict | pd.Series,
+    group_level: str | int = "asset_id",
+) -> pd.Series:
+    """Flag data for which the specified data is outside the provided range of [lower, upper] of
+    its group, such as each turbine in the SCADA data, in a single pass over all groups.
+
+    Args:
+        data (:obj:`pandas.Series`): The data to be flagged, with a MultiIndex that contains
+            :py:attr:`group_level`, e.g., (time, asset_id).
+        lower (:obj:`float` | `dict` | `pandas.Series`): lower threshold (inclusive) for all groups,
+            or the lower threshold of each group, keyed by the group.
+        upper (:obj:`float` | `dict` | `pandas.Series`): upper threshold (inclusive) for all groups,
+            or the upper threshold of each group, keyed by the group.
+        group_level (:obj:`str` | `int`): The name or position of the index level that defines the
+            groups, by default "asset_id".
+
+    Returns:
+        :obj:`pandas.Series`: Series with boolean entries, with the same index as :py:attr:`data`.
+    """
+    codes, _, groups = _group_rows(data.index, group_level)
+    lower = _group_parameter(lower, groups, "lower")[codes]
+    upper = _group_parameter(upper, groups, "upper")[codes]
+
+    values = _float_values(data)
+    flag = ~((values >= lower) & (values <= upper))
+    return pd.Series(flag, index=data.index, name=data.name)
+
+
+def grouped_unresponsive_flag(
+    data: pd.Series,
+    threshold: int = 3,
+    group_level: str | int = "asset_id",
+) -> pd.Series:
+    """Flag time stamps for which the reported data of a group, such as each turbine in the SCADA
+    data, does not change for `threshold` repeated intervals, in a single pass over all groups.
+    Within each group, the data are ordered by the remaining index levels, e.g., time.
+
+    Args:
+        data (:obj:`pandas.Series`): The data to be flagged, with a MultiIndex that contains
+            :py:attr:`group_level`, e.g., (time, asset_id).
+        threshold (:obj:`int`): number of intervals over which measurment does not change.
+            Defaults to 3.
+        group_level (:obj:`str` | `int`): The name or position of the index level that defines the
+            groups, by default "asset_id".
+
+    Returns:
+        :obj:`pandas.Series`: Series with boolean entries, with the same index as :py:attr:`data`.
+    """
+    if not isinstance(threshold, int):
+        raise TypeError("The input to `threshold` must be an integer.")
+
+    codes, order, _ = _group_rows(data.index, group_level)
+    codes = codes[order]
+    values = _float_values(data)[order]
+
+    # Flag the values that differ from the previous value, or that start a group
+    changed = np.ones(values.size, dtype=bool)
+    changed[1:] = ~(np.diff(values) == 0) | (codes[1:] != codes[:-1])
+
+    # A value is unresponsive when none of the `threshold` - 1 values up to and including it
+    # changed, which can only happen within a single group because the first value of a group is
+    # always flagged as changed
+    window = threshold - 1
+    n_changed = np.cumsum(np.append(0, changed))
+    flag = np.zeros(values.size, dtype=bool)
+    flag[window - 1 :] = (n_changed[window:] - n_changed[:-window]) == 0
+
+    # Need to flag preceding `threshold` values as well
+    n_flagged = np.cumsum(np.append(0, flag))
+    end = np.minimum(np.arange(values.size) + window + 1, values.size)
+    flag |= (n_flagged[end] - n_flagged[np.arange(values.size) + 1]) > 0
+
+    unsorted = np.empty_like(flag)
+    unsorted[order] = flag
+    return pd.Series(unsorted, index=data.index, name=data.name)
+
+
+@series_method(data_cols=["window_col", "value_col"])
+def grouped_window_range_flag(
+    window_col: str | pd.Series = None,
+    window_start: float | dict | pd.Series = -np.inf,
+    window_end: float | dict | pd.Series = np.inf,
+    value_col: str | pd.Series = None,
+    value_min: float | dict | pd.Series = -np.inf,
+    value_max: float | dict | pd.Series = np.inf,
+    group_level: str | int = "asset_id",
+    data: pd.DataFrame = None,
+) -> pd.Series:
+    """Flag time stamps for which measurement in `window_col` are within the range: [`window_start`,
+    `window_end`], and the measurements in `value_col` are outside of the range [`value_min`,
+    `value_max`], where each range can be defined for each group, such as each turbine in the
+    SCADA data. All groups are flagged in a single pass.
+
+    Args:
+        data (:obj:`pandas.DataFrame`): data frame containing the columns :py:attr:`window_col` and
+            `value_col`, by default None.
+        window_col (:obj:`str` | `pandas.Series`): Name of the column or  used to define the window
+            range or the data as a pandas Series, with a MultiIndex that contains
+            :py:attr:`group_level`, by default None.
+        window_start(:obj:`float` | `dict` | `pandas.Series`): minimum value for the inclusive
+            window, or the minimum of each group, by default -np.inf.
+        window_end(:obj:`float` | `dict` | `pandas.Series`): maximum value for the inclusive window,
+            or the maximum of each group, by default np.inf.
+        value_col (:obj:`str` | `pandas.Series`): Name of the column used to define the value range
+            or the data as a pandas Series, by default None.
+        value_min(:obj:`float` | `dict` | `pandas.Series`): lower threshold for the inclusive data
+            range, or the lower threshold of each group; default -np.inf
+        value_max(:obj:`float` | `dict` | `pandas.Series`): upper threshold for the inclusive data
+            range, or the upper threshold of each group; default np.inf
+        group_level (:obj:`str` | `int`): The name or position of the index level that defines the
+            groups, by default "asset_id".
+
+    Returns:
+        :obj:`pandas.Series`: Series with boolean entries.
+    """
+    codes, _, groups = _group_rows(window_col.index, group_level)
+    window_start = _group_parameter(window_start, groups, "window_start")[codes]
+    window_end = _group_parameter(window_end, groups, "window_end")[codes]
+    value_min = _group_parameter(value_min, groups, "value_min")[codes]
+    value_max = _group_parameter(value_max, groups, "value_max")[codes]
+
+    window = _float_values(window_col)
+    values = _float_values(value_col)
+    flag = (window >= window_start) & (window <= window_end)
+    flag &= ~((values >= value_min) & (values <= value_max))
+    return pd.Series(flag, index=window_col.index)
+
+
+@series_method(data_cols=["bin_col", "value_col"])
+def grouped_bin_filter(
+    bin_col: pd.Series | str,
+    value_col: pd.Series | str,
+    bin_width: float | dict | pd.Series,
+    threshold: float | dict | pd.Series = 2,
+    center_type: str = "mean",
+    bin_min: float | dict | pd.Series = None,
+    bin_max: float | dict | pd.Series = None,
+    threshold_type: str = "std",
+    direction: str = "all",
+    group_level: str | int = "asset_id",
+    data: pd.DataFrame = None,
+) -> pd.Series:
+    """Applies :py:func:`bin_filter` to each group of the data, such as each turbine in the SCADA
+    data, with the bins of all groups being evaluated in a single pass. The bin parameters can be
+    defined for each group, e.g., as fractions of each turbine's rated power, and the flags are
+    identical to applying :py:func:`bin_filter` to each group separately.
+
+    Args:
+        bin_col(:obj:`pandas.Series` | `str`): The Series or column in :py:attr:`data` to be used for
+            binning, with a MultiIndex that contains :py:attr:`group_level`, e.g., (time, asset_id).
+        value_col(:obj:`pandas.Series` | `str`): The Series or column in :py:attr:`data` to be flagged.
+        bin_width(:obj:`float` | `dict` | `pandas.Series`): Width of bin in units of
+            :py:attr:`bin_col`, or the width of each group's bins.
+        threshold(:obj:`float` | `dict` | `pandas.Series`): Outlier threshold (multiplicative factor
+            of std of `value_col` in bin), or the threshold of each group.
+        bin_min(:obj:`float` | `dict` | `pandas.Series`): Minimum bin value below which flag should
+            not be applied, or the minimum of each group. Defaults to the minimum of each group.
+        bin_max(:obj:`float` | `dict` | `pandas.Series`): Maximum bin value above which flag should
+            not be applied, or the maximum of each group. Defaults to the maximum of each group.
+        threshold_type(:obj:`str`): Option to apply a 'std', 'scalar', or 'mad' (median absolute
+            deviation) based threshold
+        center_type(:obj:`str`): Option to use a 'mean' or 'median' center for each bin
+        direction(:obj:`str`): Option to apply flag only to data 'above' or 'below' the mean, by
+            default 'all'
+        group_level (:obj:`str` | `int`): The name or position of the index level that defines the
+            groups, by default "asset_id".
+        data(:obj:`pd.DataFrame`): DataFrame containing both :py:attr:`bin_col` and
+            :py:attr:`value_col`, if data are part of the same DataFrame, by default None.
+
+    Returns:
+        :obj:`pandas.Series(bool)`: Series with boolean entries, with the same index as
+            :py:attr:`value_col`.
+    """
+    _validate_bin_filter_options(center_type, threshold_type, direction)
+
+    codes, order, groups = _group_rows(value_col.index, group_level)
+    codes = codes[order]
+    bin_values = _float_values(bin_col)[order]
+    values = _float_values(value_col)[order]
+    start = np.searchsorted(codes, np.arange(groups.size))
+    end = np.append(start[1:], codes.size)
+
+    # Set bin min and max values if not passed to function
+    if bin_min is None:
+        bin_min = pd.Series([bin_values[i:j].min() for i, j in zip(start, end)], index=groups)
+    if bin_max is None:
+        bin_max = pd.Series([bin_values[i:j].max() for i, j in zip(start, end)], index=groups)
+    bin_min = _group_parameter(bin_min, groups, "bin_min")
+    bin_max = _group_parameter(bin_max, groups, "bin_max")
+    bin_width = _group_parameter(bin_width, groups, "bin_width")
+    threshold = _group_parameter(threshold, groups, "threshold")
+
+    # Bin each group's data, and offset the bins of each group so that they are unique across groups
+    bins = np.empty(codes.size, dtype=np.intp)
+    offset = np.zeros(groups.size + 1, dtype=np.intp)
+    for g, (i, j) in enumerate(zip(start, end)):
+        bin_edges = _bin_edges(bin_min[g], bin_max[g], bin_width[g])
+        bins[i:j] = offset[g] + np.digitize(bin_values[i:j], bin_edges, right=True)
+        offset[g + 1] = offset[g] + bin_edges.size + 1
+
+    group_threshold = np.repeat(threshold, np.diff(offset))
+    flag = _binned_flags(
+        bins, values, group_threshold, center_type, threshold_type, direction, offset[-1]
+    )
+
+    # Reset any values outside the bin limits
+    flag &= ~((bin_values <= bin_min[codes]) | (bin_values > bin_max[codes]))
+
+    unsorted = np.empty_like(flag)
+    unsorted[order] = flag
+    return pd.Series(unsorted, index=value_col.index)
 
 
 @dataframe_method(data_cols=["data_col1", "data_col2"])
@@ -295,6 +640,11 @@ def cluster_mahalanobis_2d(
     n_clusters: int = 13,
     dist_thresh: float = 3.0,
     data: pd.DataFrame = None,
+    random_state: int | np.random.RandomState | None = None,
+    n_init: int | str | None = None,
+    minibatch: bool = False,
+    batch_size: int = 1024,
+    fit_sample_size: int | None = None,
 ) -> pd.Series:
     """K-means clustering of  data into `n_cluster` clusters; Mahalanobis distance evaluated for each cluster and
     points with distances outside of `dist_thresh` are flagged; distinguishes between asset IDs.
@@ -308,38 +658,61 @@ def cluster_mahalanobis_2d(
         dist_thresh(:obj:`float`): maximum Mahalanobis distance within each cluster for data to be remain unflagged
         data(:obj:`pd.DataFrame`): DataFrame containing both :py:attr:`data_col1` and :py:attr:`data_col2`, if data
             are part of the same DataFrame, by default None.
+        random_state(:obj:`int` | :obj:`numpy.random.RandomState`, optional): Random state for the
+            cluster initialization and the sampling of :py:attr:`fit_sample_size`, by default None.
+        n_init(:obj:`int` | :obj:`str`, optional): Number of times the clustering is run with different
+            initial centroids, by default None, which uses the scikit-learn default.
+        minibatch(:obj:`bool`, optional): Use ``MiniBatchKMeans`` instead of ``KMeans`` to fit the
+            clusters, which scales to large data sets, by default False.
+        batch_size(:obj:`int`, optional): Number of data points in each mini batch, when
+            :py:attr:`minibatch` is True, by default 1024.
+        fit_sample_size(:obj:`int`, optional): Number of randomly sampled data points used to fit the
+            clusters, after which every data point is assigned to its nearest cluster. By default
+            None, which fits the clusters to all of the data.
 
     Returns:
         :obj:`pandas.Series(bool)`: Array-like object with boolean entries.
     """
-    data = data.loc[:, [data_col1, data_col2]].copy()
-    kmeans = KMeans(n_clusters=n_clusters).fit(data)
-
-    # Define empty flag of 'False' values with indices matching value_col
-    flag = pd.Series(index=data.index, data=False)
-
-    # Loop through clusters and flag data that fall outside a threshold distance from cluster center
-    for i in range(n_clusters):
-        # Extract data for cluster
-        clust_sub = kmeans.labels_ == i
-        cluster = data.loc[clust_sub]
+    X = data.loc[:, [data_col1, data_col2]].to_numpy(dtype=float)
 
-        # Cluster centroid
-        centroid = kmeans.cluster_centers_[i]
+    kwargs = {"random_state": random_state}
+    if n_init is not None:
+        kwargs["n_init"] = n_init
+    if minibatch:
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size, **kwargs)
+    else:
+        kmeans = KMeans(n_clusters=n_clusters, **kwargs)
 
-        # Cluster covariance and inverse covariance
-        covmx = cluster.cov()
-        invcovmx = sp.linalg.inv(covmx)
+    # Fit the clusters to either all of the data, or a random sample of it
+    if fit_sample_size is not None and fit_sample_size < X.shape[0]:
+        rng = check_random_state(random_state)
+        sample = rng.choice(X.shape[0], size=fit_sample_size, replace=False)
+        labels = kmeans.fit(X[sample]).predict(X)
+    else:
+        labels = kmeans.fit(X).labels_
 
-        # Compute mahalnobis distance of each point in cluster
-        mahalanobis_dist = cluster.apply(
-            lambda r: sp.spatial.distance.mahalanobis(r.values, centroid, invcovmx), axis=1
+    # Cluster covariance and inverse covariance, using the unbiased estimator of the covariance
+    count = np.bincount(labels, minlength=n_clusters)
+    mean = (
+        np.column_stack([np.bincount(labels, weights=x, minlength=n_clusters) for x in X.T])
+        / np.maximum(count, 1)[:, None]
+    )
+    centered = X - mean[labels]
+    covmx = np.empty((n_clusters, 2, 2))
+    for i, j in ((0, 0), (0, 1), (1, 1)):
+        covmx[:, i, j] = np.bincount(
+            labels, weights=centered[:, i] * centered[:, j], minlength=n_clusters
         )
+    covmx[:, 1, 0] = covmx[:, 0, 1]
 
-        # Flag data outside the distance threshold
-        flag_bin = mahalanobis_dist > dist_thresh
+    # Clusters with fewer than two points have an undefined covariance, so are never flagged
+    valid = count > 1
+    invcovmx = np.full((n_clusters, 2, 2), np.nan)
+    invcovmx[valid] = np.linalg.inv(covmx[valid] / (count[valid] - 1)[:, None, None])
 
-        # Record flags in final flag column
-        flag.loc[flag_bin.index] = flag_bin
+    # Compute mahalnobis distance of each point from its cluster centroid
+    delta = X - kmeans.cluster_centers_[labels]
+    mahalanobis_dist = np.sqrt(np.einsum("ni,nij,nj->n", delta, invcovmx[labels], delta))
 
-    return flag
+    # Flag data outside the distance threshold
+    return pd.Series(mahalanobis_dist > dist_thresh, index=data.index)
@@ -2,11 +2,14 @@
 This module provides methods for filling in null data with interpolated (imputed) values.
 """
 
+from __future__ import annotations
+
 from copy import deepcopy
 
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
+from attrs import field, define
 from numpy.polynomial import Polynomial
 
 
@@ -131,6 +134,184 @@ def impute_data(
     return data.loc[:, target_col].rename(final_col_name)
 
 
+@define(auto_attribs=True)
+class AssetCorrelationAccumulator:
+    """Accumulates the pairwise-complete sufficient statistics of the data of each pair of assets,
+    i.e., the number of shared time stamps and the sums of the values, squared values, and products
+    of the pair's values on those time stamps. The correlation matrix and the linear relationships
+    between the assets are computed from the statistics, which can be updated with new data, or have
+    data removed, in O(new rows) time rather than recomputing them from all of the data.
+
+    Only the values within the same update are paired, so each update should contain the data of
+    all of the assets for its time stamps, such as a block of newly appended SCADA data. The values
+    of each asset are shifted by the mean of the first finite data added for the asset to limit the
+    loss of precision in the sums of squares, which does not change any of the results.
+
+    Args:
+        assets(:obj:`pandas.Index`): The asset IDs of the accumulated statistics, which are added
+            to automatically when new assets are encountered. Defaults to no assets.
+    """
+
+    assets: pd.Index = field(factory=lambda: pd.Index([]), converter=pd.Index)
+    _shift: np.ndarray = field(init=False, repr=False)
+    _has_shift: np.ndarray = field(init=False, repr=False)
+    _n: np.ndarray = field(init=False, repr=False)
+    _sum: np.ndarray = field(init=False, repr=False)
+    _sum_sq: np.ndarray = field(init=False, repr=False)
+    _sum_product: np.ndarray = field(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        n_assets = self.assets.size
+        self._shift = np.zeros(n_assets)
+        self._has_shift = np.zeros(n_assets, dtype=bool)
+        self._n = np.zeros((n_assets, n_assets))
+        self._sum = np.zeros((n_assets, n_assets))
+        self._sum_sq = np.zeros((n_assets, n_assets))
+        self._sum_product = np.zeros((n_assets, n_assets))
+
+    @classmethod
+    def from_data(
+        cls,
+        data: pd.DataFrame,
+        value_col: str,
+        asset_id_col: str = "asset_id",
+        weights: pd.Series | np.ndarray | None = None,
+    ) -> AssetCorrelationAccumulator:
+        """Creates the accumulator from the data of all assets, see :py:meth:`update`."""
+        return cls().update(data, value_col, asset_id_col, weights)
+
+    def _add_assets(self, assets: pd.Index) -> None:
+        """Adds any of the :py:attr:`assets` that are new to the statistics, keeping the assets
+        sorted. The new assets are not shifted until they have finite data.
+        """
+        if (new := ~assets.isin(self.assets)).sum() == 0:
+            return
+        combined = self.assets.append(assets[new]).sort_values()
+        ix = combined.get_indexer(self.assets)
+        shifts = np.zeros(combined.size)
+        shifts[ix] = self._shift
+        has_shift = np.zeros(combined.size, dtype=bool)
+        has_shift[ix] = self._has_shift
+        self._shift, self._has_shift = shifts, has_shift
+        for name in ("_n", "_sum", "_sum_sq", "_sum_product"):
+            expanded = np.zeros((combined.size, combined.size))
+            expanded[np.ix_(ix, ix)] = getattr(self, name)
+            setattr(self, name, expanded)
+        self.assets = combined
+
+    def _accumulate(self, wide: pd.DataFrame, weights, sign: float) -> AssetCorrelationAccumulator:
+        """Adds (:py:attr:`sign` = 1) or removes (:py:attr:`sign` = -1) the statistics of the
+        (time x asset) data, :py:attr:`wide`.
+        """
+        values = wide.to_numpy(dtype=float)
+        valid = np.isfinite(values)
+        self._add_assets(wide.columns)
+        ix = self.assets.get_indexer(wide.columns)
+
+        # Shift the assets by the mean of their first finite data, while all of their sums are 0
+        count = valid.sum(axis=0)
+        if (unset := ~self._has_shift[ix] & (count > 0)).any():
+            mean = np.where(valid, values, 0.0).sum(axis=0)[unset] / count[unset]
+            self._shift[ix[unset]] = mean
+            self._has_shift[ix[unset]] = True
+
+        mask = valid.astype(float)
+        shifted = np.where(valid, values - self._shift[ix], 0.0)
+        if weights is None:
+            weighted_mask, weighted_shifted = mask, shifted
+        else:
+            if isinstance(weights, pd.Series):
+                weights = weights.reindex(wide.index, fill_value=0)
+            weights = np.asarray(weights, dtype=float)[:, None]
+            weighted_mask, weighted_shifted = mask * weights, shifted * weights
+
+        ix = np.ix_(ix, ix)
+        self._n[ix] += sign * (mask.T @ weighted_mask)
+        self._sum[ix] += sign * (shifted.T @ weighted_mask)
+        self._sum_sq[ix] += sign * ((shifted**2).T @ weighted_mask)
+        self._sum_product[ix] += sign * (shifted.T @ weighted_shifted)
+        return self
+
+    def update(
+        self,
+        data: pd.DataFrame,
+        value_col: str,
+        asset_id_col: str = "asset_id",
+        weights: pd.Series | np.ndarray | None = None,
+    ) -> AssetCorrelationAccumulator:
+        """Adds new data to the statistics, such as newly appended SCADA data.
+
+        Args:
+            data(:obj:`pandas.DataFrame`): input data frame such as :py:attr:`PlantData.scada` that
+                uses a MultiIndex with a timestamp and asset_id column for indices, in that order.
+            value_col(:obj:`str`): the column containing the data values.
+            asset_id_col(:obj:`str`): The name of the asset_id index level, by default "asset_id".
+            weights(:obj:`pandas.Series` | :obj:`numpy.ndarray`, optional): The weight of each time
+                stamp of :py:attr:`data`, such as the number of times a time stamp is drawn in a
+                bootstrap sample, or a boolean mask of the time stamps to use. A ``Series`` is
+                aligned to the timestamps, and an array must be ordered by the sorted timestamps.
+                By default None, which weights all time stamps equally.
+
+        Returns:
+            :obj:`AssetCorrelationAccumulator`: The updated accumulator.
+        """
+        return self._accumulate(data.loc[:, value_col].unstack(asset_id_col), weights, 1.0)
+
+    def remove(
+        self,
+        data: pd.DataFrame,
+        value_col: str,
+        asset_id_col: str = "asset_id",
+        weights: pd.Series | np.ndarray | None = None,
+    ) -> AssetCorrelationAccumulator:
+        """Removes data that was previously added to the statistics, such as data that has since
+        been filtered out, or that has left a moving window. See :py:meth:`update` for the
+        arguments.
+
+        Returns:
+            :obj:`AssetCorrelationAccumulator`: The updated accumulator.
+        """
+        return self._accumulate(data.loc[:, value_col].unstack(asset_id_col), weights, -1.0)
+
+    def corr(self, min_periods: int = 2) -> pd.DataFrame:
+        """Computes the Pearson correlation matrix of the assets, matching
+        :py:func:`asset_correlation_matrix`.
+
+        Args:
+            min_periods(:obj:`int`): The minimum number of shared time stamps for a pair of assets to
+                have a valid correlation, by default 2.
+
+        Returns:
+            :obj:`pandas.DataFrame`: Correlation matrix with the asset IDs as index and column names,
+                and NaN on the diagonal.
+        """
+        n, s, p = self._n, self._sum, self._sum_product
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = n * self._sum_sq - s**2
+            corr = (n * p - s * s.T) / np.sqrt(variance * variance.T)
+        corr[(n < min_periods) | (variance <= 0) | (variance.T <= 0)] = np.nan
+        corr = np.clip(corr, -1, 1)
+        np.fill_diagonal(corr, np.nan)
+        return pd.DataFrame(corr, index=self.assets.copy(), columns=self.assets.copy())
+
+    def linear_fits(self) -> tuple[np.ndarray, np.ndarray]:
+        """Computes the linear relationship between every pair of assets in closed form, fit to the
+        time stamps where both assets have data.
+
+        Returns:
+            tuple[:obj:`numpy.ndarray`, :obj:`numpy.ndarray`]: The (target x reference) intercepts
+                and slopes, which are NaN where a pair has no valid fit.
+        """
+        n, s = self._n, self._sum
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = (n * self._sum_product - s * s.T) / (n * self._sum_sq.T - s.T**2)
+            intercept = (s - slope * s.T) / n
+
+        # Shift the intercepts back from the shifted data
+        intercept = intercept + self._shift[:, None] - slope * self._shift[None, :]
+        return intercept, slope
+
+
 def impute_all_assets_by_correlation(
     data: pd.DataFrame,
     impute_col: str,
@@ -170,60 +351,56 @@ def impute_all_assets_by_correlation(
         :obj:`pandas.Series`: The imputation results
 
     """
-    impute_df = data.loc[:, :].copy()
+    # Pivot once to a dense (time x asset) array of the data to be imputed
+    wide = data.loc[:, impute_col].unstack(asset_id_col)
 
-    # Create correlation matrix between different assets
-    corr_df = asset_correlation_matrix(data, impute_col)
+    # Create correlation matrix between different assets, and their linear relationships, from
+    # the pairwise-complete statistics of the data
+    correlation = AssetCorrelationAccumulator()._accumulate(wide, None, 1.0)
+    corr_df = correlation.corr(min_periods=2)
+    corr = corr_df.to_numpy()
 
-    # Sort the correlated values according to the highest value, with nans at the end.
-    ix_sort = (-corr_df.fillna(-2)).values.argsort(axis=1)
-    sort_df = pd.DataFrame(corr_df.columns.to_numpy()[ix_sort], index=corr_df.index)
-    # Loop over the assets and impute missing data
-    for target_id in corr_df.columns:
-        # If there are no NaN values, then skip the asset altogether, otherwise
-        # keep track of the number we need to continue checking for
-        ix_target = impute_df.index.get_level_values(1) == target_id
-        if (ix_nan := data.loc[ix_target, impute_col].isnull()).sum() == 0:
-            continue
+    wide = wide.loc[:, correlation.assets]
+    values = wide.to_numpy(dtype=float)
+    imputed = values.copy()
 
-        # Get the correlation-based neareast neighbor and data
-        id_sort_neighbor = 0
-        id_neighbor = sort_df.loc[target_id, id_sort_neighbor]
-        r2_neighbor = corr_df.loc[target_id, id_neighbor]
+    # Sort the correlated values according to the highest value, with nans at the end, and only
+    # use the neighbors that meet the correlation threshold
+    ix_sort = (-corr_df.fillna(-2)).values.argsort(axis=1)
+    corr_sorted = np.take_along_axis(corr, ix_sort, axis=1)
+    use_neighbor = corr_sorted > r2_threshold
 
-        # If the R2 value is too low, then move on to the next asset
-        if r2_neighbor <= r2_threshold:
+    # Ensure old method call will work here
+    if method == "linear":
+        method = "polynomial"
+        degree = 1
+    if method != "polynomial":
+        raise NotImplementedError(
+            "Only 'linear' (1-degree polynomial) and 'polynomial' fits are implemented at this time."
+        )
+    if degree == 1:
+        intercept, slope = correlation.linear_fits()
+
+    # Fill the missing data of every asset from its highest correlated neighbor that has data,
+    # working through the neighbors in order of correlation
+    for rank in range(corr.shape[1] - 1):
+        targets = np.flatnonzero(use_neighbor[:, rank])
+        targets = targets[np.isnan(imputed[:, targets]).any(axis=0)]
+        if targets.size == 0:
             continue
-
-        num_neighbors = corr_df.shape[0] - 1
-        while (ix_nan.sum() > 0) & (num_neighbors > 0) & (r2_neighbor > r2_threshold):
-            # Get the imputed data based on the correlation-based next nearest neighbor
-            imputed_data = impute_data(
-                # target_data=data.xs(target_id, level=1).loc[:, [impute_col]],
-                target_data=data.loc[
-                    data.index.get_level_values(1) == target_id, [impute_col]
-                ].droplevel(asset_id_col),
-                target_col=impute_col,
-                # reference_data=data.xs(id_neighbor, level=1).loc[:, [reference_col]],
-                reference_data=data.loc[
-                    data.index.get_level_values(1) == id_neighbor, [reference_col]
-                ].droplevel(asset_id_col),
-                reference_col=impute_col,
-                method=method,
-                degree=degree,
-            )
-
-            # Fill any NaN values with available imputed values
-            impute_df.loc[ix_target, [impute_col]] = impute_df.loc[ix_target, [impute_col]].where(
-                ~ix_nan, imputed_data.to_frame()
-            )
-
-            ix_nan = impute_df.loc[ix_target, impute_col].isnull()
-            num_neighbors -= 1
-            id_sort_neighbor += 1
-            id_neighbor = sort_df.loc[target_id, id_sort_neighbor]
-            r2_neighbor = corr_df.loc[target_id, id_neighbor]
+        neighbors = ix_sort[targets, rank]
+        reference = values[:, neighbors]
+        if degree == 1:
+            predicted = intercept[targets, neighbors] + slope[targets, neighbors] * reference
+        else:
+            predicted = np.empty_like(reference)
+            for k, (i, j) in enumerate(zip(targets, neighbors)):
+                fit_rows = np.isfinite(values[:, i]) & np.isfinite(values[:, j])
+                curve_fit = Polynomial.fit(values[fit_rows, j], values[fit_rows, i], degree)
+                predicted[:, k] = curve_fit(reference[:, k])
+        fill = np.isnan(imputed[:, targets]) & np.isfinite(reference)
+        imputed[:, targets] = np.where(fill, predicted, imputed[:, targets])
 
     # Return the results with the impute_col renamed with a leading "imputed_" for clarity
-    # return impute_df.rename(columns={c: f"imputed_{c}" for c in impute_df.columns})
-    return impute_df[impute_col].rename(f"imputed_{impute_col}")
+    imputed = pd.DataFrame(imputed, index=wide.index, columns=wide.columns).stack(future_stack=True)
+    return imputed.reindex(data.index).rename(f"imputed_{impute_col}")
@@ -4,4 +4,4 @@ power generation.
 
 """
 
-from .functions import IEC, gam, gam_3param, logistic_5_parametric
+from .functions import IEC, gam, gam_3param, gam_3param_batch, logistic_5_parametric
@@ -5,7 +5,7 @@ python function which can be used to evaluate the power curve at arbitrary locat
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Any, Callable, Hashable
 
 import numpy as np
 import pandas as pd
@@ -219,3 +219,135 @@ def gam_3param(
         return model.predict(X)
 
     return predict
+
+
+@dataframe_method(data_cols=["windspeed_col", "wind_direction_col", "air_density_col"])
+def gam_3param_batch(
+    windspeed_col: str | pd.Series,
+    wind_direction_col: str | pd.Series,
+    air_density_col: str | pd.Series,
+    power: pd.DataFrame | np.ndarray,
+    n_splines: int = 20,
+    data: pd.DataFrame = None,
+    basis_cache: Any = None,
+    basis_key: Hashable = None,
+    basis_data: pd.DataFrame = None,
+) -> Callable:
+    """
+    Use a generalized additive model to fit each of a set of power data, such as the power of each
+    turbine, to the same wind speed, wind direction and air density data. The fits are identical to
+    fitting each power column with :py:func:`gam_3param`, but the spline basis and the penalized
+    least squares solution are computed once and shared by all of the power columns.
+
+    Args:
+        windspeed_col(:obj:`str` | `pandas.Series`): Windspeed data, or the name of the column in
+            :py:attr:`data`.
+        wind_direction_col(:obj:`str` | `pandas.Series`): Wind direction data, or the name of the
+            column in :py:attr:`data`.
+        air_density_col(:obj:`str` | `pandas.Series`): Air density data, or the name of the column
+            in :py:attr:`data`.
+        power(:obj:`pandas.DataFrame` | `numpy.ndarray`): The power data to fit, with a column for
+            each power curve, and rows in the same order as the features.
+        n_splines (:obj:`int`): Number of splines to use in the fit. Defaults to 20.
+        data(:obj:`pandas.DataFrame`, optional): a pandas DataFrame containing
+            :py:attr:`windspeed_col`, :py:attr:`wind_direction_col`, and
+            :py:attr:`air_density_col`. Defaults to None.
+        basis_cache(:obj:`openoa.analysis._stage_cache.StageCache`, optional): A cache, with
+            ``get`` and ``put`` methods, to store the spline basis of :py:attr:`basis_data` in, so
+            that it is only built once for each set of edge knots. Defaults to None.
+        basis_key(:obj:`Hashable`, optional): The key identifying :py:attr:`basis_data` in
+            :py:attr:`basis_cache`, such as the name of the reanalysis product. Defaults to None.
+        basis_data(:obj:`pandas.DataFrame`, optional): The feature data, such as the long-term
+            reanalysis data, containing every row of :py:attr:`data` by index, that the model
+            will be applied to. When provided with :py:attr:`basis_cache`, the spline basis of
+            :py:attr:`data` is taken from the cached basis of :py:attr:`basis_data`, and the
+            returned function reuses the cached basis when applied to :py:attr:`basis_data`.
+            Defaults to None.
+
+    Returns:
+        :obj:`Callable`: Python function of type (Array[float] -> Array[float]) implementing the
+            power curves, which returns an array with a column for each power curve.
+    """
+    # create dataframe input to LinearGAM and predicted response variables
+    features = [windspeed_col, wind_direction_col, air_density_col]
+    X = data[features]
+    Y = np.asarray(power, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+
+    # The spline basis depends on the edge knots, which are the limits of the training features,
+    # so the cached basis of the full feature data is only reused for the same limits
+    basis, positions = None, None
+    if basis_cache is not None and basis_data is not None:
+        positions = basis_data.index.get_indexer(X.index)
+        if (positions < 0).any():
+            positions = None
+    if positions is not None:
+        values = X.to_numpy(dtype=float)
+        key = (
+            "gam_3param_batch",
+            basis_key,
+            tuple(features),
+            n_splines,
+            np.r_[values.min(axis=0), values.max(axis=0)].tobytes(),
+        )
+        if (cached := basis_cache.get(key)) is None:
+            cached = _gam_3param_basis(X, Y[:, 0], n_splines, basis_data[features])
+            basis_cache.put(key, cached)
+        model, E, basis = cached
+        modelmat = basis[positions]
+    else:
+        model, E, _ = _gam_3param_basis(X, Y[:, 0], n_splines)
+        modelmat = model._modelmat(X).toarray()
+
+    # The penalized iteratively reweighted least squares fit of a linear GAM solves a penalized
+    # least squares problem whose solution is a linear operator on the response (Wood 2006, pg 183),
+    # so construct the operator the same way as pygam and apply it to every response at once
+    n, m = modelmat.shape
+    Q, R = np.linalg.qr(modelmat)
+    U, d, Vt = np.linalg.svd(np.vstack([R, E]), full_matrices=False)
+    k = min(m, n)
+    B = (Vt[:k].T * d[:k] ** -1).dot(U[:k, :k].T).dot(Q.T)
+    coef = B.dot(Y)
+
+    # Wrap the prediction function in a closure to pack input variables
+    @dataframe_method(data_cols=["windspeed_col", "wind_direction_col", "air_density_col"])
+    def predict(
+        windspeed_col: str | pd.Series,
+        wind_direction_col: str | pd.Series,
+        air_density_col: str | pd.Series,
+        data: pd.DataFrame = None,
+    ):
+        columns = [windspeed_col, wind_direction_col, air_density_col]
+        if basis is not None and data is basis_data and columns == features:
+            return basis.dot(coef)
+        return model._modelmat(data[columns]).dot(coef)
+
+    return predict
+
+
+def _gam_3param_basis(
+    X: pd.DataFrame, y: np.ndarray, n_splines: int, basis_data: pd.DataFrame | None = None
+) -> tuple[LinearGAM, np.ndarray, np.ndarray | None]:
+    """Builds the spline terms of a linear GAM from the training features, :py:attr:`X`, and the
+    Cholesky factor of its penalties, for :py:func:`gam_3param_batch`.
+
+    Args:
+        X(:obj:`pandas.DataFrame`): The training features.
+        y(:obj:`numpy.ndarray`): A training response.
+        n_splines (:obj:`int`): Number of splines to use in the fit.
+        basis_data(:obj:`pandas.DataFrame`, optional): The feature data to build the dense spline
+            basis of with the spline terms. Defaults to None.
+
+    Returns:
+        tuple[:obj:`pygam.LinearGAM`, :obj:`numpy.ndarray`, :obj:`numpy.ndarray` | :obj:`None`]:
+            The model, the Cholesky factor of its penalties, and the spline basis of
+            :py:attr:`basis_data`, if provided.
+    """
+    # Fit the model to the response to build the spline basis and penalties
+    model = LinearGAM(n_splines=n_splines).fit(X, y)
+    P = model._P()
+    S = np.diag(np.full(P.shape[0], np.sqrt(np.finfo(np.float64).eps)))
+    E = model._cholesky(S + P, sparse=False)
+    basis = None if basis_data is None else model._modelmat(basis_data).toarray()
+    return model, E, basis
@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+import pandas as pd
 import numpy.testing as npt
 
 from openoa.analysis.electrical_losses import ElectricalLosses
@@ -68,5 +69,55 @@ class TestElectricalLossesUQ(unittest.TestCase):
         pass
 
 
+class TestElectricalLossesSeed(unittest.TestCase):
+    def setUp(self):
+        # Set up data to use for testing (ENGIE data)
+        self.project = project_ENGIE.prepare(example_data_path_str, use_cleansed=False)
+        self.project.analysis_type.append("ElectricalLosses")
+        self.project.validate()
+
+    def test_seed_reproducibility(self):
+        # Check that the seeded results don't depend on the global random state
+        np.random.seed(1)
+        analysis = ElectricalLosses(self.project, UQ=True, num_sim=500, seed=42)
+        analysis.run()
+        expected = analysis.electrical_losses.copy()
+
+        np.random.seed(2)
+        analysis.run()
+        npt.assert_array_equal(expected, analysis.electrical_losses)
+
+        # A different seed draws different inputs
+        analysis = ElectricalLosses(self.project, UQ=True, num_sim=500, seed=43)
+        analysis.run()
+        assert not np.array_equal(expected, analysis.electrical_losses)
+
+    def test_monthly_thresholds(self):
+        # Check that the losses of monthly meter data only sum the months meeting each threshold
+        analysis = ElectricalLosses(
+            self.project, UQ=True, num_sim=200, uncertainty_correction_threshold=(0.5, 0.995)
+        )
+        analysis.monthly_meter = True
+        analysis.run()
+
+        combined = analysis._combine_energy()
+        for n, run in analysis.inputs.iterrows():
+            merge_sum = combined.loc[combined["percent"] >= run.correction_threshold].sum(axis=0)
+            expected = 1 - (merge_sum["MMTR_SupWh"] * run.meter_data_fraction) / (
+                merge_sum["WTUR_SupWh"] * run.scada_data_fraction
+            )
+            npt.assert_allclose(expected, analysis.electrical_losses[n, 0], rtol=1e-12)
+
+    def test_scada_chunks(self):
+        # Check that reducing the SCADA data by month gives the same daily data as a single pass
+        analysis = ElectricalLosses(self.project)
+        analysis_chunked = ElectricalLosses(self.project, scada_chunk_freq="MS")
+        pd.testing.assert_frame_equal(analysis.scada_sum, analysis_chunked.scada_sum)
+        pd.testing.assert_frame_equal(analysis.scada_daily, analysis_chunked.scada_daily)
+
+    def tearDown(self):
+        pass
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -381,6 +381,32 @@ class TestLongTermMonteCarloAEP(unittest.TestCase):
         sim_results = self.analysis.results
         self.check_simulation_results_gam_daily_outliers(sim_results)
 
+    def test_seed_reproducibility(self):
+        # Check that the seeded results don't depend on the global random state or on the number of
+        # workers, and that a different seed gives different results
+        kwargs = dict(
+            reanalysis_products=["merra2", "era5"],
+            time_resolution="MS",
+            reg_model="lin",
+            reg_temperature=False,
+            reg_wind_direction=False,
+        )
+        np.random.seed(1)
+        self.analysis = MonteCarloAEP(self.project, seed=42, **kwargs)
+        self.analysis.run(num_sim=20)
+        expected = self.analysis.results.copy()
+
+        np.random.seed(2)
+        self.analysis.run(num_sim=20)
+        pd.testing.assert_frame_equal(expected, self.analysis.results)
+
+        self.analysis.run(num_sim=20, n_workers=2)
+        pd.testing.assert_frame_equal(expected, self.analysis.results)
+
+        self.analysis = MonteCarloAEP(self.project, seed=43, **kwargs)
+        self.analysis.run(num_sim=20)
+        self.assertFalse(np.array_equal(expected.aep_GWh, self.analysis.results.aep_GWh))
+
     def check_process_revenue_meter_energy_monthly(self, df):
         # Energy Nan flags are all zero
         nptest.assert_array_equal(df["energy_nan_perc"].values, np.repeat(0.0, df.shape[0]))
@@ -4,6 +4,8 @@ import unittest
 from pathlib import Path
 
 import yaml
+import numpy as np
+import pandas as pd
 import pytest
 from numpy.testing import assert_array_equal
 from pandas.testing import assert_frame_equal
@@ -163,6 +165,221 @@ class TestPlantData(unittest.TestCase):
             "MERRA2 dataframe did not survive CSV save/loading process",
         )
 
+    def test_toParquet(self):
+        """
+        Save this plant to Parquet files in a temporary directory, with and without partitioning
+        the time series data, load it in, and make sure the data matches.
+        """
+        pytest.importorskip("pyarrow")
+        for partition_by in (None, ["asset_id", "month"]):
+            data_path = tempfile.mkdtemp()
+            self.plant.to_parquet(save_path=data_path, partition_by=partition_by)
+            plant_loaded = PlantData.from_parquet(data_path)
+
+            assert_frame_equal(
+                self.plant.scada.sort_index(level=["time", "asset_id"]),
+                plant_loaded.scada.sort_index(level=["time", "asset_id"]),
+                "SCADA dataframe did not survive Parquet save/loading process",
+            )
+            for name in ("meter", "curtail", "asset"):
+                assert_frame_equal(
+                    getattr(self.plant, name),
+                    getattr(plant_loaded, name),
+                    f"{name} dataframe did not survive Parquet save/loading process",
+                )
+            for name in ("era5", "merra2"):
+                assert_frame_equal(
+                    self.plant.reanalysis[name],
+                    plant_loaded.reanalysis[name],
+                    f"{name} dataframe did not survive Parquet save/loading process",
+                )
+
+        # Only the requested columns, and those required by PlantData, are loaded
+        plant_loaded = PlantData.from_parquet(
+            data_path,
+            columns={"scada": ["WMET_HorWdSpd"], "reanalysis": {"era5": ["WMETR_HorWdSpd"]}},
+        )
+        assert plant_loaded.scada.columns.tolist() == ["WTUR_W", "WMET_HorWdSpd", "WTUR_SupWh"]
+        assert plant_loaded.reanalysis["era5"].columns.tolist() == ["WMETR_HorWdSpd"]
+
+        # Memory-mapped SCADA data are the same as the SCADA data read into memory
+        self.plant.to_parquet(save_path=data_path, memory_map=True)
+        for memory_map in (True, False):
+            plant_loaded = PlantData.from_parquet(data_path, memory_map=memory_map)
+            assert_frame_equal(
+                self.plant.scada,
+                plant_loaded.scada,
+                "SCADA dataframe did not survive memory-mapped save/loading process",
+            )
+
+    def test_trusted_snapshot(self):
+        """
+        Save a validated plant with a trusted snapshot, and make sure that loading it without
+        validating it again matches loading it with validation, and that changed data, or
+        analysis types it was not validated for, are not trusted.
+        """
+        pytest.importorskip("pyarrow")
+        self.plant.analysis_type = "MonteCarloAEP"
+        self.plant.validate()
+
+        data_path = tempfile.mkdtemp()
+        for memory_map in (False, True):
+            self.plant.to_parquet(save_path=data_path, memory_map=memory_map, snapshot=True)
+            plant_validated = PlantData.from_parquet(data_path, analysis_type="MonteCarloAEP")
+            plant_trusted = PlantData.from_parquet(data_path, trusted=True)
+
+            assert plant_trusted.analysis_type == ["MonteCarloAEP"]
+            for name in ("scada", "meter", "curtail"):
+                assert_frame_equal(getattr(plant_validated, name), getattr(plant_trusted, name))
+            for name in ("era5", "merra2"):
+                assert_frame_equal(plant_validated.reanalysis[name], plant_trusted.reanalysis[name])
+            assert_frame_equal(
+                plant_validated.asset.drop(columns="geometry"),
+                plant_trusted.asset.drop(columns="geometry"),
+            )
+            assert plant_validated.asset.geometry.tolist() == plant_trusted.asset.geometry.tolist()
+            assert_frame_equal(
+                plant_validated.asset_distance_matrix, plant_trusted.asset_distance_matrix
+            )
+            assert_frame_equal(
+                plant_validated.asset_direction_matrix, plant_trusted.asset_direction_matrix
+            )
+
+        with self.assertRaises(ValueError):
+            PlantData.from_parquet(data_path, trusted=True, analysis_type="WakeLosses-scada")
+
+        with open(Path(data_path) / "meter.parquet", "ab") as f:
+            f.write(b"\0")
+        with self.assertRaises(ValueError):
+            PlantData.from_parquet(data_path, trusted=True)
+
+        # Saving without a snapshot removes the previous snapshot
+        self.plant.to_parquet(save_path=data_path)
+        with self.assertRaises(ValueError):
+            PlantData.from_parquet(data_path, trusted=True)
+
+    def test_compact(self):
+        """
+        Test that compacting the plant downcasts the schema's float columns to "float32", reports
+        the memory saved, and that validating the plant again keeps the compact data types.
+        """
+        self.plant.analysis_type = "MonteCarloAEP"
+        self.plant.validate()
+        scada = self.plant.scada.copy()
+        nbytes = scada.memory_usage(index=True, deep=True).sum()
+
+        saved = self.plant.compact()
+        assert saved["scada"] == nbytes - self.plant.scada.memory_usage(index=True, deep=True).sum()
+        assert saved["scada"] > 0
+        assert {"reanalysis-era5", "reanalysis-merra2"}.issubset(saved)
+
+        float_cols = [
+            col for col, dtype in self.plant.metadata.scada.dtypes.items() if dtype is float
+        ]
+        for col in scada.columns.intersection(float_cols):
+            assert self.plant.scada[col].dtype == np.float32
+            np.testing.assert_allclose(self.plant.scada[col], scada[col], rtol=1e-6)
+        for df in self.plant.reanalysis.values():
+            assert (df.dtypes == np.float32).all()
+
+        self.plant.validate()
+        for col in scada.columns.intersection(float_cols):
+            assert self.plant.scada[col].dtype == np.float32
+        assert self.plant.scada.index.equals(scada.index)
+
+    def test_select(self):
+        """
+        Test that selecting a time window and turbines matches masking the SCADA data, and that
+        loading only the selected data from Parquet files matches selecting it after loading.
+        """
+        turbine_ids = list(self.plant.turbine_ids[:2])
+        time = self.plant.scada.index.get_level_values("time")
+        asset_id = self.plant.scada.index.get_level_values("asset_id")
+        mask = (time >= "2014-03-01") & (time <= "2014-03-07")
+
+        assert_frame_equal(
+            self.plant.select(start="2014-03-01", end="2014-03-07"), self.plant.scada.loc[mask]
+        )
+        assert_frame_equal(
+            self.plant.select("2014-03-01", "2014-03-07", turbine_ids, columns=["WTUR_W"]),
+            self.plant.scada.loc[mask & asset_id.isin(turbine_ids), ["WTUR_W"]],
+        )
+        assert self.plant.time_range() == (time.min(), time.max())
+        assert self.plant.time_range("meter") == (
+            self.plant.meter.index.min(),
+            self.plant.meter.index.max(),
+        )
+
+        pytest.importorskip("pyarrow")
+        data_path = tempfile.mkdtemp()
+        self.plant.to_parquet(save_path=data_path, partition_by=["asset_id", "month"])
+        plant_loaded = PlantData.from_parquet(
+            data_path, start="2014-03-01", end="2014-03-07", asset_ids=turbine_ids
+        )
+        assert_frame_equal(
+            self.plant.select("2014-03-01", "2014-03-07", turbine_ids).sort_index(),
+            plant_loaded.scada.sort_index(),
+        )
+
+        # Timezone-naive bounds are taken in the time zone of timezone-aware data
+        plant = copy.deepcopy(self.plant)
+        plant.scada.index = plant.scada.index.set_levels(
+            plant.scada.index.levels[0].tz_localize("Etc/GMT-1"), level="time"
+        )
+        data_path = tempfile.mkdtemp()
+        plant.to_parquet(save_path=data_path, partition_by=["asset_id", "month"])
+        plant_loaded = PlantData.from_parquet(
+            data_path, start="2014-03-01", end="2014-03-07", asset_ids=turbine_ids
+        )
+        expected = plant.select("2014-03-01", "2014-03-07", turbine_ids).sort_index()
+        assert expected.index.get_level_values("time").min() == pd.Timestamp(
+            "2014-03-01", tz="Etc/GMT-1"
+        )
+        assert_frame_equal(expected, plant_loaded.scada.sort_index())
+
+    def test_freestream_turbine_mask(self):
+        """
+        Test that the freestream turbine mask for a set of wind directions matches a brute-force
+        check of every pair of turbines from the asset distance and direction matrices, and that the
+        mask is memoized.
+        """
+
+        def freestream(wd, method, sector_width):
+            direction = self.plant.asset_direction_matrix
+            distance = self.plant.asset_distance_matrix
+            rotor_diameter = self.plant.asset["rotor_diameter"]
+            expected = []
+            for turbine in turbine_ids:
+                waked = False
+                for upstream in turbine_ids:
+                    if upstream == turbine:
+                        continue
+                    angle = abs((wd - direction.loc[turbine, upstream] + 180) % 360 - 180)
+                    if method == "sector":
+                        waked |= angle <= 0.5 * sector_width
+                        continue
+                    d = distance.loc[turbine, upstream] / rotor_diameter[upstream]
+                    if 0 <= d <= 20:
+                        limit = 0.5 * (1.3 * np.degrees(np.arctan(2.5 / d + 0.15)) + 10)
+                        waked |= (d <= 2) | (angle <= limit)
+                expected.append(not waked)
+            return expected
+
+        wd = np.arange(0.0, 360.0, 5.0)
+        turbine_ids = np.asarray(self.plant.turbine_ids)
+        for method in ("sector", "IEC"):
+            mask = self.plant.get_freestream_turbine_mask(wd, method, sector_width=60.0)
+            assert mask.shape == (wd.size, turbine_ids.size)
+            for i, _wd in enumerate(wd):
+                assert list(mask[i]) == freestream(_wd, method, 60.0)
+            assert self.plant.get_freestream_turbine_mask(wd, method, sector_width=60.0) is mask
+
+        # Test one sector width per wind direction
+        sector_width = np.linspace(30.0, 120.0, wd.size)
+        mask = self.plant.get_freestream_turbine_mask(wd, sector_width=sector_width)
+        for i, (_wd, _width) in enumerate(zip(wd, sector_width)):
+            assert list(mask[i]) == freestream(_wd, "sector", _width)
+
 
 class TestPlantDatPartial(unittest.TestCase):
     """
@@ -40,6 +40,33 @@ class TestLongTermGrossEnergy(unittest.TestCase):
         check = 12.91634141
         npt.assert_almost_equal(res / 1e6, check, decimal=4)
 
+    def test_stage_cache(self):
+        # Both reanalysis products share the same thresholds, so the second iteration reuses the
+        # filtered and imputed SCADA data from the first
+        stats = self.analysis.stage_cache.stats
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 2)
+
+        # The spline basis is cached separately, and each reanalysis product has its own basis
+        stats = self.analysis.basis_cache.stats
+        self.assertGreaterEqual(stats["misses"], 2)
+        self.assertEqual(stats["entries"], stats["misses"])
+
+        # Disabling the cache does not change the results
+        reset_prng()
+        analysis = TurbineLongTermGrossEnergy(
+            self.project,
+            UQ=False,
+            max_power_filter=0.85,
+            wind_bin_threshold=1.0,
+            correction_threshold=0.9,
+            stage_cache_memory=0,
+        )
+        analysis.run(reanalysis_products=["era5", "merra2"])
+        self.assertEqual(analysis.stage_cache.stats["hits"], 0)
+        self.assertEqual(analysis.basis_cache.stats["hits"], 0)
+        npt.assert_array_equal(analysis.plant_gross, self.analysis.plant_gross)
+
     def tearDown(self):
         pass
 
@@ -77,5 +104,36 @@ class TestLongTermGrossEnergyUQ(unittest.TestCase):
         pass
 
 
+class TestLongTermGrossEnergySeed(unittest.TestCase):
+    def setUp(self):
+        # Set up data to use for testing (ENGIE data)
+        self.project = project_ENGIE.prepare(example_data_path_str, use_cleansed=False)
+        self.project.analysis_type.append("TurbineLongTermGrossEnergy")
+        self.project.validate()
+
+    def test_seed_reproducibility(self):
+        # Check that the seeded results don't depend on the global random state or on the number of
+        # workers, and that a different seed gives different results
+        kwargs = dict(UQ=True, num_sim=10, reanalysis_products=["era5", "merra2"])
+        np.random.seed(1)
+        analysis = TurbineLongTermGrossEnergy(self.project, seed=42, **kwargs)
+        analysis.run()
+        expected = analysis.plant_gross.copy()
+
+        np.random.seed(2)
+        analysis.run()
+        npt.assert_array_equal(expected, analysis.plant_gross)
+
+        analysis.run(n_workers=2)
+        npt.assert_array_equal(expected, analysis.plant_gross)
+
+        analysis = TurbineLongTermGrossEnergy(self.project, seed=43, **kwargs)
+        analysis.run()
+        assert not np.array_equal(expected, analysis.plant_gross)
+
+    def tearDown(self):
+        pass
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -96,6 +96,104 @@ class TestStaticYawMisalignment(unittest.TestCase):
         )
         self.check_simulation_results_yaw_misalignment_with_UQ_new_params()
 
+    def test_yaw_misalignment_batch_fit(self):
+        reset_prng()
+        # ____________________________________________________________________
+        # Test that fitting all of the cosine curves at once gives the same yaw misalignments as
+        # fitting each curve separately, without UQ.
+        results = []
+        for batch_fit in (False, True):
+            self.analysis = yaw_misalignment.StaticYawMisalignment(
+                plant=self.project, UQ=False, batch_fit=batch_fit
+            )
+            self.analysis.run(
+                ws_bins=[4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
+                min_vane_bin_count=50,
+                use_power_coeff=True,
+            )
+            results.append(self.analysis)
+
+        nptest.assert_allclose(
+            results[0].power_values_vane_ws, results[1].power_values_vane_ws, rtol=1e-10
+        )
+        nptest.assert_array_equal(results[0].mean_vane_angle_ws, results[1].mean_vane_angle_ws)
+        nptest.assert_allclose(
+            results[0].yaw_misalignment_ws, results[1].yaw_misalignment_ws, atol=1e-3
+        )
+
+    def test_yaw_misalignment_binned_bootstrap(self):
+        reset_prng()
+        # ____________________________________________________________________
+        # Test that the vane-binned statistics give the same results as binning the data for each
+        # curve fit without UQ, and that bootstrapping them matches resampling the data with UQ.
+        results = []
+        for kwargs in ({"batch_fit": True}, {"binned_bootstrap": True}):
+            self.analysis = yaw_misalignment.StaticYawMisalignment(
+                plant=self.project, UQ=False, **kwargs
+            )
+            self.analysis.run(
+                ws_bins=[4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
+                min_vane_bin_count=50,
+                use_power_coeff=True,
+            )
+            results.append(self.analysis)
+
+        nptest.assert_allclose(
+            results[0].power_values_vane_ws, results[1].power_values_vane_ws, rtol=1e-10
+        )
+        nptest.assert_allclose(
+            results[0].yaw_misalignment_ws, results[1].yaw_misalignment_ws, atol=1e-10
+        )
+
+        # With UQ, bootstrapping the vane-binned statistics gives the same spread as resampling the
+        # data for the same seed: the bin means and their variances across the iterations, and the
+        # standard deviations of the yaw misalignments, agree to within the sampling error.
+        results = []
+        for kwargs in ({"batch_fit": True}, {"binned_bootstrap": True}):
+            self.analysis = yaw_misalignment.StaticYawMisalignment(
+                plant=self.project, UQ=True, seed=42, **kwargs
+            )
+            self.analysis.run(num_sim=50, ws_bins=[5.0, 6.0, 7.0, 8.0], min_vane_bin_count=50)
+            results.append(self.analysis)
+
+        self.assertEqual(self.analysis.yaw_misalignment.shape, (50, 4))
+        self.assertTrue(np.isfinite(self.analysis.yaw_misalignment).all())
+
+        rows, binned = (r._power_values_bin_ws for r in results)
+        std = np.nanstd(rows, axis=0)
+        valid = std > 0
+        mean_diff = np.abs(np.nanmean(binned, axis=0) - np.nanmean(rows, axis=0))[valid]
+        self.assertLess(np.nanmedian(mean_diff / std[valid]), 0.3)
+        var_ratio = np.nanvar(binned, axis=0)[valid] / std[valid] ** 2
+        nptest.assert_allclose(np.nanmedian(var_ratio), 1.0, rtol=0.15)
+
+        std_ratio = results[1].yaw_misalignment_std_ws / results[0].yaw_misalignment_std_ws
+        self.assertTrue(0.75 < np.median(std_ratio) < 1.33)
+
+    def test_seed_reproducibility(self):
+        # Check that the seeded results don't depend on the global random state or on the number of
+        # workers, and that a different seed gives different results
+        run_kwargs = dict(num_sim=20, ws_bins=[5.0, 6.0, 7.0, 8.0], min_vane_bin_count=50)
+        np.random.seed(1)
+        self.analysis = yaw_misalignment.StaticYawMisalignment(
+            plant=self.project, turbine_ids=["R80721", "R80790"], UQ=True, seed=42
+        )
+        self.analysis.run(**run_kwargs)
+        expected = self.analysis.yaw_misalignment.copy()
+
+        np.random.seed(2)
+        self.analysis.run(**run_kwargs)
+        nptest.assert_array_equal(expected, self.analysis.yaw_misalignment)
+
+        self.analysis.run(n_workers=2, **run_kwargs)
+        nptest.assert_array_equal(expected, self.analysis.yaw_misalignment)
+
+        self.analysis = yaw_misalignment.StaticYawMisalignment(
+            plant=self.project, turbine_ids=["R80721", "R80790"], UQ=True, seed=43
+        )
+        self.analysis.run(**run_kwargs)
+        self.assertFalse(np.array_equal(expected, self.analysis.yaw_misalignment))
+
     def check_simulation_results_yaw_misalignment_without_UQ(self):
         # Make sure yaw misalignment results are consistent to six decimal places without UQ.
         # Average yaw misaligment values for each turbine
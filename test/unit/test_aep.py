@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.testing as npt
+from sklearn.metrics import r2_score, mean_squared_error
+from sklearn.linear_model import LinearRegression
+
+from openoa.analysis.aep import fit_bootstrap_ols
+
+
+def test_fit_bootstrap_ols():
+    # Fitting the bootstrap counts at once matches fitting LinearRegression to the resampled rows
+    rng = np.random.default_rng(0)
+    num_points = 40
+    X = np.column_stack([rng.uniform(4, 10, num_points), rng.uniform(1.1, 1.3, num_points)])
+    energy = 2 * X[:, 0] + 5 * X[:, 1] + rng.normal(0, 0.5, num_points)
+    losses = 0.1 * X[:, 0] + rng.normal(0, 0.05, num_points)
+
+    counts = np.vstack(
+        [
+            np.ones(num_points, dtype=int),
+            np.bincount(rng.integers(0, num_points, num_points), minlength=num_points),
+            np.bincount(rng.integers(0, 5, num_points), minlength=num_points),
+        ]
+    )
+    metered_energy_fraction = np.array([1.0, 0.99, 1.01])
+    loss_fraction = np.array([1.0, 1.02, 0.97])
+
+    intercept, slope, r2, mse = fit_bootstrap_ols(
+        X, energy, losses, counts, metered_energy_fraction, loss_fraction
+    )
+    for k in range(counts.shape[0]):
+        rows = np.repeat(np.arange(num_points), counts[k])
+        X_k = X[rows]
+        y_k = metered_energy_fraction[k] * energy[rows] + loss_fraction[k] * losses[rows]
+        reg = LinearRegression().fit(X_k, y_k)
+        predicted = reg.predict(X_k)
+
+        npt.assert_allclose(intercept[k], reg.intercept_, rtol=1e-8)
+        npt.assert_allclose(slope[k], reg.coef_, rtol=1e-8)
+        npt.assert_allclose(r2[k], r2_score(y_k, predicted), rtol=1e-8)
+        npt.assert_allclose(mse[k], mean_squared_error(y_k, predicted), rtol=1e-8)
@@ -191,6 +191,116 @@ class SimpleFilters(unittest.TestCase):
         expected = pd.Series([False, False, False, False, False, True, False])
         nptest.assert_array_equal(flag, expected)
 
+        # Test that outliers are flagged in bins following empty bins, with a median center
+        x_val = pd.Series(np.array([1, 1, 1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 10]))
+        x_bin = pd.Series(
+            np.array([0, 0.5, 0.8, 1, 5.1, 5.2, 5.3, 5.4, 5.5, 5.6, 5.7, 5.8, 5.9, 6])
+        )
+        flag = filters.bin_filter(x_bin, x_val, 1, center_type="median", threshold_type="mad")
+        nptest.assert_array_equal(flag, np.arange(14) >= 13)
+
+        flag = filters.bin_filter(x_bin, x_val, 1, center_type="mean", threshold_type="std")
+        nptest.assert_array_equal(flag, np.arange(14) >= 13)
+
+    def test_grouped_filters(self):
+        # Build two turbines with different capacities, and shuffle the rows to check the ordering
+        rng = np.random.default_rng(2)
+        time = pd.date_range("2020-01-01", periods=200, freq="10min")
+        index = pd.MultiIndex.from_product([time, ["T1", "T2"]], names=["time", "asset_id"])
+        capacity = pd.Series([1000.0, 2000.0], index=["T1", "T2"])
+        ws = pd.Series(rng.integers(0, 25, index.size) / 2, index=index, name="ws")
+        power = pd.Series(
+            np.clip(ws.values**3, 0, 1) * capacity.reindex(index.get_level_values(1)).values,
+            index=index,
+            name="power",
+        )
+        power.iloc[::17] *= 0.5
+        order = rng.permutation(index.size)
+        ws, power = ws.iloc[order], power.iloc[order]
+
+        flag_range = filters.grouped_range_flag(ws, 0, capacity / 100)
+        flag_frozen = filters.grouped_unresponsive_flag(ws, threshold=3)
+        flag_window = filters.grouped_window_range_flag(
+            ws, 5.0, 40, power, 0.02 * capacity, 1.2 * capacity
+        )
+        flag_bin = filters.grouped_bin_filter(
+            power,
+            ws,
+            bin_width=0.06 * capacity,
+            threshold={"T1": 2.0, "T2": 1.5},
+            center_type="median",
+            bin_min=0.01 * capacity,
+            bin_max=0.9 * capacity,
+            threshold_type="mad",
+        )
+        for flag in (flag_range, flag_frozen, flag_window, flag_bin):
+            self.assertTrue(flag.index.equals(ws.index))
+
+        # Each turbine's flags should match those of the single turbine filters
+        for t, threshold in (("T1", 2.0), ("T2", 1.5)):
+            ws_t = ws.xs(t, level="asset_id", drop_level=False).sort_index()
+            power_t = power.loc[ws_t.index]
+            cap = capacity[t]
+            nptest.assert_array_equal(
+                flag_range.loc[ws_t.index], filters.range_flag(ws_t, 0, cap / 100)
+            )
+            nptest.assert_array_equal(
+                flag_frozen.loc[ws_t.index], filters.unresponsive_flag(ws_t, threshold=3)
+            )
+            nptest.assert_array_equal(
+                flag_window.loc[ws_t.index],
+                filters.window_range_flag(ws_t, 5.0, 40, power_t, 0.02 * cap, 1.2 * cap),
+            )
+            expected = filters.bin_filter(
+                power_t,
+                ws_t,
+                bin_width=0.06 * cap,
+                threshold=threshold,
+                center_type="median",
+                bin_min=0.01 * cap,
+                bin_max=0.9 * cap,
+                threshold_type="mad",
+            )
+            nptest.assert_array_equal(flag_bin.loc[ws_t.index], expected)
+
+    def test_grouped_filters_float32(self):
+        # The flags of "float32" data match those of the same values as "float64" data
+        rng = np.random.default_rng(3)
+        index = pd.MultiIndex.from_product(
+            [pd.date_range("2020-01-01", periods=300, freq="10min"), ["T1", "T2"]],
+            names=["time", "asset_id"],
+        )
+        ws = pd.Series(rng.uniform(0, 20, index.size), index=index).astype(np.float32)
+        power = (np.clip(ws**3 / 1000, 0, 1) * 2000 + rng.normal(0, 50, index.size)).astype(
+            np.float32
+        )
+        flags = [
+            (
+                filters.grouped_range_flag(p, 0, 1900),
+                filters.grouped_unresponsive_flag(p.round(-2), threshold=3),
+                filters.grouped_window_range_flag(w, 5.0, 40, p, 20.0, 1900.0),
+                filters.grouped_bin_filter(p, w, 100.0, 2.0, "median", threshold_type="mad"),
+            )
+            for w, p in ((ws, power), (ws.astype(float), power.astype(float)))
+        ]
+        for flag_32, flag_64 in zip(*flags):
+            pd.testing.assert_series_equal(flag_32, flag_64)
+
+    def test_grouped_filters_errors(self):
+        index = pd.MultiIndex.from_product([[0, 1, 2], ["T1", "T2"]], names=["time", "asset_id"])
+        x = pd.Series(np.arange(6.0), index=index, name="data")
+
+        # Every group needs a parameter value
+        with self.assertRaises(ValueError):
+            filters.grouped_range_flag(x, {"T1": 0}, 4)
+
+        # The data must have a MultiIndex with the group level
+        with self.assertRaises(TypeError):
+            filters.grouped_range_flag(x.droplevel("asset_id"), 0, 4)
+
+        with self.assertRaises(TypeError):
+            filters.grouped_unresponsive_flag(x, threshold=3.5)
+
     def test_cluster_mahalanobis_2d(self):
         col1 = pd.Series(np.array([1.0, 1.01, 1.001, 2.0, 2.01, 2.001, 2.0001]))
         col2 = pd.Series(np.array([3.0, 3.02, 3.001, 4.0, 4.01, 4.001, 5.0001]))
@@ -198,6 +308,23 @@ class SimpleFilters(unittest.TestCase):
         expected = pd.Series(np.array([False, False, False, False, False, False, True]))
         nptest.assert_array_equal(flag, expected)
 
+        # Test the mini batch and sampled fits, which should be reproducible with a random state
+        rng = np.random.default_rng(1)
+        col1 = pd.Series(np.concatenate([rng.normal(0, 1, 300), rng.normal(20, 1, 300), [0, 20]]))
+        col2 = pd.Series(np.concatenate([rng.normal(0, 1, 300), rng.normal(20, 1, 300), [8, 12]]))
+        expected = np.arange(col1.size) >= 600
+        for kwargs in ({"minibatch": True, "batch_size": 64}, {"fit_sample_size": 200}):
+            flag = filters.cluster_mahalanobis_2d(
+                col1, col2, 2, 5.0, random_state=1, n_init=3, **kwargs
+            )
+            nptest.assert_array_equal(flag, expected)
+            nptest.assert_array_equal(
+                flag,
+                filters.cluster_mahalanobis_2d(
+                    col1, col2, 2, 5.0, random_state=1, n_init=3, **kwargs
+                ),
+            )
+
     def tearDown(self):
         pass
 
@@ -1,4 +1,5 @@
 import unittest
+import warnings
 from multiprocessing.sharedctypes import Value
 
 import numpy as np
@@ -260,6 +261,56 @@ class SimpleFilters(unittest.TestCase):
         y2 = imputing.asset_correlation_matrix(self.test9_df, "data")
         nptest.assert_array_equal(y2, np.array([[np.nan, np.nan], [np.nan, np.nan]]))
 
+    def test_asset_correlation_accumulator(self):
+        # Test 1, the correlation matches the correlation matrix of all of the data
+        y = imputing.AssetCorrelationAccumulator.from_data(self.test11_df, "data").corr()
+        y_test = imputing.asset_correlation_matrix(self.test11_df, "data")
+        nptest.assert_array_almost_equal(y, y_test)
+
+        # Test 2, updating the statistics with new time stamps, including a new asset, matches
+        # computing them from all of the data, and removing them returns to the original statistics
+        time = self.test11_df.index.get_level_values("time")
+        first = self.test11_df.loc[time < time[5]]
+        second = self.test11_df.loc[time >= time[5]]
+        first = first.loc[first.index.get_level_values("asset_id") != "c"]
+        accumulator = imputing.AssetCorrelationAccumulator.from_data(first, "data")
+        accumulator.update(second, "data")
+        nptest.assert_array_almost_equal(
+            accumulator.corr(),
+            imputing.asset_correlation_matrix(pd.concat([first, second]), "data"),
+        )
+        accumulator.remove(second, "data")
+        nptest.assert_array_almost_equal(
+            accumulator.corr().loc[["a", "b"], ["a", "b"]],
+            imputing.asset_correlation_matrix(first, "data"),
+        )
+
+        # Test 3, weighting the time stamps matches repeating them
+        times = self.test11_df.index.get_level_values("time").unique().sort_values()
+        weights = pd.Series(np.arange(times.size) % 3, index=times)
+        y = imputing.AssetCorrelationAccumulator.from_data(
+            self.test11_df, "data", weights=weights
+        ).corr()
+        repeated = self.test11_df["data"].unstack().loc[np.repeat(times, weights.values)]
+        y_test = repeated.corr(min_periods=2).to_numpy()
+        np.fill_diagonal(y_test, np.nan)
+        nptest.assert_array_almost_equal(y, y_test)
+
+        # Test 4, streaming the data where an asset's first block has no finite values matches
+        # computing the correlation matrix of all of the data
+        df = self.test11_df.copy()
+        time = df.index.get_level_values("time")
+        asset = df.index.get_level_values("asset_id")
+        df.loc[(time < time[5]) & (asset == "b"), "data"] = np.nan
+        accumulator = imputing.AssetCorrelationAccumulator()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            accumulator.update(df.loc[time < time[5]], "data")
+            accumulator.update(df.loc[time >= time[5]], "data")
+        y_test = imputing.asset_correlation_matrix(df, "data")
+        assert np.isfinite(y_test.loc["a", "b"])
+        nptest.assert_array_almost_equal(accumulator.corr(), y_test)
+
     def test_impute_data(self):
         # Test 1a, make sure single NaN is imputed using old style of inputs
         y = np.float64(2.989779)
@@ -380,6 +431,13 @@ class SimpleFilters(unittest.TestCase):
         ).to_frame()
         nptest.assert_array_almost_equal(y_test["imputed_data"], self.test12_df["data"], decimal=4)
 
+        # Test 4, the results are aligned with the input data, regardless of the row order
+        shuffled_df = self.test11_df.sample(frac=1, random_state=2)
+        y = imputing.impute_all_assets_by_correlation(self.test11_df, "data", "data")
+        y_test = imputing.impute_all_assets_by_correlation(shuffled_df, "data", "data")
+        self.assertTrue(y_test.index.equals(shuffled_df.index))
+        nptest.assert_array_almost_equal(y_test, y.loc[shuffled_df.index])
+
     def tearDown(self):
         pass
 
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import os
+import random
+
+import numpy as np
+import pytest
+import numpy.testing as npt
+from attrs import field, define
+
+from openoa.analysis._parallel import (
+    RandomSampler,
+    random_streams,
+    run_iterations,
+    iteration_seeds,
+    spawn_iteration_seeds,
+    iteration_random_state,
+)
+
+
+@define(auto_attribs=True)
+class IterationStub:
+    """A minimal Monte Carlo analysis whose iterations draw from both their sampler and the global
+    random state, and populate a row of a result array.
+    """
+
+    num_sim: int
+    values: np.ndarray = field(init=False)
+    last_iteration: int = field(init=False, default=-1)
+    pid: int = field(init=False, default=-1)
+
+    def __attrs_post_init__(self):
+        self.values = np.full((self.num_sim, 2), np.nan)
+
+    def run_iteration(self, n: int, sampler: RandomSampler) -> int:
+        self.values[n] = sampler.normal(0, 1, 1)[0], np.random.random()
+        self.last_iteration = n
+        self.pid = os.getpid()
+        return int(sampler.integers(0, 1_000_000, 1)[0])
+
+
+def test_run_iterations():
+    num_sim = 11
+    seeds = spawn_iteration_seeds(num_sim, np.random.SeedSequence(42))
+
+    serial = IterationStub(num_sim)
+    expected = run_iterations(serial, "run_iteration", seeds, 1, ("values",), progress_bar=False)
+    assert not np.isnan(serial.values).any()
+    assert serial.last_iteration == num_sim - 1
+
+    # The seeded results don't depend on the number of workers, and the rows of the result arrays
+    # populated in the workers are copied back
+    parallel = IterationStub(num_sim)
+    results = run_iterations(parallel, "run_iteration", seeds, 2, ("values",), progress_bar=False)
+    assert results == expected
+    npt.assert_array_equal(parallel.values, serial.values)
+
+    # The final iteration is rerun in the calling process
+    assert parallel.last_iteration == num_sim - 1
+    assert parallel.pid == os.getpid()
+
+    # Only the final iteration's row is populated when the result arrays are not copied back
+    parallel = IterationStub(num_sim)
+    results = run_iterations(parallel, "run_iteration", seeds, 2, progress_bar=False)
+    assert results == expected
+    assert np.isnan(parallel.values[:-1]).all()
+    npt.assert_array_equal(parallel.values[-1], serial.values[-1])
+
+    # The global random state is restored after the iterations
+    np.random.seed(1)
+    state = np.random.random()
+    np.random.seed(1)
+    run_iterations(IterationStub(num_sim), "run_iteration", seeds, 2, progress_bar=False)
+    assert np.random.random() == state
+
+    with pytest.raises(ValueError):
+        run_iterations(IterationStub(num_sim), "run_iteration", seeds, 0)
+
+
+def test_random_streams():
+    # Without a seed, the inputs are drawn from the global random states
+    sampler, seed = random_streams(None)
+    assert sampler.generator is None
+    assert seed is None
+
+    # An integer or SeedSequence gives the same streams every time
+    for value in (42, np.random.SeedSequence(42)):
+        samplers, seeds = zip(*(random_streams(value) for _ in range(2)))
+        npt.assert_array_equal(*(s.normal(0, 1, 5) for s in samplers))
+        assert seeds[0].generate_state(4).tolist() == seeds[1].generate_state(4).tolist()
+
+    # The input and iteration streams are independent, and differ between seeds
+    sampler, seed = random_streams(42)
+    other, _ = random_streams(43)
+    inputs = sampler.normal(0, 1, 5)
+    assert not np.array_equal(inputs, other.normal(0, 1, 5))
+    assert not np.array_equal(inputs, np.random.default_rng(seed).normal(0, 1, 5))
+
+    # A Generator is advanced by each call
+    generator = np.random.default_rng(42)
+    first, _ = random_streams(generator)
+    second, _ = random_streams(generator)
+    assert not np.array_equal(first.normal(0, 1, 5), second.normal(0, 1, 5))
+
+
+def test_iteration_seeds():
+    # Unseeded serial runs draw from the global random states
+    assert iteration_seeds(5, None) is None
+
+    # The iteration seeds are the same each time, and are independent of each other
+    _, seed = random_streams(42)
+    seeds = iteration_seeds(5, seed)
+    assert len(seeds) == 5
+    states = [s.generate_state(4).tolist() for s in seeds]
+    assert states == [s.generate_state(4).tolist() for s in iteration_seeds(5, seed)]
+    assert len({tuple(state) for state in states}) == 5
+
+    # The seeds of a shorter run are the first seeds of a longer run
+    assert states[:3] == [s.generate_state(4).tolist() for s in iteration_seeds(3, seed)]
+
+    # Unseeded runs split across workers draw their root seed from the global random state
+    np.random.seed(1)
+    first = [s.generate_state(4).tolist() for s in iteration_seeds(5, None, n_workers=2)]
+    np.random.seed(1)
+    assert first == [s.generate_state(4).tolist() for s in iteration_seeds(5, None, n_workers=2)]
+
+
+def test_iteration_random_state():
+    seed = spawn_iteration_seeds(1, np.random.SeedSequence(42))[0]
+
+    np.random.seed(1)
+    random.seed(1)
+    expected_numpy, expected_python = np.random.random(), random.random()
+
+    # The iteration draws are the same each time, regardless of the global random states, which
+    # are restored afterwards
+    draws = []
+    for global_seed in (1, 2):
+        np.random.seed(global_seed)
+        random.seed(global_seed)
+        with iteration_random_state(seed):
+            draws.append((np.random.random(), random.random()))
+        if global_seed == 1:
+            assert np.random.random() == expected_numpy
+            assert random.random() == expected_python
+    assert draws[0] == draws[1]
+
+    # The global random states are restored when the iteration raises
+    np.random.seed(1)
+    random.seed(1)
+    with pytest.raises(RuntimeError):
+        with iteration_random_state(seed):
+            np.random.random()
+            raise RuntimeError
+    assert np.random.random() == expected_numpy
+    assert random.random() == expected_python
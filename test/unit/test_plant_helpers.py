@@ -12,11 +12,18 @@ from attrs import field, define
 
 from openoa.plant import (  # , compose_error_message
     PlantData,
+    _checksum,
     load_to_pandas,
     rename_columns,
     convert_to_list,
     dtype_converter,
     column_validator,
+    _nearest_neighbor,
+    _select_positions,
+    _select_time_range,
+    _build_select_index,
+    _load_memory_mapped,
+    _save_memory_mapped,
     frequency_validator,
     load_to_pandas_dict,
 )
@@ -267,6 +274,129 @@ def test_rename_columns():
     assert new_df.columns.to_list() == list(col_map.keys())
 
 
+def test_memory_mapped(tmp_path):
+    """Tests saving and memory mapping a (time, asset_id)-indexed data frame, which is unsorted
+    and has columns of multiple data types.
+    """
+    rng = np.random.default_rng(1)
+    time = pd.date_range("2020-01-01", periods=50, freq="10min", tz="Europe/Paris")
+    index = pd.MultiIndex.from_product([time, ["T2", "T1", "T3"]], names=["time", "asset_id"])
+    df = pd.DataFrame(
+        {
+            "power": rng.random(index.size),
+            "flag": rng.random(index.size) > 0.5,
+            "count": rng.integers(0, 10, index.size),
+            "speed": rng.random(index.size).astype(np.float32),
+        },
+        index=index,
+    ).sample(frac=1.0, random_state=1)
+
+    path = tmp_path / "scada.npy"
+    _save_memory_mapped(df, path)
+    for mmap_mode in ("c", None):
+        loaded = _load_memory_mapped(path, mmap_mode=mmap_mode)
+        pd.testing.assert_frame_equal(df, loaded[df.columns])
+
+    # Copy-on-write modifications are not saved
+    loaded = _load_memory_mapped(path)
+    loaded.iloc[0, loaded.columns.get_loc("power")] = -1.0
+    assert _load_memory_mapped(path)["power"].iloc[0] == df["power"].iloc[0]
+
+    with pytest.raises(ValueError):
+        _save_memory_mapped(df.assign(name="a"), path)
+
+
+def test_checksum(tmp_path):
+    """Tests that the checksum of saved files and folders changes with their contents and names."""
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "a.bin").write_bytes(b"abc")
+    (tmp_path / "meta.yml").write_text("capacity: 1")
+    checksum = _checksum(tmp_path, ["meta.yml", "data"])
+    assert checksum == _checksum(tmp_path, ["meta.yml", "data"])
+
+    (tmp_path / "data" / "a.bin").write_bytes(b"abd")
+    assert _checksum(tmp_path, ["meta.yml", "data"]) != checksum
+
+    (tmp_path / "data" / "a.bin").write_bytes(b"abc")
+    (tmp_path / "data" / "a.bin").rename(tmp_path / "data" / "b.bin")
+    assert _checksum(tmp_path, ["meta.yml", "data"]) != checksum
+
+
+def test_select_positions():
+    """Tests selecting the rows of a time window and a subset of the assets against masking every
+    row, for sorted and unsorted, timezone-aware data.
+    """
+    time = pd.date_range("2020-01-01", periods=100, freq="10min", tz="UTC")
+    index = pd.MultiIndex.from_product([time, ["T1", "T2", "T3"]], names=["time", "asset_id"])
+    df = pd.DataFrame({"power": np.arange(index.size, dtype=float)}, index=index)
+
+    cases = [
+        (None, None, None),
+        ("2020-01-01 02:00", "2020-01-01 05:00", None),
+        ("2020-01-01 02:05", None, ["T3", "T1"]),
+        (None, "2020-01-01 01:00", "T2"),
+        ("2020-01-02", None, None),
+    ]
+    for data in (df, df.sample(frac=1.0, random_state=1)):
+        select_index = _build_select_index(data)
+        t = data.index.get_level_values("time")
+        asset_id = data.index.get_level_values("asset_id")
+        for start, end, asset_ids in cases:
+            mask = np.ones(len(data), dtype=bool)
+            if start is not None:
+                mask &= t >= pd.Timestamp(start, tz="UTC")
+            if end is not None:
+                mask &= t <= pd.Timestamp(end, tz="UTC")
+            if asset_ids is not None:
+                mask &= asset_id.isin(convert_to_list(asset_ids))
+            rows = _select_positions(select_index, start, end, asset_ids)
+            pd.testing.assert_frame_equal(data.iloc[rows], data.loc[mask])
+
+    # Time windows of time-sorted data are a slice of the rows
+    assert isinstance(_select_positions(_build_select_index(df), "2020-01-01 02:00"), slice)
+
+    with pytest.raises(KeyError):
+        _select_positions(_build_select_index(df), asset_ids=["T4"])
+    with pytest.raises(ValueError):
+        _select_positions(_build_select_index(df.droplevel("asset_id")), asset_ids=["T1"])
+
+
+def test_select_time_range():
+    """Tests the first and last timestamps of the select index against the minimum and maximum of
+    the timestamps, for sorted and unsorted, timezone-naive and timezone-aware data.
+    """
+    for tz in (None, "Etc/GMT-1"):
+        time = pd.date_range("2020-01-01", periods=100, freq="10min", tz=tz)
+        index = pd.MultiIndex.from_product([time, ["T1", "T2"]], names=["time", "asset_id"])
+        df = pd.DataFrame({"power": np.arange(index.size, dtype=float)}, index=index)
+        for data in (df, df.sample(frac=1.0, random_state=1), df.droplevel("asset_id")):
+            assert _select_time_range(_build_select_index(data)) == (time.min(), time.max())
+
+    assert _select_time_range(_build_select_index(df.iloc[:0])) == (pd.NaT, pd.NaT)
+
+
+def test_nearest_neighbor():
+    """Tests the KD-tree based `_nearest_neighbor` against a brute force search."""
+    rng = np.random.default_rng(2)
+    ids = np.array([f"T{i}" for i in range(50)])
+    coordinates = rng.uniform(0, 5000, (50, 2))
+
+    distance = np.linalg.norm(coordinates[:, None] - coordinates[None], axis=2)
+    np.fill_diagonal(distance, np.inf)
+
+    # Test the nearest neighbor among all assets, excluding the asset itself
+    nearest = _nearest_neighbor(ids, coordinates, ids, coordinates)
+    assert nearest.tolist() == ids[distance.argmin(axis=1)].tolist()
+
+    # Test the nearest neighbor among a subset of the assets
+    nearest = _nearest_neighbor(ids, coordinates, ids[:5], coordinates[:5])
+    assert nearest.tolist() == ids[:5][distance[:, :5].argmin(axis=1)].tolist()
+
+    # Test a single candidate, which is its own nearest neighbor, and no candidates
+    assert _nearest_neighbor(ids[:1], coordinates[:1], ids[:1], coordinates[:1]).tolist() == ["T0"]
+    assert np.isnan(_nearest_neighbor(ids, coordinates, ids[:0], coordinates[:0])).all()
+
+
 # Test the Metadata objects
 
 
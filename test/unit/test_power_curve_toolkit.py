@@ -5,6 +5,7 @@ import pandas as pd
 from numpy import testing as nptest
 
 from openoa.utils import power_curve
+from openoa.analysis._stage_cache import StageCache
 from openoa.utils.power_curve.parametric_forms import logistic5param, logistic5param_capped
 
 noise = 0.1
@@ -116,6 +117,82 @@ class TestPowerCurveFunctions(unittest.TestCase):
             self.y, y_pred, rtol=0.05, atol=20, err_msg="Power curve did not properly fit."
         )
 
+    def test_3paramgam_batch(self):
+        # Fit the test data and a scaled copy of it, which should match fitting each one separately
+        winddir = pd.Series(np.random.random(100), name="winddir")
+        airdens = pd.Series(np.random.random(100), name="airdens")
+        power = np.column_stack([self.y, 0.8 * self.y])
+        curves = power_curve.gam_3param_batch(
+            windspeed_col=self.x,
+            wind_direction_col=winddir,
+            air_density_col=airdens,
+            power=power,
+            n_splines=20,
+        )
+        y_pred = curves(self.x, winddir, airdens)
+        self.assertEqual(y_pred.shape, (100, 2))
+        for i in range(power.shape[1]):
+            curve = power_curve.gam_3param(
+                windspeed_col=self.x,
+                wind_direction_col=winddir,
+                air_density_col=airdens,
+                power_col=pd.Series(power[:, i], name="power"),
+                n_splines=20,
+            )
+            nptest.assert_allclose(y_pred[:, i], curve(self.x, winddir, airdens), atol=1e-8)
+
+    def test_3paramgam_batch_basis_cache(self):
+        # Fit a subset of the feature data with the spline basis of the full feature data cached
+        features = pd.DataFrame(
+            {
+                "windspeed": self.x,
+                "winddir": np.random.random(100),
+                "airdens": np.random.random(100),
+            }
+        )
+        data = features.iloc[:80].assign(power=self.y.iloc[:80])
+        cache = StageCache()
+        kwargs = dict(
+            windspeed_col="windspeed",
+            wind_direction_col="winddir",
+            air_density_col="airdens",
+            n_splines=20,
+            data=data,
+        )
+        curves = power_curve.gam_3param_batch(
+            power=data[["power"]],
+            basis_cache=cache,
+            basis_key="product",
+            basis_data=features,
+            **kwargs,
+        )
+        expected = power_curve.gam_3param_batch(power=data[["power"]], **kwargs)
+        nptest.assert_allclose(
+            curves("windspeed", "winddir", "airdens", data=features),
+            expected("windspeed", "winddir", "airdens", data=features),
+            atol=1e-8,
+        )
+        self.assertEqual(cache.stats["misses"], 1)
+
+        # The same training features reuse the cached basis, and a new set of edge knots does not
+        power_curve.gam_3param_batch(
+            power=0.8 * data[["power"]],
+            basis_cache=cache,
+            basis_key="product",
+            basis_data=features,
+            **kwargs,
+        )
+        self.assertEqual(cache.stats["hits"], 1)
+        kwargs["data"] = features.iloc[20:].assign(power=self.y.iloc[20:])
+        power_curve.gam_3param_batch(
+            power=kwargs["data"][["power"]],
+            basis_cache=cache,
+            basis_key="product",
+            basis_data=features,
+            **kwargs,
+        )
+        self.assertEqual(cache.stats["misses"], 2)
+
     def tearDown(self):
         pass
 
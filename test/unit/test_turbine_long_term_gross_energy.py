@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from openoa import PlantData
+from openoa.utils import imputing
+from openoa.utils import timeseries as ts
+from openoa.analysis import TurbineLongTermGrossEnergy
+
+TURBINE_IDS = ["T1", "T2", "T3"]
+
+
+@pytest.fixture(scope="module")
+def plant() -> PlantData:
+    """A small synthetic plant with three months of SCADA data, with missing power data, and
+    fifteen months of reanalysis data.
+    """
+    rng = np.random.default_rng(2)
+
+    time_h = pd.date_range("2019-01-01", "2020-03-31 23:00", freq="h")
+    ws_h = np.clip(
+        7 + 3 * np.sin(np.arange(time_h.size) / 37) + rng.normal(0, 1, time_h.size), 0.5, None
+    )
+    wd_h = (2.3 * np.arange(time_h.size)) % 360
+    reanalysis = pd.DataFrame(
+        {
+            "time": time_h,
+            "WMETR_HorWdSpd": ws_h,
+            "WMETR_HorWdDir": wd_h,
+            "WMETR_HorWdSpdU": -ws_h * np.sin(np.deg2rad(wd_h)),
+            "WMETR_HorWdSpdV": -ws_h * np.cos(np.deg2rad(wd_h)),
+            "WMETR_AirDen": 1.2 + rng.normal(0, 0.01, time_h.size),
+        }
+    )
+
+    time = pd.date_range("2020-01-01", "2020-03-31 23:50", freq="10min")
+    ws = np.interp(time.asi8, time_h.asi8, ws_h)
+    scada = []
+    for turbine_id in TURBINE_IDS:
+        windspeed = ws * (1 + rng.normal(0, 0.05, time.size))
+        power = 2000 * np.clip((windspeed - 3) / 9.5, 0, 1) ** 2.5 + rng.normal(0, 10, time.size)
+        power[rng.random(time.size) < 0.05] = np.nan
+        scada.append(
+            pd.DataFrame(
+                {"time": time, "asset_id": turbine_id, "WTUR_W": power, "WMET_HorWdSpd": windspeed}
+            )
+        )
+    scada = pd.concat(scada, ignore_index=True).sort_values(["time", "asset_id"])
+
+    asset = pd.DataFrame(
+        {
+            "asset_id": TURBINE_IDS,
+            "latitude": 48.45,
+            "longitude": 5.59,
+            "type": "turbine",
+            "rated_power": 2000.0,
+        }
+    )
+    metadata = dict(
+        latitude=48.45,
+        longitude=5.59,
+        capacity=6.0,
+        scada=dict(
+            frequency="10min",
+            asset_id="asset_id",
+            time="time",
+            WTUR_W="WTUR_W",
+            WMET_HorWdSpd="WMET_HorWdSpd",
+        ),
+        asset={col: col for col in asset.columns.drop("type")},
+        reanalysis=dict(era5={col: col for col in reanalysis.columns} | dict(frequency="h")),
+    )
+    return PlantData(
+        metadata=metadata,
+        scada=scada,
+        asset=asset,
+        reanalysis={"era5": reanalysis},
+        analysis_type="TurbineLongTermGrossEnergy",
+    )
+
+
+def groupby_daily_scada(analysis: TurbineLongTermGrossEnergy) -> pd.DataFrame:
+    """The gap filled daily SCADA data of each turbine, gathered one turbine at a time with
+    ``groupby``.
+    """
+    expected_count = 24 * 60 / (ts.offset_to_seconds(analysis.plant.metadata.scada.frequency) / 60)
+    num_thres = analysis._run.correction_threshold * expected_count
+
+    scada_valid = []
+    for t in analysis.turbine_ids:
+        scada = analysis.scada_dict[t]
+        grouped = scada.loc[~scada["flag_final"]].groupby(pd.Grouper(freq="D", level="time"))
+        scada_daily = grouped["WTUR_SupWh"].sum().to_frame()
+        scada_daily["data_count"] = grouped["WTUR_SupWh"].count()
+        scada_daily["percent_nan"] = grouped["WTUR_SupWh"].apply(ts.percent_nan)
+        scada_daily["energy_corrected"] = (
+            scada_daily["WTUR_SupWh"] * expected_count / scada_daily["data_count"]
+        )
+        scada_daily = scada_daily.loc[scada_daily["data_count"] >= num_thres]
+
+        temp_df = pd.DataFrame(
+            index=pd.date_range(analysis.por_start, analysis.por_end, freq="D", name="time")
+        )
+        temp_df["energy_corrected"] = scada_daily["energy_corrected"]
+        temp_df["percent_nan"] = scada_daily["percent_nan"]
+        temp_df["asset_id"] = t
+        temp_df["day"] = temp_df.index
+        scada_valid.append(temp_df)
+    return pd.concat(scada_valid).set_index("asset_id", append=True)
+
+
+@pytest.mark.parametrize("por_start_offset", ["0h", "12h"])
+def test_filter_sum_impute_scada(plant, monkeypatch, por_start_offset):
+    # Gathering the daily sums of all turbines at once matches gathering each turbine's sums with
+    # groupby, including when the period of record doesn't start at midnight
+    analysis = TurbineLongTermGrossEnergy(
+        plant, UQ=False, wind_bin_threshold=2.0, max_power_filter=0.9, correction_threshold=0.9
+    )
+    analysis.run()
+    analysis.por_start += pd.Timedelta(por_start_offset)
+
+    # Flag some of the data and drop some of the energy data, so that some days fall below the
+    # correction threshold and others are corrected for the missing data
+    rng = np.random.default_rng(0)
+    for t in analysis.turbine_ids:
+        scada = analysis.scada_dict[t]
+        scada["flag_final"] |= rng.random(scada.shape[0]) < 0.05
+        scada.loc[rng.random(scada.shape[0]) < 0.05, "WTUR_SupWh"] = np.nan
+    expected = groupby_daily_scada(analysis)
+    assert expected["energy_corrected"].isna().any()
+
+    # Only the days of the period of record at midnight have daily sums
+    midnight = expected["day"] == expected["day"].dt.floor("D")
+    assert midnight.all() == (por_start_offset == "0h")
+    assert expected.loc[~midnight, "energy_corrected"].isna().all()
+    assert expected.loc[midnight, "energy_corrected"].notna().any() or not midnight.any()
+
+    # Keep every day, so the daily sums can be compared before the imputation drops any of them
+    monkeypatch.setattr(
+        imputing,
+        "impute_all_assets_by_correlation",
+        lambda data, **kwargs: pd.Series(0.0, index=data.index),
+    )
+    analysis.stage_cache.clear()
+    analysis.filter_sum_impute_scada()
+
+    scada_valid = analysis.scada_valid
+    pd.testing.assert_index_equal(scada_valid.index, expected.index)
+    pd.testing.assert_frame_equal(
+        scada_valid[["energy_corrected", "percent_nan", "day"]],
+        expected[["energy_corrected", "percent_nan", "day"]],
+        check_freq=False,
+        rtol=1e-10,
+    )
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import numpy.testing as npt
+from attrs import define
+
+from openoa import PlantData
+from openoa.analysis import WakeLosses
+from openoa.analysis._parallel import RandomSampler
+from openoa.analysis.wake_losses import (
+    _reduce_freestream,
+    _weighted_bin_sums,
+    _weighted_hourly_mean,
+    _wind_direction_sector_index,
+)
+
+TURBINE_IDS = ["T1", "T2", "T3", "T4"]
+
+
+@pytest.fixture(scope="module")
+def plant() -> PlantData:
+    """A small synthetic plant with three months of SCADA data and two years of reanalysis data."""
+    rng = np.random.default_rng(1)
+
+    time_h = pd.date_range("2018-01-01", "2020-01-31 23:00", freq="h")
+    ws_h = np.clip(
+        7 + 3 * np.sin(np.arange(time_h.size) / 37) + rng.normal(0, 1, time_h.size), 0.5, None
+    )
+    wd_h = (2.3 * np.arange(time_h.size) + rng.normal(0, 10, time_h.size)) % 360
+    reanalysis = pd.DataFrame({"time": time_h, "WMETR_HorWdSpd": ws_h, "WMETR_HorWdDir": wd_h})
+
+    time = pd.date_range("2019-11-01", "2020-01-31 23:50", freq="10min")
+    ws = np.interp(time.asi8, time_h.asi8, ws_h)
+    wd = np.interp(time.asi8, time_h.asi8, wd_h)
+    scada = []
+    for turbine_id in TURBINE_IDS:
+        windspeed = ws * (1 + rng.normal(0, 0.05, time.size))
+        power = 2000 * np.clip((windspeed - 3) / 9.5, 0, 1) ** 2.5 + rng.normal(0, 10, time.size)
+        scada.append(
+            pd.DataFrame(
+                {
+                    "time": time,
+                    "asset_id": turbine_id,
+                    "WTUR_W": power,
+                    "WMET_HorWdSpd": windspeed,
+                    "WMET_HorWdDir": (wd + rng.normal(0, 3, time.size)) % 360,
+                }
+            )
+        )
+    scada = pd.concat(scada, ignore_index=True).sort_values(["time", "asset_id"])
+
+    asset = pd.DataFrame(
+        {
+            "asset_id": TURBINE_IDS,
+            "latitude": [48.4561, 48.4499, 48.4464, 48.4536],
+            "longitude": [5.5868, 5.5928, 5.5881, 5.5921],
+            "type": "turbine",
+            "rated_power": 2000.0,
+            "rotor_diameter": 82.0,
+            "hub_height": 80.0,
+        }
+    )
+    metadata = dict(
+        latitude=48.45,
+        longitude=5.59,
+        capacity=8.0,
+        scada=dict(
+            frequency="10min",
+            asset_id="asset_id",
+            time="time",
+            WTUR_W="WTUR_W",
+            WMET_HorWdSpd="WMET_HorWdSpd",
+            WMET_HorWdDir="WMET_HorWdDir",
+        ),
+        asset={col: col for col in asset.columns.drop("type")},
+        reanalysis=dict(
+            era5=dict(
+                frequency="h",
+                time="time",
+                WMETR_HorWdSpd="WMETR_HorWdSpd",
+                WMETR_HorWdDir="WMETR_HorWdDir",
+            )
+        ),
+    )
+    return PlantData(
+        metadata=metadata,
+        scada=scada,
+        asset=asset,
+        reanalysis={"era5": reanalysis},
+        analysis_type="WakeLosses-scada",
+    )
+
+
+@define(auto_attribs=True)
+class ResampledRowsSampler(RandomSampler):
+    """Draws from :py:attr:`generator`, except for the bootstrap sample, as the data have already
+    been resampled.
+    """
+
+    def bootstrap(self, n: int) -> np.ndarray:
+        return np.arange(n)
+
+
+RESULTS = (
+    "wake_losses_por",
+    "turbine_wake_losses_por",
+    "wake_losses_por_wd",
+    "turbine_wake_losses_por_wd",
+    "energy_por_wd",
+    "wake_losses_lt",
+    "turbine_wake_losses_lt",
+    "wake_losses_lt_wd",
+    "turbine_wake_losses_lt_wd",
+    "energy_lt_wd",
+    "wake_losses_por_ws",
+    "turbine_wake_losses_por_ws",
+    "energy_por_ws",
+    "wake_losses_lt_ws",
+    "turbine_wake_losses_lt_ws",
+    "energy_lt_ws",
+)
+
+
+def test_bootstrap_weights(plant, monkeypatch):
+    # Bootstrapping each iteration by weighting the unique rows matches evaluating the rows that
+    # are resampled with DataFrame.sample
+    analysis = WakeLosses(plant, num_sim=1, num_years_LT=(1, 2), seed=0)
+    analysis.run()
+    aggregate_df = analysis.aggregate_df
+
+    analysis._run_iteration(0, RandomSampler(np.random.default_rng(3)))
+    expected = {name: getattr(analysis, name)[0].copy() for name in RESULTS}
+    derate_flag = aggregate_df["derate_flag"][analysis.turbine_ids].to_numpy()
+    abnormal_ws_flag = aggregate_df["abnormal_ws_flag"][analysis.turbine_ids].to_numpy()
+
+    generator = np.random.default_rng(3)
+    resampled = aggregate_df.sample(frac=1.0, replace=True, random_state=generator)
+    sample = aggregate_df.index.get_indexer(resampled.index)
+    assert np.unique(sample).size < sample.size
+
+    # The derating flags are identified from all of the data, before it is resampled
+    def identify_derating(self):
+        for i, t in enumerate(self.turbine_ids):
+            self.aggregate_df[("derate_flag", t)] = derate_flag[sample, i]
+            self.aggregate_df[("abnormal_ws_flag", t)] = abnormal_ws_flag[sample, i]
+
+    monkeypatch.setattr(WakeLosses, "_identify_derating", identify_derating)
+    analysis.aggregate_df = resampled.copy()
+    analysis._run_iteration(0, ResampledRowsSampler(generator))
+    for name in RESULTS:
+        npt.assert_allclose(getattr(analysis, name)[0], expected[name], rtol=1e-10, err_msg=name)
+
+
+def test_seed_reproducibility(plant):
+    # The seeded results don't depend on the global random state or on the number of workers, and
+    # a different seed gives different results
+    np.random.seed(1)
+    analysis = WakeLosses(plant, num_sim=4, num_years_LT=(1, 2), seed=42)
+    analysis.run()
+    expected = {name: getattr(analysis, name).copy() for name in RESULTS}
+
+    np.random.seed(2)
+    analysis.run()
+    for name in RESULTS:
+        npt.assert_array_equal(getattr(analysis, name), expected[name], err_msg=name)
+
+    analysis.run(n_workers=2)
+    for name in RESULTS:
+        npt.assert_array_equal(getattr(analysis, name), expected[name], err_msg=name)
+
+    analysis = WakeLosses(plant, num_sim=4, num_years_LT=(1, 2), seed=43)
+    analysis.run()
+    assert not np.array_equal(analysis.wake_losses_por, expected["wake_losses_por"])
+
+
+def test_no_valid_freestream_periods(plant, monkeypatch):
+    # When no period has a normally operating freestream turbine, the period of record wake losses
+    # are NaN, including when correcting for wind speed heterogeneity
+    speedup_factor_map = pd.DataFrame(
+        {"wd": np.arange(0.0, 360.0, 10.0), **{t: 1.0 for t in TURBINE_IDS}}
+    )
+    analysis = WakeLosses(
+        plant,
+        UQ=False,
+        correct_for_ws_heterogeneity=True,
+        ws_speedup_factor_map=speedup_factor_map,
+    )
+    analysis.run()
+
+    def identify_derating(self):
+        for t in self.turbine_ids:
+            self.aggregate_df[("abnormal_ws_flag", t)] = True
+
+    monkeypatch.setattr(WakeLosses, "_identify_derating", identify_derating)
+    with np.errstate(invalid="ignore"):
+        results = analysis._run_iteration(0, RandomSampler(np.random.default_rng(0)))
+    assert analysis._por_rows.size == 0
+    for result in results[:4]:
+        assert np.isnan(result).all()
+
+
+def test_reduce_freestream():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(50, 4))
+    values[rng.random(values.shape) < 0.3] = np.nan
+    values[0] = np.nan
+    df = pd.DataFrame(values)
+    for method in ("mean", "median", "max"):
+        npt.assert_array_equal(_reduce_freestream(values, method), getattr(df, method)(axis=1))
+    assert _reduce_freestream(np.empty((0, 4)), "mean").shape == (0,)
+
+
+def test_wind_direction_sector_index():
+    def sector_flags(wind_direction, sector_wds, wd_bin_width):
+        """The per-sector flags of the periods in each freestream wind direction sector."""
+        flags = []
+        for i_wd, wd in enumerate(sector_wds):
+            if wd == 0.0:
+                flag = wind_direction >= 360.0 - 0.5 * wd_bin_width
+                flag |= wind_direction < (sector_wds[i_wd + 1] - 0.5 * wd_bin_width)
+            elif i_wd < len(sector_wds) - 1:
+                flag = wind_direction >= (wd - 0.5 * wd_bin_width)
+                flag &= wind_direction < (sector_wds[i_wd + 1] - 0.5 * wd_bin_width)
+            elif sector_wds[0] == 0.0:
+                flag = wind_direction >= (wd - 0.5 * wd_bin_width)
+                flag &= wind_direction < (360.0 - 0.5 * wd_bin_width)
+            else:
+                flag = wind_direction >= (wd - 0.5 * wd_bin_width)
+                flag |= wind_direction < (sector_wds[0] - 0.5 * wd_bin_width)
+            flags.append(flag)
+        return np.column_stack(flags)
+
+    rng = np.random.default_rng(0)
+    wind_direction = np.r_[rng.uniform(0, 360, 1000), 0.0, 2.5, 357.5, 359.9, 42.5, 87.5]
+    for sector_wds in ([0.0, 45.0, 90.0, 200.0], [45.0, 90.0, 200.0, 300.0], [0.0, 180.0]):
+        flags = sector_flags(wind_direction, sector_wds, 5.0)
+        assert (flags.sum(axis=1) == 1).all()
+        npt.assert_array_equal(
+            _wind_direction_sector_index(wind_direction, sector_wds, 5.0), flags.argmax(axis=1)
+        )
+
+
+def test_weighted_bin_sums():
+    # Weighting the rows matches summing the repeated rows of each bin
+    rng = np.random.default_rng(0)
+    bins = rng.integers(0, 8, 100)
+    weights = rng.integers(1, 4, 100)
+    values = rng.normal(size=(100, 3))
+    values[rng.random(values.shape) < 0.2] = np.nan
+    repeated = pd.DataFrame(np.repeat(values, weights, axis=0))
+    expected = repeated.groupby(np.repeat(bins, weights)).sum().reindex(range(10))
+    npt.assert_allclose(
+        _weighted_bin_sums(bins, weights.astype(float), values, 10), expected, rtol=1e-12
+    )
+    assert np.isnan(_weighted_bin_sums(bins[:0], weights[:0], values[:0], 10)).all()
+
+
+def test_weighted_hourly_mean():
+    # Weighting the rows matches the hourly mean of the repeated rows
+    rng = np.random.default_rng(0)
+    time = pd.date_range("2020-01-01", periods=200, freq="10min")[rng.permutation(200)]
+    weights = rng.integers(1, 4, 200)
+    values = rng.normal(size=(200, 3))
+    values[rng.random(values.shape) < 0.2] = np.nan
+    values[time < "2020-01-01 01:00", 0] = np.nan
+    repeated = pd.DataFrame(np.repeat(values, weights, axis=0), index=time.repeat(weights))
+    expected = repeated.resample("h").mean()
+    npt.assert_allclose(
+        _weighted_hourly_mean(time.floor("h"), weights.astype(float), values), expected, rtol=1e-12
+    )
+    assert _weighted_hourly_mean(time[:0], weights[:0], values[:0]).shape == (0, 3)
@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+from numpy import testing as nptest
+from scipy.optimize import curve_fit
+
+from openoa.analysis import yaw_misalignment
+
+
+class TestFitCosCurves(unittest.TestCase):
+    def test_fit_cos_curves(self):
+        # Check that the batched fits match fitting each cosine curve separately
+        rng = np.random.default_rng(42)
+        x = np.arange(-25.0, 26.0)
+        params = np.column_stack(
+            [rng.uniform(500, 2000, 20), rng.uniform(-8, 8, 20), rng.uniform(1, 4, 20)]
+        )
+        y = yaw_misalignment.cos_curve(x, *params.T[:, :, None])
+        y = y * rng.normal(1, 0.02, y.shape)
+        y[rng.random(y.shape) < 0.3] = np.nan
+        y[0, 3:] = np.nan
+
+        fits = yaw_misalignment.fit_cos_curves(x, y.reshape(4, 5, -1))
+        self.assertEqual(fits.shape, (4, 5, 3))
+        fits = fits.reshape(-1, 3)
+        self.assertTrue(np.isnan(fits[0]).all())
+        for i in range(1, 20):
+            valid = ~np.isnan(y[i])
+            expected, _ = curve_fit(
+                yaw_misalignment.cos_curve,
+                x[valid],
+                y[i, valid],
+                [y[i, valid].max(), 0.0, 2.0],
+            )
+            nptest.assert_allclose(fits[i], expected, rtol=1e-5, atol=1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()